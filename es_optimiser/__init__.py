@@ -1,2 +1,29 @@
-# Initialize the es_optimiser package
-__all__ = ["objective_functions", "evolution_strategy", "utils"]
\ No newline at end of file
+# Initialize the es_optimiser package.
+# Submodules are not imported here, so `import es_optimiser` (and the
+# `python -m es_optimiser` command line) stays cheap; import what you use,
+# e.g. `from es_optimiser.evolution_strategy import EvolutionStrategy`.
+__all__ = [
+    "async_driver",
+    "batched",
+    "bench",
+    "cache",
+    "checkpoint",
+    "cli",
+    "cma",
+    "evaluators",
+    "evolution_strategy",
+    "experiments",
+    "islands",
+    "large_scale",
+    "niching",
+    "objective_functions",
+    "plot",
+    "profiling",
+    "render",
+    "restarts",
+    "step_size",
+    "stopping",
+    "store",
+    "surrogate",
+    "telemetry",
+]
@@ -0,0 +1,6 @@
+# es_optimiser/__main__.py
+import sys
+
+from .cli import main
+
+sys.exit(main())
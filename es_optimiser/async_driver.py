@@ -0,0 +1,123 @@
+# es_optimiser/async_driver.py
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .evolution_strategy import EvolutionStrategy
+
+# Objective evaluated by awaiting: genotype (d,) in, fitness out
+AsyncObjective = Callable[[np.ndarray], Awaitable[float]]
+
+
+class AsyncEvaluator:
+    """
+    Evaluates genotypes concurrently with an awaitable objective.
+
+    Intended for slow, I/O-bound evaluations (external solver subprocesses,
+    remote services): up to `max_concurrency` evaluations are in flight at
+    once. Each evaluation can be given a timeout and retried; an evaluation
+    that still fails is assigned `failure_fitness`, so a single bad
+    candidate never stalls or aborts the optimization.
+
+    Attributes:
+        objective (AsyncObjective): Coroutine function `await objective(genotype) -> fitness`.
+        max_concurrency (int): Maximum number of evaluations in flight.
+        timeout (Optional[float]): Seconds allowed per attempt; None means no limit.
+        retries (int): Extra attempts after a failed or timed-out attempt.
+        retry_delay (float): Seconds to wait before each retry.
+        failure_fitness (float): Fitness assigned when all attempts fail.
+        timeouts (int): Attempts that timed out.
+        errors (int): Attempts that raised an exception.
+        failures (int): Evaluations that failed on every attempt.
+    """
+    def __init__(self, objective: AsyncObjective, max_concurrency: int = 64, timeout: Optional[float] = None,
+                 retries: int = 0, retry_delay: float = 0.0, failure_fitness: float = np.inf):
+        """
+        Initializes the evaluator.
+
+        Args:
+            objective: Coroutine function mapping a (d,) genotype to its fitness.
+            max_concurrency: Maximum evaluations in flight. Defaults to 64.
+            timeout: Per-attempt timeout in seconds. Defaults to None (no limit).
+            retries: Retries after a failed attempt. Defaults to 0.
+            retry_delay: Delay before each retry in seconds. Defaults to 0.0.
+            failure_fitness: Fitness of candidates whose evaluation failed.
+                             Defaults to np.inf (never selected).
+
+        Raises:
+            ValueError: If max_concurrency < 1 or retries < 0.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1.")
+        if retries < 0:
+            raise ValueError("retries must be >= 0.")
+        self.objective = objective
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failure_fitness = failure_fitness
+        self.timeouts = 0
+        self.errors = 0
+        self.failures = 0
+
+    async def _evaluate_one(self, genotype: np.ndarray, semaphore: asyncio.Semaphore) -> float:
+        """Evaluates one genotype with timeout and retries, under the concurrency limit."""
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                if attempt > 0 and self.retry_delay > 0:
+                    await asyncio.sleep(self.retry_delay)
+                try:
+                    if self.timeout is None:
+                        return float(await self.objective(genotype))
+                    return float(await asyncio.wait_for(self.objective(genotype), self.timeout))
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    logging.warning(f"Evaluation timed out after {self.timeout} s (attempt {attempt + 1}).")
+                except Exception as error:
+                    self.errors += 1
+                    logging.warning(f"Evaluation failed (attempt {attempt + 1}): {error!r}")
+            self.failures += 1
+            return self.failure_fitness
+
+    async def evaluate(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of genotypes concurrently.
+
+        Args:
+            genotypes (np.ndarray): An (n, d) array of candidate solutions.
+
+        Returns:
+            np.ndarray: (n,) fitness values in row order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        fitness = await asyncio.gather(*(self._evaluate_one(genotype, semaphore) for genotype in genotypes))
+        return np.array(fitness, dtype=np.float64)
+
+
+async def run_async(es: 'EvolutionStrategy', evaluator: AsyncEvaluator) -> 'EvolutionStrategy':
+    """
+    Runs an `EvolutionStrategy` to completion through its ask/tell interface.
+
+    Every batch returned by `es.ask()` (the initial population, then each
+    generation's offspring) is evaluated concurrently by `evaluator` and told
+    back, until one of the strategy's stopping criteria holds.
+
+    Args:
+        es (EvolutionStrategy): A strategy that has not started yet.
+        evaluator (AsyncEvaluator): Concurrent evaluator for the batches.
+
+    Returns:
+        EvolutionStrategy: The finished strategy.
+    """
+    es.stop_reason = None
+    while es.stop_reason is None:
+        genotypes = es.ask()
+        es.tell(await evaluator.evaluate(genotypes))
+    if es.history_sink is not None:
+        es.history_sink.flush()
+    es._print_summary()
+    return es
@@ -0,0 +1,194 @@
+# es_optimiser/batched.py
+import numpy as np
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .evolution_strategy import Individual, select_best_indices
+from .objective_functions import BatchObjective, get_batch_objective
+
+
+class BatchedEvolutionStrategy:
+    """
+    Advances K independent Evolution Strategy instances together.
+
+    Intended for many seeds (or replicates) of small problems, where separate
+    `EvolutionStrategy` objects would spend most of their time in interpreter
+    overhead. All instances share one configuration and are stored as tensors:
+    a (K, mu, d) parent tensor and a (K, lambda_, d) offspring tensor. Mutation,
+    clipping, evaluation and (μ, λ)/(μ + λ) selection are vectorized across
+    instances; only the random draws are made per instance, from each
+    instance's own generator, in the same order as `EvolutionStrategy`.
+    Instance k therefore reproduces a single-instance run with seed `seeds[k]`.
+
+    Attributes:
+        objective_function (Callable[[np.ndarray], float]): The function to minimize.
+        batch_objective_function (BatchObjective): Batched version of the objective.
+        dimensions (int): The number of variables in the solution vector.
+        bounds (Tuple[float, float]): Lower and upper bounds for each variable.
+        mu (int): The number of parents per instance.
+        lambda_ (int): The number of offspring per instance and generation.
+        max_generations (int): The stopping criterion based on generations.
+        sigma (float): The standard deviation (mutation strength) for Gaussian mutation.
+        selection_type (str): '(mu, lambda)' or '(mu + lambda)'.
+        n_instances (int): Number of independent instances K.
+        rngs (List[np.random.Generator]): One random number generator per instance.
+
+        parent_genotypes (np.ndarray): (K, mu, d) parents, each instance sorted best first.
+        parent_fitness (np.ndarray): (K, mu) parent fitness values.
+        best_genotypes (np.ndarray): (K, d) best genotype found by each instance.
+        best_fitness (np.ndarray): (K,) best fitness found by each instance.
+        history (List[np.ndarray]): Per generation, the (K,) best-so-far fitness values.
+    """
+    def __init__(
+        self,
+        objective_function: Callable[[np.ndarray], float],
+        dimensions: int,
+        bounds: Tuple[float, float],
+        mu: int,
+        lambda_: int,
+        seeds: Sequence[Optional[Union[int, np.random.SeedSequence]]],
+        max_generations: int = 100,
+        sigma: float = 0.1,
+        selection_type: str = '(mu, lambda)',
+        batch_objective_function: Optional[BatchObjective] = None
+    ):
+        """
+        Initializes the batched Evolution Strategy configuration.
+
+        Args:
+            objective_function: The target function to minimize.
+            dimensions: Dimensionality of the search space.
+            bounds: Tuple (min_val, max_val) applied to all dimensions.
+            mu: Number of parent individuals per instance.
+            lambda_: Number of offspring per instance (must be >= mu for comma selection).
+            seeds: One seed per instance; the number of seeds sets K.
+            max_generations: Maximum number of iterations. Defaults to 100.
+            sigma: Mutation strength (standard deviation). Defaults to 0.1.
+            selection_type: '(mu, lambda)' or '(mu + lambda)'. Defaults to '(mu, lambda)'.
+            batch_objective_function: Optional batched version of `objective_function`.
+
+        Raises:
+            ValueError: If no seeds are given.
+            ValueError: If lambda_ < mu for '(mu, lambda)' selection.
+            ValueError: If selection_type is not recognized.
+        """
+        if len(seeds) == 0:
+            raise ValueError("At least one seed (instance) is required.")
+        if selection_type not in ['(mu, lambda)', '(mu + lambda)']:
+            raise ValueError(f"Unknown selection_type: {selection_type}. Use '(mu, lambda)' or '(mu + lambda)'.")
+        if selection_type == '(mu, lambda)' and lambda_ < mu:
+            raise ValueError("For '(mu, lambda)' selection, lambda_ must be >= mu.")
+
+        self.objective_function = objective_function
+        if batch_objective_function is None:
+            batch_objective_function = get_batch_objective(objective_function)
+        self.batch_objective_function = batch_objective_function
+        self.dimensions = dimensions
+        self.bounds = bounds
+        self.mu = mu
+        self.lambda_ = lambda_
+        self.max_generations = max_generations
+        self.sigma = sigma
+        self.selection_type = selection_type
+        self.n_instances = len(seeds)
+        self.rngs = [np.random.default_rng(seed) for seed in seeds]
+
+        self.parent_genotypes = np.empty((self.n_instances, 0, dimensions))
+        self.parent_fitness = np.empty((self.n_instances, 0))
+        self.best_genotypes = np.empty((self.n_instances, dimensions))
+        self.best_fitness = np.full(self.n_instances, np.inf)
+        self.history: List[np.ndarray] = []
+
+    def _evaluate(self, genotypes: np.ndarray) -> np.ndarray:
+        """Evaluates a (K, n, d) tensor in one batch call, returning (K, n) fitness."""
+        n_instances, n_rows, dimensions = genotypes.shape
+        fitness = self.batch_objective_function(genotypes.reshape(n_instances * n_rows, dimensions))
+        return np.asarray(fitness, dtype=float).reshape(n_instances, n_rows)
+
+    def _keep_best(self, genotypes: np.ndarray, fitness: np.ndarray):
+        """Keeps, per instance, the mu fittest of a (K, n, d) pool as the new parents."""
+        indices = select_best_indices(fitness, self.mu)
+        self.parent_genotypes = np.take_along_axis(genotypes, indices[:, :, np.newaxis], axis=1)
+        self.parent_fitness = np.take_along_axis(fitness, indices, axis=1)
+
+    def _update_best(self):
+        """Updates each instance's best-so-far from its (sorted) parents."""
+        improved = self.parent_fitness[:, 0] < self.best_fitness
+        self.best_fitness[improved] = self.parent_fitness[improved, 0]
+        self.best_genotypes[improved] = self.parent_genotypes[improved, 0]
+        self.history.append(self.best_fitness.copy())
+
+    def _initialize_population(self):
+        """Creates and evaluates mu random individuals for every instance."""
+        genotypes = np.stack([
+            rng.uniform(self.bounds[0], self.bounds[1], size=(self.mu, self.dimensions))
+            for rng in self.rngs
+        ])
+        self._keep_best(genotypes, self._evaluate(genotypes))
+        self._update_best()
+
+    def _generate_offspring(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generates lambda_ offspring for every instance.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (K, lambda_, d) offspring genotypes and
+            their (K, lambda_) fitness values.
+        """
+        # 1. Per-instance random draws (same order as EvolutionStrategy)
+        parent_indices = np.empty((self.n_instances, self.lambda_), dtype=np.int64)
+        mutations = np.empty((self.n_instances, self.lambda_, self.dimensions))
+        for k, rng in enumerate(self.rngs):
+            parent_indices[k] = rng.integers(0, self.mu, size=self.lambda_)
+            mutations[k] = rng.normal(loc=0.0, scale=self.sigma, size=(self.lambda_, self.dimensions))
+
+        # 2. Mutation and clipping across all instances at once
+        offspring_genotypes = np.take_along_axis(self.parent_genotypes, parent_indices[:, :, np.newaxis], axis=1)
+        offspring_genotypes += mutations
+        np.clip(offspring_genotypes, self.bounds[0], self.bounds[1], out=offspring_genotypes)
+
+        # 3. One evaluation call for all K * lambda_ offspring
+        return offspring_genotypes, self._evaluate(offspring_genotypes)
+
+    def _select_survivors(self, offspring_genotypes: np.ndarray, offspring_fitness: np.ndarray):
+        """Applies (μ, λ) or (μ + λ) survivor selection to every instance."""
+        if self.selection_type == '(mu, lambda)':
+            self._keep_best(offspring_genotypes, offspring_fitness)
+        else:
+            self._keep_best(np.concatenate((self.parent_genotypes, offspring_genotypes), axis=1),
+                            np.concatenate((self.parent_fitness, offspring_fitness), axis=1))
+
+    def run(self) -> 'BatchedEvolutionStrategy':
+        """
+        Executes all K instances for max_generations generations.
+
+        Returns:
+            BatchedEvolutionStrategy: Returns self for easy access to results.
+        """
+        self._initialize_population()
+        for _ in range(1, self.max_generations + 1):
+            offspring_genotypes, offspring_fitness = self._generate_offspring()
+            self._select_survivors(offspring_genotypes, offspring_fitness)
+            self._update_best()
+        return self
+
+    def get_best_solutions(self) -> List[Individual]:
+        """
+        Returns the best individual found by each instance.
+
+        Returns:
+            List[Individual]: One Individual per instance, in seed order.
+        """
+        return [Individual(genotype.copy(), float(fitness))
+                for genotype, fitness in zip(self.best_genotypes, self.best_fitness)]
+
+    def get_histories(self) -> List[List[Tuple[int, float]]]:
+        """
+        Returns the convergence history of each instance.
+
+        Returns:
+            List[List[Tuple[int, float]]]: Per instance, (generation, best_fitness)
+            tuples in the same format as `EvolutionStrategy.get_history()`.
+        """
+        history = np.array(self.history)
+        return [[(generation, float(fitness)) for generation, fitness in enumerate(column)]
+                for column in history.T]
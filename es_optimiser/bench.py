@@ -0,0 +1,310 @@
+# es_optimiser/bench.py
+"""
+Throughput benchmarks for the ES engine, objective functions and plots.
+
+Run `python -m es_optimiser.bench --preset quick --output baseline.json` to
+record a baseline, then `python -m es_optimiser.bench --compare baseline.json`
+after a change to flag benchmarks that got slower than the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .evolution_strategy import EvolutionStrategy
+from .objective_functions import ackley_batch, rastrigin, rastrigin_batch
+
+SELECTION_TYPES = ['(mu, lambda)', '(mu + lambda)']
+
+# Parameter sweeps. Combinations whose offspring matrix would exceed
+# `max_elements` (lambda_ * dimensions) are skipped to keep memory bounded.
+BENCHMARK_PRESETS: Dict[str, Dict[str, Any]] = {
+    'quick': {
+        'dimensions': [2, 100, 1000],
+        'lambdas': [10, 1000, 10_000],
+        'generations': 5,
+        'repeats': 3,
+        'max_elements': 2_000_000,
+    },
+    'full': {
+        'dimensions': [2, 10, 100, 1000, 10_000],
+        'lambdas': [10, 100, 1000, 10_000, 100_000],
+        'generations': 10,
+        'repeats': 5,
+        'max_elements': 50_000_000,
+    },
+}
+
+
+def _best_time(func: Callable[[], Any], repeats: int, setup: Optional[Callable[[], Any]] = None) -> float:
+    """Returns the fastest wall-clock time of `func` over `repeats` calls."""
+    best = np.inf
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func: Callable[[], Any], setup: Optional[Callable[[], Any]] = None) -> int:
+    """Returns the peak traced allocation (bytes) during one call of `func`."""
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _make_es(dimensions: int, lambda_: int, selection_type: str, generations: int) -> EvolutionStrategy:
+    """Builds a quiet EvolutionStrategy on Rastrigin for benchmarking."""
+    return EvolutionStrategy(
+        objective_function=rastrigin, dimensions=dimensions, bounds=(-5.12, 5.12),
+        mu=max(1, lambda_ // 7), lambda_=lambda_, max_generations=generations,
+        sigma=0.2, selection_type=selection_type, seed=0, verbose=False
+    )
+
+
+def _result(name: str, params: Dict[str, Any], seconds: float, peak_bytes: int,
+            evaluations: int = 0, generations: int = 0) -> Dict[str, Any]:
+    """Builds one benchmark result record."""
+    return {
+        'name': name,
+        'params': params,
+        'seconds': seconds,
+        'evaluations_per_sec': evaluations / seconds if evaluations else None,
+        'generations_per_sec': generations / seconds if generations else None,
+        'peak_memory_bytes': peak_bytes,
+    }
+
+
+def bench_run(dimensions: int, lambda_: int, selection_type: str, generations: int, repeats: int) -> Dict[str, Any]:
+    """Benchmarks a complete `EvolutionStrategy.run()`."""
+    state = {}
+
+    def setup():
+        state['es'] = _make_es(dimensions, lambda_, selection_type, generations)
+
+    def run():
+        state['es'].run()
+
+    seconds = _best_time(run, repeats, setup)
+    evaluations = state['es'].evaluations
+    peak = _peak_memory(run, setup)
+    return _result('run', {'dimensions': dimensions, 'lambda': lambda_, 'selection_type': selection_type},
+                   seconds, peak, evaluations=evaluations, generations=generations)
+
+
+def bench_generate_offspring(dimensions: int, lambda_: int, repeats: int) -> Dict[str, Any]:
+    """Benchmarks one call of `EvolutionStrategy._generate_offspring()`."""
+    es = _make_es(dimensions, lambda_, SELECTION_TYPES[0], 1)
+    es.evaluator.open(es.batch_objective_function)
+    es._initialize_population()
+    seconds = _best_time(es._generate_offspring, repeats)
+    peak = _peak_memory(es._generate_offspring)
+    es.evaluator.close()
+    return _result('generate_offspring', {'dimensions': dimensions, 'lambda': lambda_},
+                   seconds, peak, evaluations=lambda_, generations=1)
+
+
+def bench_select_survivors(dimensions: int, lambda_: int, selection_type: str, repeats: int) -> Dict[str, Any]:
+    """Benchmarks one call of `EvolutionStrategy._select_survivors()`."""
+    es = _make_es(dimensions, lambda_, selection_type, 1)
+    es.evaluator.open(es.batch_objective_function)
+    es._initialize_population()
+    offspring = es._generate_offspring()
+    es.evaluator.close()
+    parents = es.population
+
+    def reset():
+        es.population = parents
+
+    seconds = _best_time(lambda: es._select_survivors(offspring), repeats, reset)
+    peak = _peak_memory(lambda: es._select_survivors(offspring), reset)
+    return _result('select_survivors', {'dimensions': dimensions, 'lambda': lambda_, 'selection_type': selection_type},
+                   seconds, peak, generations=1)
+
+
+def bench_objective(name: str, function: Callable[[np.ndarray], np.ndarray], dimensions: int, n_rows: int,
+                    repeats: int) -> Dict[str, Any]:
+    """Benchmarks a batch objective on an (n_rows, dimensions) matrix."""
+    genotypes = np.random.default_rng(0).uniform(-5.12, 5.12, size=(n_rows, dimensions))
+    seconds = _best_time(lambda: function(genotypes), repeats)
+    peak = _peak_memory(lambda: function(genotypes))
+    return _result(f'objective:{name}', {'dimensions': dimensions, 'lambda': n_rows},
+                   seconds, peak, evaluations=n_rows)
+
+
+def bench_plots(repeats: int) -> List[Dict[str, Any]]:
+    """
+    Benchmarks the plotting functions (headless backend, temporary files).
+
+    The Agg backend is only used while the plots are timed; the caller's
+    matplotlib backend is restored afterwards.
+    """
+    import matplotlib
+    from .plot import _LANDSCAPE_CACHE, plot_convergence, plot_landscape_2d
+
+    history = [(generation, 100.0 / (generation + 1)) for generation in range(250)]
+    results = []
+    previous_backend = matplotlib.get_backend()
+    matplotlib.use('Agg')
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # The landscape grid is recomputed on every call: no disk cache, memory cache cleared
+            cases = {
+                'plot:convergence': (lambda: plot_convergence(history, filename=os.path.join(tmp_dir, 'c.png')),
+                                     None),
+                'plot:landscape': (lambda: plot_landscape_2d(rastrigin, best_solution=np.zeros(2),
+                                                             filename=os.path.join(tmp_dir, 'l.png'),
+                                                             known_optimum=(0.0, 0.0), cache_dir=None),
+                                   _LANDSCAPE_CACHE.clear),
+            }
+            for name, (func, setup) in cases.items():
+                results.append(_result(name, {}, _best_time(func, repeats, setup), _peak_memory(func, setup)))
+    finally:
+        matplotlib.use(previous_backend)
+    return results
+
+
+def run_benchmarks(preset: str = 'quick', include_plots: bool = True) -> List[Dict[str, Any]]:
+    """
+    Runs the benchmark sweep of a preset.
+
+    Args:
+        preset (str): Key of `BENCHMARK_PRESETS`. Defaults to 'quick'.
+        include_plots (bool): Whether to benchmark the plotting functions. Defaults to True.
+
+    Returns:
+        List[Dict[str, Any]]: One result record per benchmark case.
+    """
+    config = BENCHMARK_PRESETS[preset]
+    repeats = config['repeats']
+    results = []
+    for dimensions in config['dimensions']:
+        for lambda_ in config['lambdas']:
+            if dimensions * lambda_ > config['max_elements']:
+                continue
+            print(f"Benchmarking d={dimensions}, lambda={lambda_}...", file=sys.stderr)
+            results.append(bench_generate_offspring(dimensions, lambda_, repeats))
+            for selection_type in SELECTION_TYPES:
+                results.append(bench_select_survivors(dimensions, lambda_, selection_type, repeats))
+                results.append(bench_run(dimensions, lambda_, selection_type, config['generations'], repeats))
+            results.append(bench_objective('rastrigin', rastrigin_batch, dimensions, lambda_, repeats))
+            results.append(bench_objective('ackley', ackley_batch, dimensions, lambda_, repeats))
+    if include_plots:
+        results.extend(bench_plots(repeats))
+    return results
+
+
+def _key(result: Dict[str, Any]) -> str:
+    """Returns a stable identifier of a benchmark case (name plus parameters)."""
+    params = ','.join(f"{key}={value}" for key, value in sorted(result['params'].items()))
+    return f"{result['name']}[{params}]"
+
+
+def save_baseline(results: List[Dict[str, Any]], path: str):
+    """
+    Saves benchmark results as a JSON baseline, with environment metadata.
+
+    Args:
+        results (List[Dict[str, Any]]): Results from `run_benchmarks`.
+        path (str): Output JSON file.
+    """
+    payload = {
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_baseline(path: str) -> List[Dict[str, Any]]:
+    """Loads the results list of a JSON baseline saved by `save_baseline`."""
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Finds benchmarks that are slower than the baseline beyond a threshold.
+
+    Args:
+        results (List[Dict[str, Any]]): Current results.
+        baseline (List[Dict[str, Any]]): Baseline results.
+        threshold (float): Allowed relative slowdown, e.g. 0.10 for 10%. Defaults to 0.10.
+
+    Returns:
+        List[Dict[str, Any]]: One record per regression with the case key, baseline
+        and current seconds, and the relative change. Cases missing from either
+        side are ignored.
+    """
+    baseline_by_key = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        reference = baseline_by_key.get(_key(result))
+        if reference is None:
+            continue
+        change = result['seconds'] / reference['seconds'] - 1.0
+        if change > threshold:
+            regressions.append({
+                'case': _key(result),
+                'baseline_seconds': reference['seconds'],
+                'current_seconds': result['seconds'],
+                'change': change,
+            })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns a non-zero exit code on regressions."""
+    parser = argparse.ArgumentParser(description="Benchmark the ES engine and report throughput.")
+    parser.add_argument('--preset', choices=sorted(BENCHMARK_PRESETS), default='quick')
+    parser.add_argument('--output', help="Save results as a JSON baseline to this path.")
+    parser.add_argument('--compare', metavar='BASELINE', help="Compare against a saved JSON baseline.")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slowdown flagged as a regression (default: 0.10).")
+    parser.add_argument('--no-plots', action='store_true', help="Skip the plotting benchmarks.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.preset, include_plots=not args.no_plots)
+    for result in results:
+        line = f"{_key(result):70s} {result['seconds'] * 1e3:10.3f} ms"
+        if result['evaluations_per_sec']:
+            line += f"  evals/s={result['evaluations_per_sec']:,.0f}"
+        if result['generations_per_sec']:
+            line += f"  gens/s={result['generations_per_sec']:,.1f}"
+        print(f"{line}  peak={result['peak_memory_bytes'] / 2**20:.1f} MiB")
+    if args.output:
+        save_baseline(results, args.output)
+        print(f"Baseline saved to {args.output}")
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']}: {regression['baseline_seconds'] * 1e3:.3f} ms -> "
+                  f"{regression['current_seconds'] * 1e3:.3f} ms ({regression['change']:+.1%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
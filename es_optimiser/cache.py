@@ -0,0 +1,127 @@
+# es_optimiser/cache.py
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Approximate bookkeeping cost of one cache entry beyond its key bytes
+# (OrderedDict node, bytes and float objects).
+_ENTRY_OVERHEAD_BYTES = 160
+
+
+class FitnessCache:
+    """
+    Memoizes objective values by genotype, with least-recently-used eviction.
+
+    With clipping to `bounds`, many offspring land on identical boundary
+    points, and under (μ + λ) the same genotypes are regenerated; for an
+    expensive objective each of those is a wasted evaluation. The cache keys
+    each genotype by its raw bytes (exact match) or, if `tolerance` is given,
+    by the genotype quantized to a grid of that spacing, so genotypes closer
+    than the tolerance share one evaluation. Duplicates within a batch are
+    evaluated once.
+
+    Attributes:
+        max_entries (Optional[int]): Maximum number of cached genotypes (None: unbounded).
+        max_bytes (Optional[int]): Approximate memory cap in bytes (None: unbounded).
+        tolerance (Optional[float]): Quantization step for keys (None: exact bytes).
+        hits (int): Genotypes answered from the cache (including in-batch duplicates).
+        misses (int): Genotypes sent to the objective.
+        evictions (int): Entries dropped to respect the limits.
+    """
+    def __init__(self, max_entries: Optional[int] = 100_000, max_bytes: Optional[int] = None,
+                 tolerance: Optional[float] = None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries. Defaults to 100,000.
+            max_bytes: Approximate memory cap in bytes. Defaults to None.
+            tolerance: Quantization step for keys. Defaults to None (exact match).
+
+        Raises:
+            ValueError: If a limit or the tolerance is not positive.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1.")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1.")
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("tolerance must be > 0.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.tolerance = tolerance
+        self._entries: 'OrderedDict[bytes, float]' = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, genotypes: np.ndarray) -> List[bytes]:
+        """Returns the cache key of every row."""
+        if self.tolerance is not None:
+            genotypes = np.floor(genotypes / self.tolerance + 0.5).astype(np.int64)
+        else:
+            genotypes = np.ascontiguousarray(genotypes, dtype=np.float64)
+        return [row.tobytes() for row in genotypes]
+
+    def _insert(self, key: bytes, fitness: float):
+        """Adds an entry, then evicts least recently used entries over the limits."""
+        self._entries[key] = fitness
+        self._nbytes += len(key) + _ENTRY_OVERHEAD_BYTES
+        while ((self.max_entries is not None and len(self._entries) > self.max_entries)
+               or (self.max_bytes is not None and self._nbytes > self.max_bytes and len(self._entries) > 1)):
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._nbytes -= len(evicted_key) + _ENTRY_OVERHEAD_BYTES
+            self.evictions += 1
+
+    def evaluate(self, genotypes: np.ndarray, objective: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Returns fitness values for a batch, evaluating only uncached genotypes.
+
+        Args:
+            genotypes (np.ndarray): An (n, d) array of candidate solutions.
+            objective (Callable[[np.ndarray], np.ndarray]): Batch objective used
+                for the misses (called at most once, with the distinct misses).
+
+        Returns:
+            np.ndarray: An (n,) float array of fitness values, in row order.
+        """
+        fitness = np.empty(genotypes.shape[0])
+        missing: Dict[bytes, List[int]] = {}
+        for row, key in enumerate(self._keys(genotypes)):
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                fitness[row] = cached
+            else:
+                missing.setdefault(key, []).append(row)
+
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            missing_fitness = objective(genotypes[first_rows])
+            for (key, rows), value in zip(missing.items(), missing_fitness):
+                fitness[rows] = value
+                self._insert(key, float(value))
+
+        self.misses += len(missing)
+        self.hits += genotypes.shape[0] - len(missing)
+        return fitness
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: hits, misses, evictions, current entries and approximate bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._nbytes,
+        }
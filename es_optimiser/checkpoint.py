@@ -0,0 +1,116 @@
+# es_optimiser/checkpoint.py
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .evolution_strategy import EvolutionStrategy
+
+# Checkpoint entry listing which other entries hold JSON-encoded dicts
+_JSON_FIELDS_KEY = '__json_fields__'
+
+
+def write_checkpoint(path: str, state: Dict[str, Any]):
+    """
+    Atomically writes a checkpoint as an uncompressed .npz archive.
+
+    Array values are stored as-is; dict values (configuration, RNG state) are
+    stored as JSON strings so the file loads without pickle. The archive is
+    written to a temporary file in the same directory, synced and then moved
+    over `path` with `os.replace`, so a crash never leaves a partial checkpoint.
+
+    Args:
+        path (str): Destination file.
+        state (Dict[str, Any]): Checkpoint entries (arrays, scalars or dicts).
+    """
+    arrays = {}
+    json_fields = []
+    for key, value in state.items():
+        if isinstance(value, dict):
+            arrays[key] = np.array(json.dumps(value))
+            json_fields.append(key)
+        else:
+            arrays[key] = np.asarray(value)
+    arrays[_JSON_FIELDS_KEY] = np.array(json_fields, dtype=str)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: str) -> Dict[str, Any]:
+    """
+    Reads a checkpoint written by `write_checkpoint`.
+
+    Args:
+        path (str): Checkpoint file.
+
+    Returns:
+        Dict[str, Any]: The checkpoint entries, with JSON entries decoded to dicts.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        state = {key: data[key] for key in data.files}
+    for key in state.pop(_JSON_FIELDS_KEY).tolist():
+        state[key] = json.loads(str(state[key]))
+    return state
+
+
+class Checkpointer:
+    """
+    Periodically saves the state of a running strategy so it can be resumed.
+
+    Pass it as `EvolutionStrategy(checkpointer=...)`: after each generation the
+    strategy asks `due()` and, if a checkpoint is due, calls `save()`. Resume
+    with `es.run(resume_from=checkpointer.path)` on a strategy built with the
+    same configuration; the resumed run continues exactly as the uninterrupted
+    run would have.
+
+    Attributes:
+        path (str): Checkpoint file (overwritten atomically on every save).
+        every_generations (Optional[int]): Save every this many generations.
+        every_seconds (Optional[float]): Save when this much wall-clock time has
+                                         passed since the previous save.
+        saves (int): Number of checkpoints written.
+    """
+    def __init__(self, path: str, every_generations: Optional[int] = None, every_seconds: Optional[float] = None):
+        """
+        Initializes the checkpoint schedule. At least one interval must be given.
+
+        Args:
+            path: Checkpoint file.
+            every_generations: Generation interval. Defaults to None.
+            every_seconds: Wall-clock interval in seconds. Defaults to None.
+
+        Raises:
+            ValueError: If neither interval is given, or an interval is not positive.
+        """
+        if every_generations is None and every_seconds is None:
+            raise ValueError("Give every_generations and/or every_seconds.")
+        if (every_generations is not None and every_generations < 1) or (every_seconds is not None and every_seconds <= 0):
+            raise ValueError("Checkpoint intervals must be positive.")
+        self.path = path
+        self.every_generations = every_generations
+        self.every_seconds = every_seconds
+        self.saves = 0
+        self._last_save_time: Optional[float] = None
+
+    def due(self, generation: int) -> bool:
+        """Returns True if a checkpoint should be written after `generation`."""
+        now = time.perf_counter()
+        if self._last_save_time is None:
+            self._last_save_time = now
+        if self.every_generations is not None and generation % self.every_generations == 0:
+            return True
+        return self.every_seconds is not None and now - self._last_save_time >= self.every_seconds
+
+    def save(self, es: 'EvolutionStrategy'):
+        """Writes a checkpoint of `es` and restarts the wall-clock interval."""
+        es.save_checkpoint(self.path)
+        self.saves += 1
+        self._last_save_time = time.perf_counter()
@@ -0,0 +1,445 @@
+# es_optimiser/cli.py
+"""
+Command-line entry point: `python -m es_optimiser {run,sweep,plot,bench}`.
+
+Only the standard library is imported at start-up. NumPy, the optimizer
+modules and matplotlib are imported inside the subcommand that needs them,
+so `--help` and short optimization jobs start quickly. Importing this module
+has no side effects: no directories, log files or batch IDs are created.
+
+Run parameters come from the defaults below, then an optional JSON or TOML
+configuration file (`--config`), then command-line flags, each overriding
+the previous one.
+"""
+import argparse
+import itertools
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+# Defaults of a single run (the example configuration of main.py)
+DEFAULT_CONFIG: Dict[str, Any] = {
+    'strategy': 'es',
+    'restart_strategy': None,
+    'objective': 'rastrigin',
+    'dimensions': 2,
+    'bounds': [-5.12, 5.12],
+    'mu': 30,
+    'lambda_': 200,
+    'sigma': 0.2,
+    'max_generations': 250,
+    'selection_type': '(mu, lambda)',
+    'step_size_control': 'constant',
+    'seed': None,
+    'stagnation_generations': 50,
+    'target_fitness': None,
+    'max_evaluations': None,
+    'cache_entries': None,
+}
+
+STRATEGIES = ('es', 'cma')
+RESTART_STRATEGIES = (None, 'ipop', 'bipop')
+
+# Sweep-only keys of a configuration file: the grid of values to vary, the
+# number of seeds per grid point and the root of the spawned seeds
+SWEEP_DEFAULTS: Dict[str, Any] = {
+    'grid': {},
+    'replicates': 1,
+    'root_seed': 0,
+}
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Reads a configuration file (TOML if it ends in .toml, JSON otherwise).
+
+    Args:
+        path (str): Configuration file.
+
+    Returns:
+        Dict[str, Any]: The configuration's top-level table.
+
+    Raises:
+        ValueError: If the file does not hold a table, or TOML is not supported.
+    """
+    if path.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError("TOML configuration files need Python 3.11+ or the 'tomli' package.") from None
+        with open(path, 'rb') as f:
+            config = tomllib.load(f)
+    else:
+        with open(path) as f:
+            config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"{path} must contain a table of configuration keys.")
+    return config
+
+
+def resolve_config(*layers: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merges configuration layers over `DEFAULT_CONFIG` (later layers win).
+
+    Args:
+        *layers (Dict[str, Any]): Partial configurations.
+
+    Returns:
+        Dict[str, Any]: A complete run configuration.
+
+    Raises:
+        ValueError: If a key is unknown, the strategy or restart strategy is not
+                    recognized, or restarts are requested without max_evaluations.
+    """
+    config = dict(DEFAULT_CONFIG)
+    for layer in layers:
+        unknown = set(layer) - set(DEFAULT_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown configuration key(s): {sorted(unknown)}. Use {sorted(DEFAULT_CONFIG)}.")
+        config.update(layer)
+    if config['strategy'] not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {config['strategy']}. Use one of {STRATEGIES}.")
+    if config['restart_strategy'] not in RESTART_STRATEGIES:
+        raise ValueError(f"Unknown restart_strategy: {config['restart_strategy']}. Use one of {RESTART_STRATEGIES}.")
+    if config['restart_strategy'] is not None and config['max_evaluations'] is None:
+        raise ValueError("restart_strategy needs max_evaluations (the budget shared by all restarts).")
+    config['bounds'] = [float(bound) for bound in config['bounds']]
+    return config
+
+
+def resolve_objective(name: str):
+    """
+    Returns the objective function for a configuration name.
+
+    Args:
+        name (str): A function of `es_optimiser.objective_functions` (e.g.
+                    'rastrigin') or an importable 'package.module:function'.
+
+    Returns:
+        Callable[[np.ndarray], float]: The objective function.
+
+    Raises:
+        ValueError: If no such function exists.
+    """
+    import importlib
+
+    module_name, _, function_name = name.rpartition(':')
+    try:
+        module = importlib.import_module(module_name or 'es_optimiser.objective_functions')
+    except ImportError as error:
+        raise ValueError(f"Cannot import the module of objective {name}: {error}") from None
+    function = getattr(module, function_name, None)
+    if function_name.startswith('_') or not callable(function):
+        raise ValueError(f"Unknown objective: {name}.")
+    return function
+
+
+def build_strategy(config: Dict[str, Any], seed: Any = None, verbose: bool = False, history_sink=None):
+    """
+    Creates the strategy described by a run configuration.
+
+    Args:
+        config (Dict[str, Any]): Complete run configuration (see `resolve_config`).
+        seed (Any): Seed (int or np.random.SeedSequence). Defaults to None.
+        verbose (bool): Let the strategy print its progress. Defaults to False.
+        history_sink (Optional[HistorySink]): Optional telemetry file. Defaults to None.
+
+    Returns:
+        EvolutionStrategy: An `EvolutionStrategy`, or a `CMAEvolutionStrategy`
+        for strategy 'cma' (which ignores selection_type and step_size_control);
+        with a restart_strategy, a `RestartingEvolutionStrategy` running them.
+
+    Raises:
+        ValueError: If a history_sink is combined with a restart_strategy.
+    """
+    from .cache import FitnessCache
+
+    if config['strategy'] == 'cma':
+        from .cma import CMAEvolutionStrategy as strategy_class
+        options = {}
+    else:
+        from .evolution_strategy import EvolutionStrategy as strategy_class
+        options = {'selection_type': config['selection_type'], 'step_size_control': config['step_size_control']}
+    objective_function = resolve_objective(config['objective'])
+    fitness_cache = FitnessCache(max_entries=config['cache_entries']) if config['cache_entries'] else None
+
+    if config['restart_strategy'] is not None:
+        if history_sink is not None:
+            raise ValueError("A telemetry file (--history) is not supported with restart_strategy.")
+        from .restarts import RestartingEvolutionStrategy
+        return RestartingEvolutionStrategy(
+            objective_function, config['dimensions'], tuple(config['bounds']), config['mu'], config['lambda_'],
+            max_evaluations=config['max_evaluations'], restart_strategy=config['restart_strategy'],
+            sigma=config['sigma'], max_generations=config['max_generations'],
+            stagnation_generations=config['stagnation_generations'] or 50,
+            target_fitness=config['target_fitness'], seed=seed, strategy_class=strategy_class,
+            es_kwargs=dict(options, fitness_cache=fitness_cache), verbose=verbose
+        )
+
+    from .stopping import StoppingCriteria
+    return strategy_class(
+        objective_function=objective_function,
+        dimensions=config['dimensions'],
+        bounds=tuple(config['bounds']),
+        mu=config['mu'],
+        lambda_=config['lambda_'],
+        max_generations=config['max_generations'],
+        sigma=config['sigma'],
+        seed=seed,
+        fitness_cache=fitness_cache,
+        stopping_criteria=StoppingCriteria(
+            target_fitness=config['target_fitness'],
+            stagnation_generations=config['stagnation_generations'],
+            max_evaluations=config['max_evaluations'],
+        ),
+        history_sink=history_sink,
+        verbose=verbose,
+        **options
+    )
+
+
+def run_configuration(config: Dict[str, Any], seed: Any = None, verbose: bool = False,
+                      history_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Runs one configuration and returns its results as plain Python values.
+
+    Args:
+        config (Dict[str, Any]): Complete run configuration.
+        seed (Any): Seed (int or np.random.SeedSequence). Defaults to None.
+        verbose (bool): Let the strategy print its progress. Defaults to False.
+        history_path (Optional[str]): Stream per-generation telemetry to this file.
+                                      Defaults to None.
+
+    Returns:
+        Dict[str, Any]: best_fitness, best_solution, elapsed_time, generations,
+        evaluations, stop_reason and history ((generation, best fitness) pairs).
+    """
+    import time
+
+    history_sink = None
+    if history_path is not None:
+        from .telemetry import HistorySink
+        history_sink = HistorySink(history_path)
+    try:
+        es = build_strategy(config, seed, verbose, history_sink)
+        start_time = time.perf_counter()
+        es.run()
+        elapsed_time = time.perf_counter() - start_time
+        history = es.get_history()
+    finally:
+        if history_sink is not None:
+            history_sink.close()
+
+    best = es.get_best_solution()
+    return {
+        'best_fitness': float(best.fitness),
+        'best_solution': best.genotype.tolist(),
+        'elapsed_time': elapsed_time,
+        'generations': es.generation,
+        'evaluations': es.evaluations,
+        'stop_reason': es.stop_reason,
+        'history': [(int(generation), float(fitness)) for generation, fitness in history],
+    }
+
+
+def _stored_config(config: Dict[str, Any], seed: Any) -> Dict[str, Any]:
+    """Returns the configuration as keyed in a `ResultStore` (seed described as a string)."""
+    from .experiments import describe_seed
+    return dict(config, seed=describe_seed(seed))
+
+
+def _store_result(store, config: Dict[str, Any], result: Dict[str, Any]):
+    """Saves a `run_configuration` result in a `ResultStore`."""
+    store.put(config, result['best_fitness'], result['elapsed_time'], result['history'],
+              best_solution=result['best_solution'],
+              stats={key: result[key] for key in ('generations', 'evaluations', 'stop_reason')})
+
+
+def _stored_result(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Converts a `ResultStore` record back into a `run_configuration` result."""
+    return {
+        'best_fitness': record['best_fitness'],
+        'best_solution': record['best_solution'].tolist() if record['best_solution'] is not None else None,
+        'elapsed_time': record['elapsed_time'],
+        **record['stats'],
+        'history': record['history'],
+    }
+
+
+def _sweep_job(config: Dict[str, Any], seed: Any) -> Dict[str, Any]:
+    """Runs one sweep configuration in a worker process."""
+    return run_configuration(config, seed)
+
+
+def _config_overrides(args: argparse.Namespace) -> Dict[str, Any]:
+    """Returns the run keys given as command-line flags."""
+    return {key: value for key, value in vars(args).items() if key in DEFAULT_CONFIG and value is not None}
+
+
+def command_run(args: argparse.Namespace) -> int:
+    """Runs one configuration and prints its results as JSON."""
+    config = resolve_config(load_config(args.config) if args.config else {}, _config_overrides(args))
+
+    store = None
+    result = None
+    if args.store:
+        if config['seed'] is None:
+            raise ValueError("--store needs a fixed --seed, otherwise the run is not reproducible.")
+        from .store import ResultStore
+        store = ResultStore(args.store)
+        record = store.get(_stored_config(config, config['seed']))
+        if record is not None:
+            result = _stored_result(record)
+    if result is None:
+        result = run_configuration(config, config['seed'], verbose=args.verbose, history_path=args.history)
+        if store is not None:
+            _store_result(store, _stored_config(config, config['seed']), result)
+    if store is not None:
+        store.close()
+
+    if args.plot:
+        from .plot import plot_convergence
+        plot_convergence(result['history'], title=f"Convergence ({config['objective']}, seed={config['seed']})",
+                         filename=args.plot)
+    summary = {key: value for key, value in result.items() if key != 'history'}
+    print(json.dumps(summary))
+    return 0
+
+
+def command_sweep(args: argparse.Namespace) -> int:
+    """Runs the configurations of a grid that are missing from the store, then reports."""
+    file_config = load_config(args.config) if args.config else {}
+    sweep = {key: file_config.pop(key, default) for key, default in SWEEP_DEFAULTS.items()}
+    for key in ('replicates', 'root_seed'):
+        if getattr(args, key) is not None:
+            sweep[key] = getattr(args, key)
+    base = resolve_config(file_config, _config_overrides(args))
+    grid = sweep['grid']
+    configs = [resolve_config(base, dict(zip(grid, values))) for values in itertools.product(*grid.values())]
+    jobs = [{'config': config} for config in configs for _ in range(sweep['replicates'])]
+
+    from .experiments import run_grid, spawn_seeds
+    from .store import DEFAULT_STORE_PATH, ResultStore, format_report
+
+    store = ResultStore(args.store or DEFAULT_STORE_PATH)
+    seeds = spawn_seeds(sweep['root_seed'], len(jobs))
+    sweep_configs = [_stored_config(job['config'], seed) for job, seed in zip(jobs, seeds)]
+    pending = len(store.missing(sweep_configs))
+    print(f"Running {pending} of {len(jobs)} configurations ({len(jobs) - pending} already in {store.path})...")
+
+    completed_runs = run_grid(
+        _sweep_job, jobs, root_seed=sweep['root_seed'], seed_arg='seed', max_workers=args.workers,
+        skip=lambda job: _stored_config(job['config'], job['seed']) in store
+    )
+    for job, result in completed_runs:
+        _store_result(store, _stored_config(job['config'], job['seed']), result)
+    failed = pending - len(completed_runs)
+
+    print(format_report(store.aggregate(group_by=tuple(grid) or ('objective',), configs=sweep_configs)))
+    store.close()
+    if failed:
+        print(f"Warning: {failed} run(s) failed; see the log.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def command_plot(args: argparse.Namespace) -> int:
+    """Plots the convergence of a telemetry file or of a stored run."""
+    if args.store:
+        from .store import ResultStore
+        with ResultStore(args.store) as store:
+            matches = [record for record in store.records(all_versions=True)
+                       if record['config_hash'].startswith(args.source)]
+        if len(matches) != 1:
+            raise ValueError(f"{len(matches)} stored runs match '{args.source}'; give a unique hash prefix.")
+        history = matches[0]['history']
+    else:
+        history = args.source
+
+    from .plot import plot_convergence
+    plot_convergence(history, title=args.title, filename=args.output)
+    print(f"Plot saved: {args.output}")
+    return 0
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser):
+    """Adds the flags that override run configuration keys (None unless given)."""
+    group = parser.add_argument_group("run configuration (overrides --config)")
+    group.add_argument('--strategy', choices=STRATEGIES)
+    group.add_argument('--restart-strategy', dest='restart_strategy', choices=RESTART_STRATEGIES[1:],
+                       help="Restart on stagnation within the --max-evaluations budget.")
+    group.add_argument('--objective', help="Function of es_optimiser.objective_functions, or 'module:function'.")
+    group.add_argument('--dimensions', type=int)
+    group.add_argument('--bounds', type=float, nargs=2, metavar=('LOW', 'HIGH'))
+    group.add_argument('--mu', type=int)
+    group.add_argument('--lambda', dest='lambda_', type=int)
+    group.add_argument('--sigma', type=float)
+    group.add_argument('--generations', dest='max_generations', type=int)
+    group.add_argument('--selection-type', dest='selection_type', choices=['(mu, lambda)', '(mu + lambda)'])
+    group.add_argument('--step-size-control', dest='step_size_control')
+    group.add_argument('--stagnation-generations', dest='stagnation_generations', type=int)
+    group.add_argument('--target-fitness', dest='target_fitness', type=float)
+    group.add_argument('--max-evaluations', dest='max_evaluations', type=int)
+    group.add_argument('--cache-entries', dest='cache_entries', type=int, help="Enables a fitness cache with this many entries (default: off).")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser of all subcommands."""
+    parser = argparse.ArgumentParser(prog='python -m es_optimiser', description=__doc__.strip().splitlines()[0])
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    run = subcommands.add_parser('run', help="Run one configuration and print its results as JSON.")
+    run.add_argument('--config', help="JSON or TOML configuration file.")
+    _add_run_arguments(run)
+    run.add_argument('--seed', type=int)
+    run.add_argument('--verbose', '-v', action='store_true', help="Print the strategy's progress.")
+    run.add_argument('--history', help="Stream per-generation telemetry to this file.")
+    run.add_argument('--plot', help="Save a convergence plot to this file.")
+    run.add_argument('--store', help="Result store: reuse a stored result, or store the new one (needs --seed).")
+    run.set_defaults(handler=command_run)
+
+    sweep = subcommands.add_parser('sweep', help="Run a grid of configurations incrementally.")
+    sweep.add_argument('--config', help="JSON or TOML file with run keys plus 'grid', 'replicates' and 'root_seed'.")
+    _add_run_arguments(sweep)
+    sweep.add_argument('--replicates', type=int, help="Seeds per grid point (default: 1).")
+    sweep.add_argument('--root-seed', dest='root_seed', type=int, help="Root of the spawned seeds (default: 0).")
+    sweep.add_argument('--workers', type=int, help="Worker processes (default: CPU count).")
+    sweep.add_argument('--store', help="Result store (default: results/results.sqlite).")
+    sweep.set_defaults(handler=command_sweep)
+
+    plot = subcommands.add_parser('plot', help="Plot the convergence of a telemetry file or a stored run.")
+    plot.add_argument('source', help="Telemetry file, or with --store a config hash prefix.")
+    plot.add_argument('--store', help="Read the history from this result store.")
+    plot.add_argument('--output', '-o', required=True, help="Image file to write.")
+    plot.add_argument('--title')
+    plot.set_defaults(handler=command_plot)
+
+    # Arguments after 'bench' are passed on to es_optimiser.bench
+    subcommands.add_parser('bench', add_help=False, help="Run the throughput benchmarks (see bench --help).")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Parses the command line and runs the chosen subcommand.
+
+    Args:
+        argv (Optional[List[str]]): Arguments without the program name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == 'bench':
+        from .bench import main as bench_main
+        return bench_main(extra)
+    if extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as error:
+        parser.error(str(error))
@@ -0,0 +1,206 @@
+# es_optimiser/cma.py
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .cache import FitnessCache
+from .checkpoint import Checkpointer
+from .evaluators import SerialEvaluator
+from .evolution_strategy import EvolutionStrategy, GenerationCallback, Population, select_best_indices
+from .objective_functions import BatchObjective
+from .profiling import PhaseProfiler
+from .stopping import StoppingCriteria
+from .surrogate import SurrogateScreen
+from .telemetry import HistorySink
+
+
+class CMAEvolutionStrategy(EvolutionStrategy):
+    """
+    Covariance Matrix Adaptation Evolution Strategy, (μ/μ_w, λ)-CMA-ES.
+
+    Samples offspring from a multivariate normal distribution
+    N(mean, sigma^2 * C) and adapts the mean (weighted recombination of the mu
+    best offspring), the global step size sigma (cumulative step-size
+    adaptation) and the full covariance matrix C (rank-one and rank-mu
+    updates) every generation, following Hansen's "The CMA Evolution Strategy:
+    A Tutorial". Shares the `run()` / `get_history()` / `get_best_solution()`
+    interface of `EvolutionStrategy`; `population` holds the mu best offspring
+    of the last generation.
+
+    Attributes:
+        mean (np.ndarray): (d,) mean of the search distribution.
+        covariance (np.ndarray): (d, d) covariance matrix C.
+        weights (np.ndarray): (mu,) positive recombination weights, summing to 1.
+        mu_eff (float): Variance-effective selection mass.
+        path_sigma (np.ndarray): (d,) evolution path for step-size adaptation.
+        path_c (np.ndarray): (d,) evolution path for covariance adaptation.
+    """
+    def __init__(
+        self,
+        objective_function: Callable[[np.ndarray], float],
+        dimensions: int,
+        bounds: Tuple[float, float],
+        lambda_: Optional[int] = None,
+        mu: Optional[int] = None,
+        max_generations: int = 100,
+        sigma: float = 0.3,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        batch_objective_function: Optional[BatchObjective] = None,
+        evaluator: Optional[SerialEvaluator] = None,
+        fitness_cache: Optional[FitnessCache] = None,
+        stopping_criteria: Optional[StoppingCriteria] = None,
+        profiler: Optional[PhaseProfiler] = None,
+        callbacks: Optional[List[GenerationCallback]] = None,
+        history_sink: Optional[HistorySink] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        surrogate: Optional[SurrogateScreen] = None,
+        verbose: bool = True
+    ):
+        """
+        Initializes the CMA-ES configuration and strategy parameters.
+
+        Args:
+            objective_function: The target function to minimize.
+            dimensions: Dimensionality of the search space.
+            bounds: Tuple (min_val, max_val) applied to all dimensions.
+            lambda_: Offspring per generation. Defaults to 4 + floor(3 ln d).
+            mu: Number of offspring recombined into the new mean. Defaults to lambda_ // 2.
+            max_generations: Maximum number of iterations. Defaults to 100.
+            sigma: Initial global step size. Defaults to 0.3.
+            seed: Optional seed for the random number generator. Defaults to None.
+            batch_objective_function: Optional batched version of `objective_function`.
+            evaluator: Optional evaluator for fitness batches. Defaults to a `SerialEvaluator`.
+            fitness_cache: Optional `FitnessCache` for objective values. Defaults to None.
+            stopping_criteria: Optional early termination conditions. Defaults to None.
+            profiler: Optional per-phase timing instrumentation. Defaults to None.
+            callbacks: Optional per-generation observers. Defaults to None.
+            history_sink: Optional streaming telemetry file. Defaults to None.
+            checkpointer: Optional periodic checkpoint writer. Defaults to None.
+            surrogate: Optional surrogate pre-screening of offspring. Defaults to None.
+            verbose: Print configuration, progress and summary. Defaults to True.
+        """
+        if lambda_ is None:
+            lambda_ = 4 + int(3 * np.log(dimensions))
+        if mu is None:
+            mu = lambda_ // 2
+        super().__init__(
+            objective_function, dimensions, bounds, mu, lambda_,
+            max_generations=max_generations, sigma=sigma, selection_type='(mu, lambda)',
+            seed=seed, batch_objective_function=batch_objective_function, evaluator=evaluator,
+            fitness_cache=fitness_cache, stopping_criteria=stopping_criteria,
+            profiler=profiler, callbacks=callbacks, history_sink=history_sink,
+            checkpointer=checkpointer, surrogate=surrogate, verbose=verbose
+        )
+
+        n = dimensions
+        weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+        self.weights = weights / weights.sum()
+        self.mu_eff = 1.0 / np.sum(self.weights**2)
+
+        # Learning rates and damping (Hansen's default strategy parameters)
+        self.c_c = (4 + self.mu_eff / n) / (n + 4 + 2 * self.mu_eff / n)
+        self.c_sigma = (self.mu_eff + 2) / (n + self.mu_eff + 5)
+        self.c_1 = 2 / ((n + 1.3)**2 + self.mu_eff)
+        self.c_mu = min(1 - self.c_1, 2 * (self.mu_eff - 2 + 1 / self.mu_eff) / ((n + 2)**2 + self.mu_eff))
+        self.d_sigma = 1 + 2 * max(0.0, np.sqrt((self.mu_eff - 1) / (n + 1)) - 1) + self.c_sigma
+        self.chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n**2))
+
+        self.mean = np.zeros(n)
+        self.covariance = np.eye(n)
+        self.path_sigma = np.zeros(n)
+        self.path_c = np.zeros(n)
+        self._eigenbasis = np.eye(n)     # B: eigenvectors of C
+        self._axis_lengths = np.ones(n)  # D: square roots of the eigenvalues of C
+        self._generation = 0
+
+    def _start_population(self, genotypes: np.ndarray, fitness: np.ndarray):
+        """Builds the initial population and recombines it into the initial mean."""
+        super()._start_population(genotypes, fitness)
+        self.mean = self.weights @ self.population.genotypes
+
+    def _sample_offspring(self) -> np.ndarray:
+        """
+        Samples lambda_ offspring from N(mean, sigma^2 * C), clipped to the bounds.
+
+        Returns:
+            np.ndarray: (lambda_, d) offspring genotypes, not yet evaluated.
+        """
+        profiler = self.profiler
+        standard_normals = self.rng.standard_normal((self.lambda_, self.dimensions))
+        steps = (standard_normals * self._axis_lengths) @ self._eigenbasis.T
+        offspring_genotypes = self.mean + self.sigma * steps
+        if profiler is not None:
+            profiler.mark('mutation')
+        np.clip(offspring_genotypes, self.bounds[0], self.bounds[1], out=offspring_genotypes)
+        if profiler is not None:
+            profiler.mark('clipping')
+        return offspring_genotypes
+
+    def _make_offspring(self, genotypes: np.ndarray, fitness: np.ndarray) -> Population:
+        """Wraps the evaluated offspring; all adaptation happens in `_select_survivors`."""
+        return Population(genotypes, fitness)
+
+    def _select_survivors(self, offspring: Population):
+        """
+        Keeps the mu best offspring and adapts mean, step size and covariance.
+
+        Steps are recomputed from the clipped genotypes, so boundary handling
+        is reflected in the adaptation.
+
+        Args:
+            offspring (Population): The generated offspring.
+        """
+        self._generation += 1
+        self.population = offspring.take(select_best_indices(offspring.fitness, self.mu))
+        n = self.dimensions
+
+        selected_steps = (self.population.genotypes - self.mean) / self.sigma
+        mean_step = self.weights @ selected_steps
+        self.mean = self.mean + self.sigma * mean_step
+
+        # Cumulative step-size adaptation path, using C^(-1/2) * mean_step
+        inverse_sqrt_step = self._eigenbasis @ ((self._eigenbasis.T @ mean_step) / self._axis_lengths)
+        self.path_sigma = ((1 - self.c_sigma) * self.path_sigma
+                           + np.sqrt(self.c_sigma * (2 - self.c_sigma) * self.mu_eff) * inverse_sqrt_step)
+        path_sigma_norm = np.linalg.norm(self.path_sigma)
+        h_sigma = float(path_sigma_norm / np.sqrt(1 - (1 - self.c_sigma)**(2 * self._generation))
+                        < (1.4 + 2 / (n + 1)) * self.chi_n)
+
+        # Covariance adaptation: rank-one (evolution path) plus rank-mu update
+        self.path_c = ((1 - self.c_c) * self.path_c
+                       + h_sigma * np.sqrt(self.c_c * (2 - self.c_c) * self.mu_eff) * mean_step)
+        rank_one = np.outer(self.path_c, self.path_c) + (1 - h_sigma) * self.c_c * (2 - self.c_c) * self.covariance
+        rank_mu = (selected_steps * self.weights[:, np.newaxis]).T @ selected_steps
+        self.covariance = ((1 - self.c_1 - self.c_mu) * self.covariance
+                           + self.c_1 * rank_one + self.c_mu * rank_mu)
+
+        self.sigma *= np.exp((self.c_sigma / self.d_sigma) * (path_sigma_norm / self.chi_n - 1))
+
+        # Decompose C = B D^2 B^T for the next generation's sampling
+        self.covariance = (self.covariance + self.covariance.T) / 2
+        eigenvalues, self._eigenbasis = np.linalg.eigh(self.covariance)
+        self._axis_lengths = np.sqrt(np.maximum(eigenvalues, 1e-20))
+
+    def _checkpoint_state(self) -> Dict[str, Any]:
+        """Adds the search distribution and evolution paths to the checkpoint."""
+        state = super()._checkpoint_state()
+        state.update({
+            'mean': self.mean,
+            'covariance': self.covariance,
+            'path_sigma': self.path_sigma,
+            'path_c': self.path_c,
+            'eigenbasis': self._eigenbasis,
+            'axis_lengths': self._axis_lengths,
+            'cma_generation': self._generation,
+        })
+        return state
+
+    def _restore_checkpoint_state(self, state: Dict[str, Any]):
+        """Restores the search distribution and evolution paths from a checkpoint."""
+        super()._restore_checkpoint_state(state)
+        self.mean = state['mean']
+        self.covariance = state['covariance']
+        self.path_sigma = state['path_sigma']
+        self.path_c = state['path_c']
+        self._eigenbasis = state['eigenbasis']
+        self._axis_lengths = state['axis_lengths']
+        self._generation = int(state['cma_generation'])
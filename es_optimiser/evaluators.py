@@ -0,0 +1,215 @@
+# es_optimiser/evaluators.py
+import math
+import os
+import sys
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+
+from .objective_functions import BatchObjective
+
+# The process pool and shared memory modules are imported only when a
+# ProcessPoolEvaluator is used, keeping serial runs quick to start
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+
+class SerialEvaluator:
+    """
+    Evaluates batches of genotypes in the calling process.
+
+    An evaluator is opened once per `EvolutionStrategy.run()` with the batch
+    objective, used for every generation, and closed when the run ends. This
+    class is the default and the reference behaviour for all other evaluators.
+    """
+    def __init__(self):
+        self._objective: Optional[BatchObjective] = None
+
+    def open(self, objective: BatchObjective):
+        """
+        Prepares the evaluator for a run.
+
+        Args:
+            objective (BatchObjective): Batched objective ((n, d) array in, (n,) array out).
+        """
+        self._objective = objective
+
+    def evaluate(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of genotypes.
+
+        Args:
+            genotypes (np.ndarray): An (n, d) array of candidate solutions.
+
+        Returns:
+            np.ndarray: An (n,) float array of fitness values, in row order.
+        """
+        return np.asarray(self._objective(genotypes), dtype=float)
+
+    def close(self):
+        """Releases any resources held for the run."""
+        self._objective = None
+
+    def __enter__(self) -> 'SerialEvaluator':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# --- Worker-side state for ProcessPoolEvaluator (one copy per worker process) ---
+_worker_objective: Optional[BatchObjective] = None
+_worker_buffers: Dict[str, 'shared_memory.SharedMemory'] = {}
+
+
+def _attach_shared_memory(name: str) -> 'shared_memory.SharedMemory':
+    """Attaches to a shared memory block without registering it for cleanup."""
+    from multiprocessing import shared_memory
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 workers share the parent's resource tracker, which only
+    # de-duplicates the registration; the parent unlinks the block.
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(objective: BatchObjective):
+    """Process pool initializer: receives the objective once per worker."""
+    global _worker_objective
+    _worker_objective = objective
+
+
+def _evaluate_chunk(buffer_name: str, shape: tuple, dtype: str, start: int, stop: int) -> np.ndarray:
+    """
+    Evaluates rows [start, stop) of the genotype matrix held in shared memory.
+
+    Args:
+        buffer_name (str): Name of the shared memory block holding the matrix.
+        shape (tuple): Shape of the full (n, d) genotype matrix.
+        dtype (str): NumPy dtype string of the matrix.
+        start (int): First row of the chunk.
+        stop (int): One past the last row of the chunk.
+
+    Returns:
+        np.ndarray: Fitness values for the chunk.
+    """
+    shm = _worker_buffers.get(buffer_name)
+    if shm is None:
+        # The parent replaced its buffer; drop stale attachments.
+        for stale in _worker_buffers.values():
+            stale.close()
+        _worker_buffers.clear()
+        shm = _worker_buffers[buffer_name] = _attach_shared_memory(buffer_name)
+    genotypes = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return np.asarray(_worker_objective(genotypes[start:stop]), dtype=float)
+
+
+class ProcessPoolEvaluator(SerialEvaluator):
+    """
+    Spreads batch evaluations across a pool of worker processes.
+
+    Intended for expensive objectives, where evaluation dominates each
+    generation. The pool is created once in `open()` and reused for the whole
+    run. Each batch is copied into a shared memory block and workers evaluate
+    contiguous row ranges ("chunks") of it, so only the (name, shape, range)
+    of a chunk is pickled, never the genotypes themselves. The objective is
+    sent to each worker once, so it must be picklable (e.g. a module-level
+    function).
+
+    Results are reassembled in row order, so fitness values are identical to
+    those of `SerialEvaluator` for the same genotypes.
+
+    Attributes:
+        max_workers (int): Number of worker processes.
+        chunksize (Optional[int]): Rows per task. None picks about four chunks
+            per worker for each batch.
+    """
+    def __init__(self, max_workers: Optional[int] = None, chunksize: Optional[int] = None, mp_context=None):
+        """
+        Initializes the evaluator configuration. No processes start until `open()`.
+
+        Args:
+            max_workers: Number of worker processes. Defaults to os.cpu_count().
+            chunksize: Rows per task. Defaults to None (automatic).
+            mp_context: Optional multiprocessing context for the pool.
+
+        Raises:
+            ValueError: If max_workers or chunksize is not positive.
+        """
+        super().__init__()
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be >= 1.")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.mp_context = mp_context
+        self._executor: Optional['ProcessPoolExecutor'] = None
+        self._shm: Optional['shared_memory.SharedMemory'] = None
+
+    def open(self, objective: BatchObjective):
+        """Starts the worker pool and ships the objective to every worker."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        super().open(objective)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(objective,),
+        )
+
+    def _buffer_for(self, nbytes: int) -> 'shared_memory.SharedMemory':
+        """Returns a shared memory block of at least nbytes, growing it if needed."""
+        from multiprocessing import shared_memory
+
+        if self._shm is None or self._shm.size < nbytes:
+            self._release_buffer()
+            self._shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        return self._shm
+
+    def _release_buffer(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def evaluate(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of genotypes on the worker pool.
+
+        Args:
+            genotypes (np.ndarray): An (n, d) array of candidate solutions.
+
+        Returns:
+            np.ndarray: An (n,) float array of fitness values, in row order.
+
+        Raises:
+            RuntimeError: If called before `open()`.
+        """
+        if self._executor is None:
+            raise RuntimeError("ProcessPoolEvaluator.evaluate() called before open().")
+        genotypes = np.ascontiguousarray(genotypes)
+        n_rows = genotypes.shape[0]
+        shm = self._buffer_for(genotypes.nbytes)
+        np.ndarray(genotypes.shape, dtype=genotypes.dtype, buffer=shm.buf)[...] = genotypes
+
+        chunksize = self.chunksize or max(1, math.ceil(n_rows / (4 * self.max_workers)))
+        futures = [
+            (start, self._executor.submit(_evaluate_chunk, shm.name, genotypes.shape,
+                                          genotypes.dtype.str, start, min(start + chunksize, n_rows)))
+            for start in range(0, n_rows, chunksize)
+        ]
+        fitness = np.empty(n_rows)
+        for start, future in futures:
+            chunk_fitness = future.result()
+            fitness[start:start + len(chunk_fitness)] = chunk_fitness
+        return fitness
+
+    def close(self):
+        """Shuts down the worker pool and frees the shared memory block."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._release_buffer()
+        super().close()
@@ -1,8 +1,21 @@
 # es_optimiser/evolution_strategy.py
+import time
 import numpy as np
-from typing import Tuple, List, Callable, Optional # Optional is useful
+from typing import Any, Dict, Tuple, List, Callable, Optional, Union # Optional is useful
 # Re-import objective function if needed directly, though usually passed in
-from .objective_functions import rastrigin # Example relative import
+from .objective_functions import rastrigin, BatchObjective, get_batch_objective # Example relative import
+from .evaluators import SerialEvaluator
+from .step_size import ConstantStepSize, make_step_size_control
+from .cache import FitnessCache
+from .stopping import StoppingCriteria
+from .profiling import PhaseProfiler
+from .telemetry import HistorySink
+from .checkpoint import Checkpointer, read_checkpoint, write_checkpoint
+from .surrogate import SurrogateScreen
+from .niching import MAX_OPTIMA, OPTIMUM_CONFIRMATION_GENERATIONS, GridIndex, clearing, select_niche_indices
+
+# Observer hook fired after every generation: callback(es, telemetry)
+GenerationCallback = Callable[['EvolutionStrategy', Dict[str, Any]], None]
 
 class Individual:
     """
@@ -54,6 +67,92 @@ class Individual:
         return f"Individual(fitness={self.fitness:.4e}, genotype={np.round(self.genotype, 3)})"
 
 
+def select_best_indices(fitness: np.ndarray, mu: int) -> np.ndarray:
+    """
+    Returns the indices of the mu lowest fitness values, best first.
+
+    Uses a partial selection (`np.argpartition`, O(n)) to find the top mu and
+    then sorts only those mu entries, instead of sorting the whole pool.
+    Works along the last axis, so a (K, n) array yields (K, mu) indices.
+
+    Args:
+        fitness (np.ndarray): Fitness values (lower is better), shape (..., n).
+        mu (int): Number of indices to select (1 <= mu <= n).
+
+    Returns:
+        np.ndarray: Integer indices of shape (..., mu), sorted by ascending fitness.
+    """
+    pool_size = fitness.shape[-1]
+    if mu < pool_size:
+        candidates = np.argpartition(fitness, mu - 1, axis=-1)[..., :mu]
+    else:
+        candidates = np.broadcast_to(np.arange(pool_size), fitness.shape)
+    order = np.argsort(np.take_along_axis(fitness, candidates, axis=-1), axis=-1, kind='stable')
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+class Population:
+    """
+    Struct-of-arrays store for a set of individuals.
+
+    Holds all genotypes in one contiguous (n, d) matrix and all fitness values
+    in an (n,) vector, so variation and selection operate on whole arrays
+    instead of per-individual Python objects. `Individual` views can still be
+    obtained by indexing.
+
+    Attributes:
+        genotypes (np.ndarray): (n, d) matrix, one candidate solution per row.
+        fitness (np.ndarray): (n,) vector of objective values (lower is better).
+        sigmas (Optional[np.ndarray]): (n,) per-individual mutation strengths, used
+                                       by self-adaptive step-size control; else None.
+    """
+    def __init__(self, genotypes: np.ndarray, fitness: np.ndarray, sigmas: Optional[np.ndarray] = None):
+        """
+        Initializes a Population from its genotype matrix and fitness vector.
+
+        Args:
+            genotypes (np.ndarray): (n, d) genotype matrix.
+            fitness (np.ndarray): (n,) fitness vector.
+            sigmas (Optional[np.ndarray]): (n,) per-individual step sizes. Defaults to None.
+        """
+        self.genotypes = genotypes
+        self.fitness = fitness
+        self.sigmas = sigmas
+
+    @classmethod
+    def empty(cls, dimensions: int) -> 'Population':
+        """Returns a population with no individuals."""
+        return cls(np.empty((0, dimensions)), np.empty(0))
+
+    def __len__(self) -> int:
+        return self.fitness.shape[0]
+
+    def __getitem__(self, index: int) -> Individual:
+        """
+        Returns an `Individual` view of one member.
+
+        The genotype is a view into the genotype matrix, not a copy.
+        """
+        return Individual(self.genotypes[index], float(self.fitness[index]))
+
+    def take(self, indices: np.ndarray) -> 'Population':
+        """Returns a new Population holding the members at `indices`, in that order."""
+        sigmas = self.sigmas[indices] if self.sigmas is not None else None
+        return Population(self.genotypes[indices], self.fitness[indices], sigmas)
+
+    def concatenate(self, other: 'Population') -> 'Population':
+        """Returns a new Population holding the members of self followed by other."""
+        sigmas = None
+        if self.sigmas is not None and other.sigmas is not None:
+            sigmas = np.concatenate((self.sigmas, other.sigmas))
+        return Population(np.concatenate((self.genotypes, other.genotypes)),
+                          np.concatenate((self.fitness, other.fitness)), sigmas)
+
+    def select_best(self, mu: int) -> 'Population':
+        """Returns the mu fittest members, sorted best first."""
+        return self.take(select_best_indices(self.fitness, mu))
+
+
 class EvolutionStrategy:
     """
     Implements a configurable Evolution Strategy (ES) for optimization.
@@ -63,18 +162,48 @@ class EvolutionStrategy:
 
     Attributes:
         objective_function (Callable[[np.ndarray], float]): The function to minimize.
+        batch_objective_function (BatchObjective): Batched version of the objective,
+            mapping an (n, d) array of genotypes to an (n,) array of fitnesses.
         dimensions (int): The number of variables in the solution vector.
         bounds (Tuple[float, float]): Lower and upper bounds for each variable.
         mu (int): The number of parents selected for the next generation.
         lambda_ (int): The number of offspring generated each generation.
         max_generations (int): The stopping criterion based on generations.
+        stopping_criteria (StoppingCriteria): Additional early termination conditions.
         sigma (float): The standard deviation (mutation strength) for Gaussian mutation.
+                       Adapted during the run by step-size controls such as 'one_fifth'.
+        step_size_control (ConstantStepSize): Step-size adaptation rule.
         selection_type (str): Specifies survival selection: '(mu, lambda)' or '(mu + lambda)'.
         rng (np.random.Generator): NumPy random number generator for reproducibility.
-
-        population (List[Individual]): The current population of parent individuals.
+        evaluator (SerialEvaluator): Strategy used to evaluate batches of genotypes
+                                     (in-process, or e.g. a ProcessPoolEvaluator).
+        fitness_cache (Optional[FitnessCache]): Optional memoization of objective values.
+        profiler (Optional[PhaseProfiler]): Optional per-phase timing instrumentation.
+        callbacks (List[GenerationCallback]): Observers notified after every generation.
+        history_sink (Optional[HistorySink]): Optional streaming store for per-generation
+                                              telemetry; replaces the in-memory history.
+        checkpointer (Optional[Checkpointer]): Optional periodic checkpoint writer.
+        surrogate (Optional[SurrogateScreen]): Optional surrogate pre-screening of offspring.
+        niche_radius (Optional[float]): Niche radius for clearing selection (None: off).
+        niche_capacity (int): Survivors allowed per niche under clearing.
+        verbose (bool): Whether configuration, progress and summary are printed.
+
+        population (Population): The current parent population (genotype matrix and
+                                 fitness vector), kept sorted best first.
+        optima (Population): Archive of the niches the population currently occupies
+                             (niching only), best first; see `get_optima`.
         best_individual_overall (Optional[Individual]): Best solution found across all generations.
-        history (List[Tuple[int, float]]): Records the best fitness per generation.
+        history (List[Tuple[int, float]]): Records the best fitness per generation
+                                           (empty when a history_sink is used).
+        evaluations (int): Number of objective evaluations performed so far
+                           (cache hits are not counted).
+        evaluation_counts (List[int]): Evaluations performed up to each history entry.
+        generation (int): Number of generations completed.
+        generations_without_improvement (int): Consecutive generations in which the
+                                               best fitness did not improve.
+        start_time (Optional[float]): `time.perf_counter()` value when run() started.
+        stop_reason (Optional[str]): Why the last run() ended, e.g. 'max_generations',
+                                     'target_fitness' or 'stagnation' (see `stopping`).
     """
     def __init__(
         self,
@@ -86,7 +215,20 @@ class EvolutionStrategy:
         max_generations: int = 100,
         sigma: float = 0.1,
         selection_type: str = '(mu, lambda)', # Default to comma selection
-        seed: Optional[int] = None
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        batch_objective_function: Optional[BatchObjective] = None,
+        evaluator: Optional[SerialEvaluator] = None,
+        step_size_control: Union[str, ConstantStepSize] = 'constant',
+        fitness_cache: Optional[FitnessCache] = None,
+        stopping_criteria: Optional[StoppingCriteria] = None,
+        profiler: Optional[PhaseProfiler] = None,
+        callbacks: Optional[List[GenerationCallback]] = None,
+        history_sink: Optional[HistorySink] = None,
+        checkpointer: Optional[Checkpointer] = None,
+        surrogate: Optional[SurrogateScreen] = None,
+        niche_radius: Optional[float] = None,
+        niche_capacity: int = 1,
+        verbose: bool = True
     ):
         """
         Initializes the Evolution Strategy algorithm configuration.
@@ -101,19 +243,67 @@ class EvolutionStrategy:
             sigma: Mutation strength (standard deviation). Defaults to 0.1.
             selection_type: Survival strategy, '(mu, lambda)' or '(mu + lambda)'.
                             Defaults to '(mu, lambda)'.
-            seed: Optional seed for the random number generator. Defaults to None.
+            seed: Optional seed (int or np.random.SeedSequence) for the random number
+                  generator. Defaults to None.
+            batch_objective_function: Optional batched version of `objective_function`
+                ((n, d) array in, (n,) array out). Defaults to the native batched
+                version from `objective_functions`, or a row-wise wrapper if none exists.
+            evaluator: Optional evaluator for fitness batches, e.g. a
+                `ProcessPoolEvaluator` for expensive objectives. It is opened at the
+                start of `run()` and closed at the end. Defaults to a `SerialEvaluator`.
+            step_size_control: How sigma is adapted: 'constant' (fixed sigma),
+                'one_fifth' (1/5th success rule), 'self_adaptive' (log-normal
+                per-individual sigmas), or a controller instance from `step_size`.
+                Defaults to 'constant'.
+            fitness_cache: Optional `FitnessCache`; genotypes already in the cache
+                are not re-evaluated. Defaults to None (no caching).
+            stopping_criteria: Optional `StoppingCriteria` (target fitness, stagnation,
+                tolerances, evaluation and time budgets) that can end a run before
+                max_generations. Defaults to None (always run max_generations).
+            profiler: Optional `PhaseProfiler` recording cumulative and per-generation
+                timings of parent sampling, mutation, clipping, evaluation, selection
+                and bookkeeping. Defaults to None (no timing calls at all).
+            callbacks: Optional list of callables `callback(es, telemetry)` fired after
+                every generation; telemetry holds the generation, evaluation count,
+                fitness values, sigma (the median parent sigma under
+                self-adaptation) and (with a profiler) the phase timings.
+                Defaults to None.
+            history_sink: Optional `HistorySink` that streams a rich per-generation
+                record (mean/median/worst fitness, sigma, spread, evaluations) to an
+                append-only file instead of keeping the history in memory. Defaults
+                to None.
+            checkpointer: Optional `Checkpointer` that saves the run state every N
+                generations and/or T seconds, so an interrupted run can be resumed
+                with `run(resume_from=...)`. Defaults to None.
+            surrogate: Optional `SurrogateScreen`; during run() only the offspring
+                it ranks as most promising (at least mu) are truly evaluated and the
+                rest get fitness np.inf. Defaults to None (evaluate all offspring).
+            niche_radius: Enables niching: survivor selection uses clearing, so at
+                most niche_capacity survivors come from any region of this radius
+                and the population spreads over several optima, which are collected
+                in `optima` (see `get_optima`). Defaults to None (no niching).
+            niche_capacity: Survivors per niche under clearing. Defaults to 1.
+            verbose: Print the configuration, progress and summary to stdout.
+                     Defaults to True; disable for many short or batch jobs.
 
         Raises:
             ValueError: If lambda_ < mu for '(mu, lambda)' selection.
             ValueError: If selection_type is not recognized.
+            ValueError: If step_size_control is not recognized.
+            ValueError: If niche_radius or niche_capacity is not positive.
         """
         self.objective_function = objective_function
+        if batch_objective_function is None:
+            batch_objective_function = get_batch_objective(objective_function)
+        self.batch_objective_function = batch_objective_function
         self.dimensions = dimensions
         self.bounds = bounds
         self.mu = mu
         self.lambda_ = lambda_
         self.max_generations = max_generations
+        self.stopping_criteria = stopping_criteria if stopping_criteria is not None else StoppingCriteria()
         self.sigma = sigma
+        self.step_size_control = make_step_size_control(step_size_control)
 
         if selection_type not in ['(mu, lambda)', '(mu + lambda)']:
             raise ValueError(f"Unknown selection_type: {selection_type}. Use '(mu, lambda)' or '(mu + lambda)'.")
@@ -122,67 +312,214 @@ class EvolutionStrategy:
         self.selection_type = selection_type
 
         self.rng = np.random.default_rng(seed) # Modern NumPy RNG
-
-        self.population: List[Individual] = []
+        self._asked: Optional[np.ndarray] = None  # Genotypes handed out by ask(), awaiting tell()
+        self._offspring_parents: Optional[np.ndarray] = None
+        self._offspring_sigmas: Union[float, np.ndarray, None] = None
+        self._offspring_predictions: Optional[np.ndarray] = None  # Surrogate predictions of screened offspring
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.fitness_cache = fitness_cache
+        self.profiler = profiler
+        self.callbacks: List[GenerationCallback] = list(callbacks) if callbacks else []
+        self.history_sink = history_sink
+        self.checkpointer = checkpointer
+        self.surrogate = surrogate
+        if (niche_radius is not None and niche_radius <= 0) or niche_capacity < 1:
+            raise ValueError("niche_radius must be > 0 and niche_capacity >= 1.")
+        self.niche_radius = niche_radius
+        self.niche_capacity = niche_capacity
+
+        self.population: Population = Population.empty(dimensions)
+        self.optima: Population = Population.empty(dimensions)
+        self._optima_ages = np.zeros(0, dtype=np.int64)  # Generations each archived niche was confirmed
         self.best_individual_overall: Optional[Individual] = None
         self.history: List[Tuple[int, float]] = []
-
-        print("--- ES Configuration ---")
-        print(f" Objective Function: {self.objective_function.__name__}")
-        print(f" Dimensions: {self.dimensions}")
-        print(f" Bounds: {self.bounds}")
-        print(f" Mu: {self.mu}, Lambda: {self.lambda_}")
-        print(f" Selection Type: {self.selection_type}")
-        print(f" Sigma (Mutation): {self.sigma}")
-        print(f" Max Generations: {self.max_generations}")
-        print(f" Seed: {seed}")
-        print("------------------------")
+        self.evaluations = 0
+        self.evaluation_counts: List[int] = []
+        self.generation = 0
+        self.generations_without_improvement = 0
+        self.start_time: Optional[float] = None
+        self.stop_reason: Optional[str] = None
+        self.verbose = verbose
+
+        if self.verbose:
+            print("--- ES Configuration ---")
+            print(f" Objective Function: {self.objective_function.__name__}")
+            print(f" Dimensions: {self.dimensions}")
+            print(f" Bounds: {self.bounds}")
+            print(f" Mu: {self.mu}, Lambda: {self.lambda_}")
+            print(f" Selection Type: {self.selection_type}")
+            print(f" Sigma (Mutation): {self.sigma}")
+            print(f" Step-Size Control: {self.step_size_control.name}")
+            print(f" Max Generations: {self.max_generations}")
+            print(f" Seed: {seed}")
+            print("------------------------")
 
 
     def _initialize_population(self):
         """Creates and evaluates the initial population of mu individuals."""
-        self.population = []
-        for _ in range(self.mu):
-            genotype = self.rng.uniform(self.bounds[0], self.bounds[1], self.dimensions)
-            fitness = self.objective_function(genotype)
-            individual = Individual(genotype, fitness)
-            self.population.append(individual)
-
+        genotypes = self._sample_initial_population()
+        fitness = self._evaluate(genotypes)
+        if self.surrogate is not None:
+            self.surrogate.observe(genotypes, fitness)
+        self._start_population(genotypes, fitness)
+
+    def _sample_initial_population(self) -> np.ndarray:
+        """Draws the mu initial genotypes uniformly within the bounds."""
+        return self.rng.uniform(self.bounds[0], self.bounds[1], size=(self.mu, self.dimensions))
+
+    def _start_population(self, genotypes: np.ndarray, fitness: np.ndarray):
+        """Builds the initial population from evaluated genotypes and records generation 0."""
         # Sort initial population and find initial best
-        self.population.sort() # Uses Individual.__lt__
-        self.best_individual_overall = self.population[0]
-        self.history.append((0, self.best_individual_overall.fitness))
-        print(f"Generation 0: Initial Best Fitness = {self.best_individual_overall.fitness:.4e}")
+        self.population = Population(genotypes, fitness).select_best(self.mu)
+        self.step_size_control.initialize(self)
+        self.best_individual_overall = self._copy_individual(0)
+        self._record_history(0)
+        if self.verbose:
+            print(f"Generation 0: Initial Best Fitness = {self.best_individual_overall.fitness:.4e}")
+
+    def _copy_individual(self, index: int) -> Individual:
+        """Returns an `Individual` holding a copy of a population member's genotype."""
+        individual = self.population[index]
+        individual.genotype = individual.genotype.copy()
+        return individual
+
+    def _evaluate(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a batch of genotypes, consulting the fitness cache if configured.
+
+        Args:
+            genotypes (np.ndarray): An (n, d) array of candidate solutions.
+
+        Returns:
+            np.ndarray: An (n,) float array of fitness values.
+        """
+        if self.fitness_cache is not None:
+            return self.fitness_cache.evaluate(genotypes, self._evaluate_uncached)
+        return self._evaluate_uncached(genotypes)
+
+    def _evaluate_uncached(self, genotypes: np.ndarray) -> np.ndarray:
+        """Evaluates a batch through the configured evaluator and counts the evaluations."""
+        self.evaluations += genotypes.shape[0]
+        return self.evaluator.evaluate(genotypes)
+
+    def _record_history(self, generation: int):
+        """
+        Records the best-so-far fitness and evaluation count for a generation.
+
+        With a history sink, a full telemetry record is streamed to it instead of
+        growing the in-memory lists.
+        """
+        if self.history_sink is None:
+            self.history.append((generation, self.best_individual_overall.fitness))
+            self.evaluation_counts.append(self.evaluations)
+            return
+        fitness = self.population.fitness
+        self.history_sink.append(
+            generation=generation,
+            evaluations=self.evaluations,
+            best_fitness=self.best_individual_overall.fitness,
+            current_best_fitness=fitness[0],
+            mean_fitness=fitness.mean(),
+            median_fitness=np.median(fitness),
+            worst_fitness=fitness.max(),
+            sigma=self._step_size_summary(),
+            spread=np.std(self.population.genotypes, axis=0).mean(),
+        )
+
+    def _step_size_summary(self) -> float:
+        """
+        Returns the step size reported in telemetry.
+
+        The global sigma, or with per-individual step sizes (self-adaptation,
+        where sigma itself stays at its initial value) the parents' median sigma.
+        """
+        if self.population.sigmas is not None:
+            return float(np.median(self.population.sigmas))
+        return self.sigma
 
-    def _generate_offspring(self) -> List[Individual]:
+    def _generate_offspring(self) -> Population:
         """
         Generates lambda_ offspring from the current parent population via mutation.
         Parents for breeding are selected uniformly at random.
+
+        The whole generation is produced with a handful of array operations:
+        all parent indices are drawn at once, a single (lambda_, d) Gaussian
+        mutation matrix is added, the result is clipped in one call and the
+        batch is evaluated with one call to the batch objective.
+
+        Returns:
+            Population: The lambda_ evaluated offspring.
+        """
+        offspring_genotypes = self._sample_offspring()
+
+        # 4. Evaluate fitness of the whole batch (or only its most promising
+        # part, as ranked by the surrogate)
+        if self.surrogate is not None:
+            offspring_fitness = self.surrogate.evaluate(offspring_genotypes, self._evaluate, self.mu)
+            self._offspring_predictions = self.surrogate.last_predictions
+        else:
+            offspring_fitness = self._evaluate(offspring_genotypes)
+            self._offspring_predictions = None
+        if self.profiler is not None:
+            self.profiler.mark('evaluation')
+        return self._make_offspring(offspring_genotypes, offspring_fitness)
+
+    def _sample_offspring(self) -> np.ndarray:
         """
-        offspring_population = []
-        for _ in range(self.lambda_):
-            # 1. Select parent randomly (uniform choice from current parents)
-            parent = self.rng.choice(self.population)
+        Creates the genotypes of lambda_ offspring (parent choice, mutation, clipping).
 
-            # 2. Mutate parent's genotype
-            # Add Gaussian noise N(0, sigma^2) to all components
-            mutation = self.rng.normal(loc=0.0, scale=self.sigma, size=self.dimensions)
-            mutated_genotype = parent.genotype + mutation
+        The parent indices and sigmas used are kept for `_make_offspring`.
 
-            # 3. Boundary Handling (Clipping)
-            # Ensure the mutated genotype stays within the defined bounds
-            mutated_genotype = np.clip(mutated_genotype, self.bounds[0], self.bounds[1])
+        Returns:
+            np.ndarray: (lambda_, d) offspring genotypes, not yet evaluated.
+        """
+        profiler = self.profiler
+
+        # 1. Select parents randomly (uniform choice from current parents)
+        parent_indices = self.rng.integers(0, len(self.population), size=self.lambda_)
+        if profiler is not None:
+            profiler.mark('parent_sampling')
+
+        # 2. Mutate parents' genotypes
+        # Add Gaussian noise N(0, sigma^2) to all components of every offspring,
+        # with sigma chosen by the step-size control (shared or per offspring)
+        sigmas = self.step_size_control.offspring_sigmas(self, parent_indices)
+        mutations = self.rng.normal(loc=0.0, scale=sigmas, size=(self.lambda_, self.dimensions))
+        offspring_genotypes = self.population.genotypes[parent_indices] + mutations
+        if profiler is not None:
+            profiler.mark('mutation')
+
+        # 3. Boundary Handling (Clipping)
+        # Ensure the mutated genotypes stay within the defined bounds
+        np.clip(offspring_genotypes, self.bounds[0], self.bounds[1], out=offspring_genotypes)
+        if profiler is not None:
+            profiler.mark('clipping')
+
+        self._offspring_parents = parent_indices
+        self._offspring_sigmas = sigmas
+        return offspring_genotypes
+
+    def _make_offspring(self, genotypes: np.ndarray, fitness: np.ndarray) -> Population:
+        """
+        Builds the offspring population from sampled genotypes and their fitness.
 
-            # 4. Evaluate fitness of the new genotype
-            offspring_fitness = self.objective_function(mutated_genotype)
+        Args:
+            genotypes (np.ndarray): (lambda_, d) genotypes from `_sample_offspring`.
+            fitness (np.ndarray): (lambda_,) fitness values.
 
-            # 5. Create new offspring individual
-            offspring_individual = Individual(mutated_genotype, offspring_fitness)
-            offspring_population.append(offspring_individual)
+        Returns:
+            Population: The evaluated offspring.
+        """
+        sigmas = self._offspring_sigmas
+        offspring_sigmas = sigmas[:, 0] if isinstance(sigmas, np.ndarray) else None
+        offspring = Population(genotypes, fitness, offspring_sigmas)
 
-        return offspring_population
+        # 5. Adapt the step size from this generation's outcome
+        self.step_size_control.update(self, offspring, self.population.fitness[self._offspring_parents],
+                                      self._offspring_predictions)
+        return offspring
 
-    def _select_survivors(self, offspring: List[Individual]):
+    def _select_survivors(self, offspring: Population):
         """
         Selects the next generation's parents based on the specified strategy.
 
@@ -190,61 +527,409 @@ class EvolutionStrategy:
         - '(mu + lambda)': Selects the best mu individuals from the *combined*
                            pool of parents and offspring.
 
+        The top mu are found with a partial selection over the fitness vector
+        (O(pool size)); only those mu are then sorted, best first. With a
+        niche_radius, the mu survivors are chosen by clearing instead (see
+        `niching.select_niche_indices`) and the distinct optima are updated.
+
         Args:
-            offspring (List[Individual]): The list of generated offspring.
+            offspring (Population): The generated offspring.
         """
-        if self.selection_type == '(mu, lambda)':
-            # Sort offspring by fitness and select the top mu
-            offspring.sort()
-            self.population = offspring[:self.mu]
+        if self.niche_radius is not None:
+            pool = offspring if self.selection_type == '(mu, lambda)' else self.population.concatenate(offspring)
+            self.population = pool.take(select_niche_indices(
+                pool.genotypes, pool.fitness, self.mu, self.niche_radius, self.niche_capacity))
+            self._update_optima(pool)
+        elif self.selection_type == '(mu, lambda)':
+            # Select the top mu offspring
+            self.population = offspring.select_best(self.mu)
 
         elif self.selection_type == '(mu + lambda)':
-            # Combine parents and offspring
-            combined_population = self.population + offspring
-            # Sort the combined pool and select the top mu
-            combined_population.sort()
-            self.population = combined_population[:self.mu]
+            # Combine parents and offspring, then select the top mu
+            self.population = self.population.concatenate(offspring).select_best(self.mu)
         # No else needed due to check in __init__
 
-    def run(self) -> 'EvolutionStrategy':
+    def _update_optima(self, pool: Population):
+        """
+        Updates the archive of distinct optima (one per niche) after a selection.
+
+        The archived optima and the members of the new population are each
+        moved to the best pool member within niche_radius, so points on a slope
+        slide into the niche of the optimum below them; candidates that end up
+        in the same niche are merged by clearing. Optima without any
+        population member within niche_radius are dropped. Every archived niche
+        counts the generations it has been confirmed in a row: the niches of
+        true optima persist, while those of slope points (which clearing keeps
+        at least niche_radius away from a better winner) come and go.
+
+        Args:
+            pool (Population): The selection pool (offspring, plus the parents
+                               under '(mu + lambda)').
+        """
+        population = self.population
+        radius = self.niche_radius
+        candidates = self.optima.concatenate(population)
+        n_candidates = len(candidates)
+
+        # Move every candidate to the best pool member in its neighbourhood
+        points = np.concatenate((candidates.genotypes, pool.genotypes))
+        fitness = np.concatenate((candidates.fitness, pool.fitness))
+        index = GridIndex(points, radius)
+        index.insert_many(np.arange(n_candidates, len(points)))
+        best = index.best_within(np.arange(n_candidates), fitness)
+        moved = (best >= 0) & (fitness[np.maximum(best, 0)] < candidates.fitness)
+        genotypes = candidates.genotypes.copy()
+        genotypes[moved] = points[best[moved]]
+        candidate_fitness = np.where(moved, fitness[np.maximum(best, 0)], candidates.fitness)
+        kept = clearing(genotypes, candidate_fitness, radius, max_winners=MAX_OPTIMA)
+
+        # Each kept optimum inherits the age of the oldest candidate in its niche
+        ages = np.concatenate((self._optima_ages, np.zeros(len(population), dtype=np.int64)))
+        index = GridIndex(genotypes, radius)
+        index.insert_many(np.arange(n_candidates))
+        ages = ages[index.best_within(kept, -ages)] + 1
+
+        # Keep only the optima confirmed by the current population
+        points = np.concatenate((genotypes[kept], population.genotypes))
+        index = GridIndex(points, radius)
+        index.insert_many(np.arange(len(kept), len(points)))
+        confirmed = index.count_within(np.arange(len(kept))) > 0
+        self.optima = Population(genotypes[kept[confirmed]], candidate_fitness[kept[confirmed]])
+        self._optima_ages = ages[confirmed]
+
+    def get_optima(self, fitness_tolerance: Optional[float] = None,
+                   max_count: Optional[int] = None,
+                   min_generations: int = OPTIMUM_CONFIRMATION_GENERATIONS) -> List[Individual]:
+        """
+        Returns the distinct optima found by a niching run, best first.
+
+        Only niches the population has occupied for at least min_generations
+        consecutive generations are returned (see `_update_optima`). Any two
+        returned solutions are at least niche_radius apart.
+
+        Args:
+            fitness_tolerance (Optional[float]): Only return optima whose fitness is
+                within this distance of the best one (e.g. to keep only the global
+                optima of a function with several). Defaults to None (all).
+            max_count (Optional[int]): Maximum number of optima returned. Defaults to None.
+            min_generations (int): Generations a niche must have been confirmed.
+                Defaults to `niching.OPTIMUM_CONFIRMATION_GENERATIONS`.
+
+        Returns:
+            List[Individual]: The optima (empty if niching is disabled).
+        """
+        optima = [Individual(self.optima.genotypes[i].copy(), float(self.optima.fitness[i]))
+                  for i in np.flatnonzero(self._optima_ages >= min_generations)]
+        if fitness_tolerance is not None and optima:
+            optima = [optimum for optimum in optima if optimum.fitness <= optima[0].fitness + fitness_tolerance]
+        return optima[:max_count]
+
+    def _evolve_generation(self, generation: int):
+        """
+        Performs one generation: variation, selection and bookkeeping.
+
+        Args:
+            generation (int): The number of the generation being produced (1-based).
+        """
+        if self.profiler is not None:
+            self.profiler.start_generation(self.evaluations)
+
+        # 1. Generate lambda offspring using mutation
+        offspring = self._generate_offspring()
+        self._finish_generation(generation, offspring)
+
+    def _finish_generation(self, generation: int, offspring: Population):
+        """
+        Completes a generation from its evaluated offspring: selection and bookkeeping.
+
+        Args:
+            generation (int): The number of the generation being produced (1-based).
+            offspring (Population): The generation's evaluated offspring.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark('bookkeeping')
+
+        # 2. Select mu survivors for the next generation's population
+        self._select_survivors(offspring)
+        if profiler is not None:
+            profiler.mark('selection')
+
+        # 3. Update best overall individual found so far
+        current_best_in_pop = self.population[0] # Population is sorted after selection
+        if current_best_in_pop < self.best_individual_overall:
+            self.best_individual_overall = self._copy_individual(0)
+            self.generations_without_improvement = 0
+        else:
+            self.generations_without_improvement += 1
+
+        # 4. Record history
+        self.generation = generation
+        self._record_history(generation)
+
+        # 5. Instrumentation and observers (skipped entirely when not configured)
+        phase_timings = None
+        if profiler is not None:
+            profiler.mark('bookkeeping')
+            phase_timings = profiler.end_generation(generation, self.evaluations)
+        if self.callbacks:
+            telemetry = {
+                'generation': generation,
+                'evaluations': self.evaluations,
+                'best_fitness': self.best_individual_overall.fitness,
+                'current_best_fitness': current_best_in_pop.fitness,
+                'sigma': self._step_size_summary(),
+                'phase_timings': phase_timings,
+            }
+            for callback in self.callbacks:
+                callback(self, telemetry)
+
+        # --- Optional: Print progress periodically ---
+        if self.verbose and (generation % 20 == 0 or generation == self.max_generations):
+             print(f"Generation {generation}: "
+                   f"Current Best Fitness = {current_best_in_pop.fitness:.4e}, "
+                   f"Overall Best Fitness = {self.best_individual_overall.fitness:.4e}")
+
+    def run(self, resume_from: Optional[str] = None) -> 'EvolutionStrategy':
         """
         Executes the main loop of the Evolution Strategy.
 
         Initializes the population, then iterates through generations, performing
         offspring generation and survivor selection. Tracks the best fitness found.
+        The loop ends after max_generations, or earlier when one of the configured
+        stopping criteria holds; the reason is recorded in `stop_reason`.
+        The evaluator is opened before the first evaluation and closed afterwards,
+        even if the run fails. With a checkpointer, the state is saved after every
+        generation for which a checkpoint is due.
+
+        Args:
+            resume_from (Optional[str]): Checkpoint file to continue from instead of
+                starting a new run (see `load_checkpoint`). Defaults to None. With a
+                history_sink, open it with `HistorySink(path, append=True)` so the
+                records written before the checkpoint are kept; a sink opened
+                without append starts an empty file and the resume is rejected.
 
         Returns:
             EvolutionStrategy: Returns self to allow method chaining or
                                         easy access to results after running.
         """
-        self._initialize_population()
+        self.start_time = time.perf_counter()
+        self.stop_reason = None
+
+        # The evaluator (and e.g. its worker pool) lives for the whole run
+        self.evaluator.open(self.batch_objective_function)
+        try:
+            if resume_from is not None:
+                self.load_checkpoint(resume_from)
+                if self.verbose:
+                    print(f"Resumed from checkpoint {resume_from} at generation {self.generation}.")
+            else:
+                self._initialize_population()
+            generation = self.generation
+            self.stop_reason = self.stopping_criteria.check(self, generation)
+
+            if self.verbose:
+                print("Starting Evolution...")
+            while self.stop_reason is None:
+                generation += 1
+                self._evolve_generation(generation)
+                self.stop_reason = self.stopping_criteria.check(self, generation)
+                if self.checkpointer is not None and self.checkpointer.due(generation):
+                    self.checkpointer.save(self)
+        finally:
+            self.evaluator.close()
+            if self.history_sink is not None:
+                self.history_sink.flush()
+
+        self._print_summary()
+        return self # Return self for convenience
 
-        print("Starting Evolution...")
-        for generation in range(1, self.max_generations + 1):
-            # 1. Generate lambda offspring using mutation
-            offspring = self._generate_offspring()
+    def _print_summary(self):
+        """Prints why the run stopped and the best solution found (if verbose)."""
+        if not self.verbose:
+            return
+        print(f"Evolution finished after {self.generation} generations (stop reason: {self.stop_reason}).")
+        print(f"Final Best Fitness: {self.best_individual_overall.fitness:.6e}")
+        print(f"Best Solution Found: {np.round(self.best_individual_overall.genotype, 5)}")
 
-            # 2. Select mu survivors for the next generation's population
-            self._select_survivors(offspring)
+    def ask(self) -> np.ndarray:
+        """
+        Returns the next batch of genotypes to evaluate (ask/tell interface).
 
-            # 3. Update best overall individual found so far
-            current_best_in_pop = self.population[0] # Population is sorted after selection
-            if current_best_in_pop < self.best_individual_overall:
-                self.best_individual_overall = current_best_in_pop
+        Lets the caller evaluate candidates however it likes (external solvers,
+        services, `async_driver.run_async`) instead of through `objective_function`.
+        The first call returns the mu genotypes of the initial population; every
+        later call returns the lambda_ offspring of the next generation. Each
+        call must be followed by `tell()` with their fitness values. The random
+        draws are the same as in `run()`, so telling the objective's values
+        reproduces `run()` exactly (the fitness cache is not consulted).
 
-            # 4. Record history
-            self.history.append((generation, self.best_individual_overall.fitness))
+        Returns:
+            np.ndarray: (n, d) genotypes to evaluate; treat as read-only.
 
-            # --- Optional: Print progress periodically ---
-            if generation % 20 == 0 or generation == self.max_generations:
-                 print(f"Generation {generation}: "
-                       f"Current Best Fitness = {current_best_in_pop.fitness:.4e}, "
-                       f"Overall Best Fitness = {self.best_individual_overall.fitness:.4e}")
+        Raises:
+            RuntimeError: If the previous batch has not been told yet, or the
+                          strategy has already stopped.
+        """
+        if self._asked is not None:
+            raise RuntimeError("ask() called again before tell() for the previous batch.")
+        if self.stop_reason is not None:
+            raise RuntimeError(f"The strategy has stopped ({self.stop_reason}).")
+        if self.best_individual_overall is None:
+            self.start_time = time.perf_counter()
+            self._asked = self._sample_initial_population()
+        else:
+            if self.profiler is not None:
+                self.profiler.start_generation(self.evaluations)
+            self._asked = self._sample_offspring()
+        return self._asked
+
+    def tell(self, fitness: np.ndarray):
+        """
+        Reports the fitness of the batch returned by the last `ask()` and advances.
 
-        print("Evolution finished.")
-        print(f"Final Best Fitness: {self.best_individual_overall.fitness:.6e}")
-        print(f"Best Solution Found: {np.round(self.best_individual_overall.genotype, 5)}")
-        return self # Return self for convenience
+        Performs survivor selection and bookkeeping (history, callbacks, step-size
+        adaptation) for the batch, then checks the stopping criteria; poll
+        `stop_reason` to know when to stop asking.
+
+        Args:
+            fitness (np.ndarray): One fitness value per asked genotype, in order.
+
+        Raises:
+            RuntimeError: If there is no outstanding `ask()`.
+            ValueError: If the number of fitness values does not match the batch.
+        """
+        if self._asked is None:
+            raise RuntimeError("tell() called without a preceding ask().")
+        fitness = np.asarray(fitness, dtype=np.float64)
+        if fitness.shape != (self._asked.shape[0],):
+            raise ValueError(f"Expected {self._asked.shape[0]} fitness values, got shape {fitness.shape}.")
+        genotypes, self._asked = self._asked, None
+        self.evaluations += fitness.shape[0]
+
+        if self.best_individual_overall is None:
+            self._start_population(genotypes, fitness)
+            self.stop_reason = self.stopping_criteria.check(self, 0)
+            return
+        if self.profiler is not None:
+            self.profiler.mark('evaluation')
+        generation = self.generation + 1
+        self._offspring_predictions = None
+        self._finish_generation(generation, self._make_offspring(genotypes, fitness))
+        self.stop_reason = self.stopping_criteria.check(self, generation)
+
+    def _checkpoint_config(self) -> Dict[str, Any]:
+        """Returns the configuration a checkpoint must match to be resumed."""
+        return {
+            'strategy': type(self).__name__,
+            'objective_function': getattr(self.objective_function, '__name__', repr(self.objective_function)),
+            'dimensions': self.dimensions,
+            'bounds': [float(bound) for bound in self.bounds],
+            'mu': self.mu,
+            'lambda_': self.lambda_,
+            'selection_type': self.selection_type,
+            'step_size_control': self.step_size_control.name,
+            'niche_radius': self.niche_radius,
+            'niche_capacity': self.niche_capacity,
+        }
+
+    def _checkpoint_state(self) -> Dict[str, Any]:
+        """
+        Collects everything needed to continue the run exactly where it is.
+
+        Subclasses with additional adaptive state extend this dictionary (and
+        `_restore_checkpoint_state`).
+        """
+        state = {
+            'config': self._checkpoint_config(),
+            'max_generations': self.max_generations,
+            'rng_state': self.rng.bit_generator.state,
+            'genotypes': self.population.genotypes,
+            'fitness': self.population.fitness,
+            'best_genotype': self.best_individual_overall.genotype,
+            'best_fitness': self.best_individual_overall.fitness,
+            'sigma': self.sigma,
+            'evaluations': self.evaluations,
+            'generation': self.generation,
+            'generations_without_improvement': self.generations_without_improvement,
+            'elapsed_time': time.perf_counter() - self.start_time,
+            'history_generations': np.array([generation for generation, _ in self.history], dtype=np.int64),
+            'history_fitness': np.array([fitness for _, fitness in self.history], dtype=np.float64),
+            'evaluation_counts': np.array(self.evaluation_counts, dtype=np.int64),
+        }
+        if self.population.sigmas is not None:
+            state['sigmas'] = self.population.sigmas
+        if self.niche_radius is not None:
+            state['optima_genotypes'] = self.optima.genotypes
+            state['optima_fitness'] = self.optima.fitness
+            state['optima_ages'] = self._optima_ages
+        return state
+
+    def _restore_checkpoint_state(self, state: Dict[str, Any]):
+        """Restores the run state collected by `_checkpoint_state`."""
+        self.rng.bit_generator.state = state['rng_state']
+        self.population = Population(state['genotypes'], state['fitness'], state.get('sigmas'))
+        self.best_individual_overall = Individual(state['best_genotype'], float(state['best_fitness']))
+        self.sigma = float(state['sigma'])
+        self.evaluations = int(state['evaluations'])
+        self.generation = int(state['generation'])
+        self.generations_without_improvement = int(state['generations_without_improvement'])
+        self.start_time = time.perf_counter() - float(state['elapsed_time'])
+        self.history = list(zip(state['history_generations'].tolist(), state['history_fitness'].tolist()))
+        self.evaluation_counts = state['evaluation_counts'].tolist()
+        if 'optima_genotypes' in state:
+            self.optima = Population(state['optima_genotypes'], state['optima_fitness'])
+            self._optima_ages = state.get('optima_ages', np.zeros(len(self.optima), dtype=np.int64))
+        if self.history_sink is not None:
+            # Drop records written after the checkpoint (generation 0 is record 0)
+            self.history_sink.truncate(self.generation + 1)
+
+    def save_checkpoint(self, path: str):
+        """
+        Atomically saves the current run state to a checkpoint file.
+
+        The checkpoint holds the population arrays, best individual, history,
+        counters, the step size, the RNG bit-generator state and the
+        configuration. Fitness cache contents are not saved, so with a
+        `fitness_cache` the resumed run produces the same results but may
+        count more evaluations; a surrogate's archive is not saved either, so
+        a resumed surrogate-assisted run starts with an empty archive.
+
+        Args:
+            path (str): Checkpoint file (.npz archive).
+        """
+        if self.history_sink is not None:
+            self.history_sink.flush()
+        write_checkpoint(path, self._checkpoint_state())
+
+    def load_checkpoint(self, path: str):
+        """
+        Restores the run state from a checkpoint written by `save_checkpoint`.
+
+        The strategy must be configured like the one that wrote the checkpoint
+        (max_generations may differ, e.g. to extend a finished run).
+
+        A history_sink must already hold the records up to the checkpoint's
+        generation, i.e. be opened with `HistorySink(path, append=True)`.
+
+        Args:
+            path (str): Checkpoint file.
+
+        Raises:
+            ValueError: If the checkpoint was written with a different configuration,
+                        or the history_sink is missing records before the checkpoint.
+        """
+        state = read_checkpoint(path)
+        expected = self._checkpoint_config()
+        if state['config'] != expected:
+            raise ValueError(f"Checkpoint {path} was written with configuration {state['config']}; "
+                             f"this strategy has {expected}.")
+        generation = int(state['generation'])
+        if self.history_sink is not None and len(self.history_sink) < generation + 1:
+            raise ValueError(f"history_sink {self.history_sink.path} holds {len(self.history_sink)} records, "
+                             f"but the checkpoint is at generation {generation}. Open the sink with "
+                             f"HistorySink(path, append=True) to resume into an existing telemetry file.")
+        self._restore_checkpoint_state(state)
 
     def get_best_solution(self) -> Optional[Individual]:
         """
@@ -259,9 +944,33 @@ class EvolutionStrategy:
         """
         Returns the convergence history.
 
+        With a history sink, the list is built from the telemetry file; use
+        `history_sink.read()` for memory-mapped access to all recorded fields.
+
         Returns:
             List[Tuple[int, float]]: List of (generation, best_fitness) tuples.
         """
+        if self.history_sink is not None:
+            records = self.history_sink.read()
+            return list(zip(records['generation'].tolist(), records['best_fitness'].tolist()))
         return self.history
 
+    def evaluations_to_reach(self, target_fitness: float) -> Optional[int]:
+        """
+        Returns the number of objective evaluations needed to reach a target.
 
+        Args:
+            target_fitness (float): The fitness value to reach (<=).
+
+        Returns:
+            Optional[int]: Evaluations performed by the end of the first generation
+            whose best-so-far fitness is <= target_fitness, or None if never reached.
+        """
+        if self.history_sink is not None:
+            records = self.history_sink.read()
+            reached = np.flatnonzero(records['best_fitness'] <= target_fitness)
+            return int(records['evaluations'][reached[0]]) if reached.size else None
+        for (_, best_fitness), evaluations in zip(self.history, self.evaluation_counts):
+            if best_fitness <= target_fitness:
+                return evaluations
+        return None
@@ -0,0 +1,123 @@
+# es_optimiser/experiments.py
+import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def spawn_seeds(root_seed: Optional[int], n: int) -> List[np.random.SeedSequence]:
+    """
+    Derives n independent, reproducible seed sequences from one root seed.
+
+    Uses `np.random.SeedSequence.spawn`, so the child streams are statistically
+    independent of each other and the same root seed always yields the same
+    children, in the same order.
+
+    Args:
+        root_seed (Optional[int]): Entropy for the root sequence. None draws fresh
+                                   entropy from the OS (not reproducible).
+        n (int): Number of child sequences to spawn.
+
+    Returns:
+        List[np.random.SeedSequence]: One child sequence per job.
+    """
+    return np.random.SeedSequence(root_seed).spawn(n)
+
+
+def describe_seed(seed: Any) -> str:
+    """
+    Returns a compact, single-line description of a seed for logs and reports.
+
+    Args:
+        seed (Any): An int, None, or a `np.random.SeedSequence`.
+
+    Returns:
+        str: e.g. "123" or "123/(4,)" (root entropy / spawn key).
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return f"{seed.entropy}/{seed.spawn_key}"
+    return str(seed)
+
+
+def _init_worker(log_queue, level: int):
+    """
+    Process pool initializer: routes the worker's log records to the parent.
+
+    Handlers inherited from the parent (e.g. a FileHandler under fork) are
+    detached so that only the parent's listener writes to the log file.
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+
+
+def run_grid(
+    job: Callable[..., Any],
+    jobs: Sequence[Dict[str, Any]],
+    root_seed: Optional[int] = None,
+    seed_arg: str = "random_seed",
+    max_workers: Optional[int] = None,
+    mp_context=None,
+    skip: Optional[Callable[[Dict[str, Any]], bool]] = None,
+) -> List[Tuple[Dict[str, Any], Any]]:
+    """
+    Runs a grid of experiment jobs concurrently on a process pool.
+
+    Each job receives its keyword arguments from `jobs` plus its own child
+    `SeedSequence` (spawned from `root_seed`) under `seed_arg`, so a grid is
+    reproducible regardless of scheduling order or worker count. Log records
+    emitted in the workers are forwarded through a queue to the handlers
+    configured in the calling process, keeping a single consistent log.
+
+    Args:
+        job: Picklable callable (e.g. a module-level function) run once per job.
+        jobs: One dict of keyword arguments per job.
+        root_seed: Root entropy for the per-job seed sequences. Defaults to None.
+        seed_arg: Name of the keyword argument that receives each job's seed.
+                  Defaults to "random_seed".
+        max_workers: Number of worker processes. Defaults to os.cpu_count().
+        mp_context: Optional multiprocessing context for the pool.
+        skip: Optional predicate called in this process with each job's kwargs
+              (including its seed); jobs for which it returns True are not run,
+              e.g. because a `ResultStore` already holds their result. Seeds are
+              spawned for all jobs first, so skipping never changes the seeds of
+              the others.
+
+    Returns:
+        List[Tuple[Dict[str, Any], Any]]: (job kwargs including the seed, job result)
+        pairs, in completion order. Jobs that raise are logged and omitted.
+    """
+    seeds = spawn_seeds(root_seed, len(jobs))
+    job_kwargs = [dict(kwargs, **{seed_arg: seed}) for kwargs, seed in zip(jobs, seeds)]
+    if skip is not None:
+        job_kwargs = [kwargs for kwargs in job_kwargs if not skip(kwargs)]
+    if not job_kwargs:
+        return []
+
+    context = mp_context or multiprocessing.get_context()
+    log_queue = context.Queue()
+    root_logger = logging.getLogger()
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+
+    results = []
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(log_queue, root_logger.level),
+        ) as executor:
+            futures = {executor.submit(job, **kwargs): kwargs for kwargs in job_kwargs}
+            for future in as_completed(futures):
+                kwargs = futures[future]
+                try:
+                    results.append((kwargs, future.result()))
+                except Exception:
+                    logging.exception(f"Grid job failed: {dict(kwargs, **{seed_arg: describe_seed(kwargs[seed_arg])})}")
+    finally:
+        listener.stop()
+    return results
@@ -0,0 +1,335 @@
+# es_optimiser/islands.py
+import multiprocessing
+import queue
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .evolution_strategy import EvolutionStrategy, Individual, Population
+from .experiments import spawn_seeds
+from .stopping import MAX_GENERATIONS
+
+TOPOLOGIES = ('ring', 'full', 'random')
+# EvolutionStrategy options that only take effect in run(), which the islands do not call
+UNSUPPORTED_ES_KWARGS = ('stopping_criteria', 'checkpointer', 'history_sink')
+
+
+def migration_targets(topology: str, n_islands: int, rng: np.random.Generator) -> List[List[int]]:
+    """
+    Returns, for every island, the islands it sends migrants to in one migration.
+
+    Args:
+        topology (str): 'ring' (island i sends to i + 1), 'full' (every island
+            sends to every other island) or 'random' (every island sends to one
+            other island drawn uniformly at random).
+        n_islands (int): Number of islands.
+        rng (np.random.Generator): Generator for the 'random' topology. Every
+            island holds an identically seeded generator, so all islands agree
+            on the same targets without communicating.
+
+    Returns:
+        List[List[int]]: targets[i] lists the destination islands of island i.
+
+    Raises:
+        ValueError: If the topology is not recognized.
+    """
+    if topology == 'ring':
+        return [[(island + 1) % n_islands] for island in range(n_islands)]
+    if topology == 'full':
+        return [[other for other in range(n_islands) if other != island] for island in range(n_islands)]
+    if topology == 'random':
+        # Draw from the n - 1 other islands, skipping over the sender itself
+        draws = rng.integers(0, n_islands - 1, size=n_islands)
+        return [[int(draw + (draw >= island))] for island, draw in enumerate(draws)]
+    raise ValueError(f"Unknown topology: {topology}. Use one of {TOPOLOGIES}.")
+
+
+def _pack_migrants(population: Population, count: int) -> bytes:
+    """Packs the `count` best members as the raw bytes of a (count, 1 + d) float64 array."""
+    packed = np.empty((count, 1 + population.genotypes.shape[1]))
+    packed[:, 0] = population.fitness[:count]
+    packed[:, 1:] = population.genotypes[:count]
+    return packed.tobytes()
+
+
+def _unpack_migrants(payload: bytes, dimensions: int) -> Population:
+    """Inverse of `_pack_migrants`."""
+    packed = np.frombuffer(payload, dtype=np.float64).reshape(-1, 1 + dimensions)
+    return Population(packed[:, 1:].copy(), packed[:, 0].copy())
+
+
+def _migrate(es: EvolutionStrategy, island: int, epoch: int, targets: List[List[int]], migrants: int,
+             inboxes: list, pending: Dict[Tuple[int, int], bytes]) -> int:
+    """
+    Sends this island's best members to its targets, then merges the migrants it receives.
+
+    Migrants from all sources are added to the population and the mu best of
+    the combined pool are kept, so immigrants replace the island's worst members.
+    Messages from islands that are already one migration ahead are kept in
+    `pending` until their epoch is reached.
+
+    Returns:
+        int: Number of immigrants received.
+    """
+    payload = _pack_migrants(es.population, migrants)
+    for target in targets[island]:
+        inboxes[target].put((island, epoch, payload))
+
+    sources = [source for source, destinations in enumerate(targets) if island in destinations]
+    immigrants = []
+    for source in sources:
+        while (source, epoch) not in pending:
+            sender, sender_epoch, message = inboxes[island].get()
+            pending[(sender, sender_epoch)] = message
+        immigrants.append(_unpack_migrants(pending.pop((source, epoch)), es.dimensions))
+    if not immigrants:
+        return 0
+
+    pool = es.population
+    for population in immigrants:
+        if pool.sigmas is not None:
+            # Self-adaptive islands: immigrants start from the island's initial sigma
+            population.sigmas = np.full(len(population), es.sigma)
+        pool = pool.concatenate(population)
+    es.population = pool.select_best(es.mu)
+    return sum(len(population) for population in immigrants)
+
+
+def _run_island(island: int, n_islands: int, es_config: Dict[str, Any], seed: np.random.SeedSequence,
+                migration_seed: np.random.SeedSequence, topology: str, migration_interval: int, migrants: int,
+                inboxes: list, results: Any):
+    """
+    Island process: evolves one `EvolutionStrategy` and migrates on schedule.
+
+    Every island runs exactly max_generations generations (migration is
+    synchronous, so islands cannot stop independently) and reports its
+    results, or its traceback on failure, to the `results` queue.
+    """
+    try:
+        # The per-island progress output would interleave; the model prints a summary instead
+        es = EvolutionStrategy(seed=seed, **dict(es_config, verbose=False))
+        migration_rng = np.random.default_rng(migration_seed)
+        pending: Dict[Tuple[int, int], bytes] = {}
+        immigrants = 0
+
+        es.start_time = time.perf_counter()
+        es.evaluator.open(es.batch_objective_function)
+        try:
+            es._initialize_population()
+            for generation in range(1, es.max_generations + 1):
+                es._evolve_generation(generation)
+                if generation % migration_interval == 0 and generation < es.max_generations:
+                    targets = migration_targets(topology, n_islands, migration_rng)
+                    immigrants += _migrate(es, island, generation // migration_interval, targets,
+                                           migrants, inboxes, pending)
+        finally:
+            es.evaluator.close()
+        es.stop_reason = MAX_GENERATIONS
+
+        results.put(('result', island, {
+            'best_genotype': es.best_individual_overall.genotype,
+            'best_fitness': es.best_individual_overall.fitness,
+            'history': es.get_history(),
+            'evaluation_counts': es.evaluation_counts,
+            'evaluations': es.evaluations,
+            'immigrants': immigrants,
+        }))
+    except BaseException:
+        results.put(('error', island, traceback.format_exc()))
+
+
+class IslandModel:
+    """
+    Island-model Evolution Strategy: several populations evolving in parallel processes.
+
+    Each island is an independent `EvolutionStrategy` running in its own
+    process (with its own child seed). Every `migration_interval` generations
+    each island sends copies of its `migration_rate` best individuals to the
+    islands given by the topology, and the immigrants replace the worst
+    members of the receiving population. Migrants travel as the raw bytes of
+    a single (k, 1 + d) float64 array (fitness and genotype per row), not as
+    pickled `Individual` objects. Migration is synchronous and the random
+    topology is drawn from a shared seed, so a run is reproducible from its seed.
+
+    Attributes:
+        n_islands (int): Number of islands (processes).
+        topology (str): Migration topology: 'ring', 'full' or 'random'.
+        migration_interval (int): Generations between migrations.
+        migration_rate (int): Migrants each island sends per destination.
+        best_individual_overall (Optional[Individual]): Best solution over all islands.
+        history (List[Tuple[int, float]]): Best-so-far fitness over all islands per generation.
+        evaluations (int): Objective evaluations over all islands.
+        island_results (List[Dict[str, Any]]): Per-island results (best genotype and
+            fitness, history, evaluations, immigrants received).
+        elapsed_time (Optional[float]): Wall-clock seconds of the last run().
+        verbose (bool): Whether the configuration and summary are printed.
+    """
+    def __init__(
+        self,
+        objective_function: Callable[[np.ndarray], float],
+        dimensions: int,
+        bounds: Tuple[float, float],
+        mu: int,
+        lambda_: int,
+        n_islands: int = 4,
+        max_generations: int = 100,
+        sigma: float = 0.1,
+        selection_type: str = '(mu, lambda)',
+        topology: str = 'ring',
+        migration_interval: int = 10,
+        migration_rate: int = 2,
+        seed: Optional[int] = None,
+        mp_context=None,
+        es_kwargs: Optional[Dict[str, Any]] = None,
+        verbose: bool = True
+    ):
+        """
+        Initializes the island model configuration.
+
+        Args:
+            objective_function: The target function to minimize. Must be picklable
+                (e.g. a module-level function) to reach the island processes.
+            dimensions: Dimensionality of the search space.
+            bounds: Tuple (min_val, max_val) applied to all dimensions.
+            mu: Number of parents per island.
+            lambda_: Number of offspring per island and generation.
+            n_islands: Number of islands. Defaults to 4.
+            max_generations: Generations evolved on every island. Defaults to 100.
+            sigma: Mutation strength. Defaults to 0.1.
+            selection_type: '(mu, lambda)' or '(mu + lambda)'. Defaults to '(mu, lambda)'.
+            topology: 'ring', 'full' or 'random'. Defaults to 'ring'.
+            migration_interval: Generations between migrations. Defaults to 10.
+            migration_rate: Best individuals sent to each destination (at most mu).
+                Defaults to 2.
+            seed: Root seed; islands and the random topology use child seeds
+                spawned from it. Defaults to None.
+            mp_context: Optional multiprocessing context for the island processes.
+            es_kwargs: Further keyword arguments for each island's `EvolutionStrategy`
+                (e.g. step_size_control). Must be picklable. Defaults to None.
+                Islands never print progress (their output would interleave).
+                stopping_criteria, checkpointer and history_sink are not supported:
+                every island runs exactly max_generations generations.
+            verbose: Print the configuration and the final summary. Defaults to True.
+
+        Raises:
+            ValueError: If the topology is not recognized, n_islands < 2,
+                        migration_interval / migration_rate is not positive, or
+                        es_kwargs sets an option listed in UNSUPPORTED_ES_KWARGS.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology: {topology}. Use one of {TOPOLOGIES}.")
+        if n_islands < 2:
+            raise ValueError("An island model needs at least 2 islands.")
+        if migration_interval < 1 or migration_rate < 1:
+            raise ValueError("migration_interval and migration_rate must be >= 1.")
+        unsupported = [key for key in UNSUPPORTED_ES_KWARGS if (es_kwargs or {}).get(key) is not None]
+        if unsupported:
+            raise ValueError(f"Unsupported es_kwargs for IslandModel: {', '.join(unsupported)}. "
+                             f"Islands run exactly max_generations generations and only report at the end.")
+        self.n_islands = n_islands
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.migration_rate = min(migration_rate, mu)
+        self.seed = seed
+        self.mp_context = mp_context
+        self.es_config: Dict[str, Any] = {
+            'objective_function': objective_function,
+            'dimensions': dimensions,
+            'bounds': bounds,
+            'mu': mu,
+            'lambda_': lambda_,
+            'max_generations': max_generations,
+            'sigma': sigma,
+            'selection_type': selection_type,
+            **(es_kwargs or {}),
+        }
+
+        self.best_individual_overall: Optional[Individual] = None
+        self.history: List[Tuple[int, float]] = []
+        self.evaluations = 0
+        self.island_results: List[Dict[str, Any]] = []
+        self.elapsed_time: Optional[float] = None
+        self.verbose = verbose
+
+        if self.verbose:
+            print("--- Island Model Configuration ---")
+            print(f" Islands: {self.n_islands}, Topology: {self.topology}")
+            print(f" Migration: {self.migration_rate} migrant(s) every {self.migration_interval} generations")
+            print(f" Mu: {mu}, Lambda: {lambda_} (per island)")
+            print(f" Max Generations: {max_generations}")
+            print(f" Seed: {seed}")
+            print("----------------------------------")
+
+    def run(self) -> 'IslandModel':
+        """
+        Starts one process per island, waits for all of them and combines their results.
+
+        Returns:
+            IslandModel: Returns self for convenient access to the results.
+
+        Raises:
+            RuntimeError: If an island fails or its process dies; the remaining
+                          island processes are terminated.
+        """
+        context = self.mp_context if self.mp_context is not None else multiprocessing.get_context()
+        seeds = spawn_seeds(self.seed, self.n_islands + 1)
+        inboxes = [context.Queue() for _ in range(self.n_islands)]
+        results_queue = context.Queue()
+        processes = [
+            context.Process(
+                target=_run_island,
+                args=(island, self.n_islands, self.es_config, seeds[island], seeds[-1], self.topology,
+                      self.migration_interval, self.migration_rate, inboxes, results_queue),
+                daemon=True,
+            )
+            for island in range(self.n_islands)
+        ]
+
+        start_time = time.perf_counter()
+        results: Dict[int, Dict[str, Any]] = {}
+        for process in processes:
+            process.start()
+        try:
+            while len(results) < self.n_islands:
+                try:
+                    kind, island, payload = results_queue.get(timeout=1.0)
+                except queue.Empty:
+                    for island, process in enumerate(processes):
+                        if island not in results and process.exitcode not in (None, 0):
+                            raise RuntimeError(f"Island {island} process exited with code {process.exitcode}.")
+                    continue
+                if kind == 'error':
+                    raise RuntimeError(f"Island {island} failed:\n{payload}")
+                results[island] = payload
+        finally:
+            for process in processes:
+                if len(results) < self.n_islands and process.is_alive():
+                    process.terminate()
+                process.join()
+        self.elapsed_time = time.perf_counter() - start_time
+
+        self.island_results = [results[island] for island in range(self.n_islands)]
+        best = min(self.island_results, key=lambda result: result['best_fitness'])
+        self.best_individual_overall = Individual(best['best_genotype'], best['best_fitness'])
+        self.evaluations = sum(result['evaluations'] for result in self.island_results)
+        best_per_generation = np.min([[fitness for _, fitness in result['history']]
+                                      for result in self.island_results], axis=0)
+        generations = [generation for generation, _ in self.island_results[0]['history']]
+        self.history = list(zip(generations, best_per_generation.tolist()))
+
+        if self.verbose:
+            print(f"Island model finished in {self.elapsed_time:.2f} s "
+                  f"({self.evaluations} evaluations over {self.n_islands} islands).")
+            print(f"Final Best Fitness: {self.best_individual_overall.fitness:.6e}")
+            print(f"Best Solution Found: {np.round(self.best_individual_overall.genotype, 5)}")
+        return self
+
+    def get_best_solution(self) -> Optional[Individual]:
+        """Returns the best individual found on any island, or None before run()."""
+        return self.best_individual_overall
+
+    def get_history(self) -> List[Tuple[int, float]]:
+        """Returns (generation, best-so-far fitness over all islands) tuples."""
+        return self.history
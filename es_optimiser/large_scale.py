@@ -0,0 +1,168 @@
+# es_optimiser/large_scale.py
+import numpy as np
+from typing import Any, Dict, Union
+
+from .evolution_strategy import EvolutionStrategy, Population, select_best_indices
+
+# Elements per block of rows gathered at once (bounds the temporary arrays)
+CHUNK_ELEMENTS = 1 << 16
+
+
+class LargeScaleEvolutionStrategy(EvolutionStrategy):
+    """
+    Evolution Strategy for very high-dimensional problems (d ~ 10^5 - 10^6).
+
+    Works like `EvolutionStrategy`, but the genotype matrices are allocated
+    once and reused every generation instead of being reallocated:
+
+    - offspring: Gaussian noise is drawn straight into a preallocated
+      (lambda_, d) buffer with `Generator.standard_normal(out=)`, scaled in
+      place, the parent rows are added in place block by block and clipping
+      is done in place, so no temporary (lambda_, d) arrays are created;
+    - survivors: the mu selected rows are copied into one of two preallocated
+      (mu, d) parent buffers (double-buffered, so '(mu + lambda)' can read the
+      old parents while writing the new ones) instead of concatenating parents
+      and offspring.
+
+    Peak memory therefore stays flat across generations. With dtype float32
+    the buffers (and the objective's input) take half the memory; with the
+    default float64 the run is bit-for-bit identical to `EvolutionStrategy`
+    with the same seed.
+
+    Note that `population.genotypes` and the offspring passed to the objective
+    or returned by `ask()` are views of the reused buffers: copy them if they
+    must outlive the generation.
+
+    Attributes:
+        dtype (np.dtype): Floating-point type of the genotype buffers.
+    """
+    def __init__(self, *args, dtype: Union[str, np.dtype] = np.float64, **kwargs):
+        """
+        Initializes the strategy; the buffers are allocated with the initial population.
+
+        Args:
+            *args: Positional arguments of `EvolutionStrategy`.
+            dtype: np.float64 (default) or np.float32.
+            **kwargs: Keyword arguments of `EvolutionStrategy`.
+
+        Raises:
+            ValueError: If dtype is not float32 or float64, or niching (niche_radius)
+                        is requested, which the buffered selection does not support.
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError(f"dtype must be float32 or float64, got {self.dtype}.")
+        if kwargs.get('niche_radius') is not None:
+            raise ValueError("niche_radius is not supported by LargeScaleEvolutionStrategy; "
+                             "use EvolutionStrategy for niching.")
+        super().__init__(*args, **kwargs)
+        self._parent_buffers = None
+        self._parent_slot = 0
+        self._offspring_buffer = None
+
+    def _chunk_rows(self) -> int:
+        """Returns the number of rows per block so a block holds about CHUNK_ELEMENTS values."""
+        return max(1, CHUNK_ELEMENTS // self.dimensions)
+
+    def _allocate_buffers(self):
+        """Allocates the parent and offspring buffers (once per run)."""
+        if self._offspring_buffer is None:
+            self._parent_buffers = [np.empty((self.mu, self.dimensions), dtype=self.dtype) for _ in range(2)]
+            self._offspring_buffer = np.empty((self.lambda_, self.dimensions), dtype=self.dtype)
+
+    def _adopt_population(self):
+        """Moves the current population's genotypes into the active parent buffer."""
+        self._allocate_buffers()
+        buffer = self._parent_buffers[self._parent_slot]
+        buffer[:len(self.population)] = self.population.genotypes
+        self.population.genotypes = buffer[:len(self.population)]
+
+    def _sample_initial_population(self) -> np.ndarray:
+        """Draws the initial genotypes (same draws as the default mode) in the buffer dtype."""
+        return super()._sample_initial_population().astype(self.dtype, copy=False)
+
+    def _start_population(self, genotypes: np.ndarray, fitness: np.ndarray):
+        """Builds the initial population and moves it into the parent buffer."""
+        super()._start_population(genotypes, fitness)
+        self._adopt_population()
+
+    def _sample_offspring(self) -> np.ndarray:
+        """
+        Creates lambda_ offspring genotypes in the preallocated offspring buffer.
+
+        Returns:
+            np.ndarray: The (lambda_, d) offspring buffer, not yet evaluated.
+        """
+        profiler = self.profiler
+
+        # 1. Select parents randomly (uniform choice from current parents)
+        parent_indices = self.rng.integers(0, len(self.population), size=self.lambda_)
+        if profiler is not None:
+            profiler.mark('parent_sampling')
+
+        # 2. Mutate: N(0, 1) noise drawn into the offspring buffer, scaled by sigma,
+        # then the parents added in blocks of rows (no full gathered parent copy)
+        sigmas = self.step_size_control.offspring_sigmas(self, parent_indices)
+        offspring_genotypes = self._offspring_buffer
+        self.rng.standard_normal(dtype=self.dtype, out=offspring_genotypes)
+        offspring_genotypes *= sigmas
+        parent_genotypes = self.population.genotypes
+        chunk = self._chunk_rows()
+        for start in range(0, self.lambda_, chunk):
+            block = offspring_genotypes[start:start + chunk]
+            np.add(block, parent_genotypes[parent_indices[start:start + chunk]], out=block)
+        if profiler is not None:
+            profiler.mark('mutation')
+
+        # 3. Boundary Handling (Clipping), in place
+        np.clip(offspring_genotypes, self.bounds[0], self.bounds[1], out=offspring_genotypes)
+        if profiler is not None:
+            profiler.mark('clipping')
+
+        self._offspring_parents = parent_indices
+        self._offspring_sigmas = sigmas
+        return offspring_genotypes
+
+    def _select_survivors(self, offspring: Population):
+        """
+        Copies the mu survivors into the inactive parent buffer, which becomes active.
+
+        Args:
+            offspring (Population): The generated offspring.
+        """
+        parents = self.population
+        target = self._parent_buffers[1 - self._parent_slot]
+        if self.selection_type == '(mu, lambda)':
+            indices = select_best_indices(offspring.fitness, self.mu)
+            np.take(offspring.genotypes, indices, axis=0, out=target)
+            fitness = offspring.fitness[indices]
+            sigmas = offspring.sigmas[indices] if offspring.sigmas is not None else None
+        else:
+            pool_fitness = np.concatenate((parents.fitness, offspring.fitness))
+            indices = select_best_indices(pool_fitness, self.mu)
+            n_parents = len(parents)
+            chunk = self._chunk_rows()
+            for start in range(0, len(indices), chunk):
+                block_indices = indices[start:start + chunk]
+                block = target[start:start + len(block_indices)]
+                from_parents = block_indices < n_parents
+                block[from_parents] = np.take(parents.genotypes, block_indices[from_parents], axis=0)
+                block[~from_parents] = np.take(offspring.genotypes, block_indices[~from_parents] - n_parents,
+                                               axis=0)
+            fitness = pool_fitness[indices]
+            sigmas = None
+            if parents.sigmas is not None and offspring.sigmas is not None:
+                sigmas = np.concatenate((parents.sigmas, offspring.sigmas))[indices]
+        self._parent_slot = 1 - self._parent_slot
+        self.population = Population(target[:len(indices)], fitness, sigmas)
+
+    def _checkpoint_config(self) -> Dict[str, Any]:
+        """Adds the buffer dtype to the configuration a checkpoint must match."""
+        config = super()._checkpoint_config()
+        config['dtype'] = self.dtype.name
+        return config
+
+    def _restore_checkpoint_state(self, state: Dict[str, Any]):
+        """Restores the run state and moves the restored parents into the buffers."""
+        super()._restore_checkpoint_state(state)
+        self._adopt_population()
@@ -0,0 +1,202 @@
+# es_optimiser/niching.py
+import itertools
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# At most this many coordinates are hashed; 3^k neighbouring cells are probed per query
+_GRID_DIMENSIONS = 3
+# Members visited per vectorized step of `clearing`
+_CLEARING_BLOCK = 256
+# Upper bound on the number of distinct optima kept by `EvolutionStrategy`
+MAX_OPTIMA = 1000
+# Consecutive generations a niche must be occupied before it is reported as an optimum
+OPTIMUM_CONFIRMATION_GENERATIONS = 30
+
+
+class GridIndex:
+    """
+    Grid-hash spatial index for fixed-radius neighbour queries.
+
+    Points are hashed by the cell of side `radius` that contains their first
+    (at most three) coordinates. Any point within `radius` of a query lies in
+    one of the 3^k cells around the query's cell, so a query only computes
+    exact distances to the inserted points stored in those cells instead of
+    to every point (no O(n^2) pairwise distance matrix). Queries are answered
+    for a whole batch of points at once: inserted points are kept sorted by
+    cell key and each query's neighbouring cells are located with
+    `np.searchsorted`.
+
+    Attributes:
+        points (np.ndarray): (n, d) coordinates of all points that may be inserted or queried.
+        radius (float): Query radius.
+    """
+    def __init__(self, points: np.ndarray, radius: float):
+        """
+        Hashes all points; none is inserted yet.
+
+        Args:
+            points (np.ndarray): (n, d) point coordinates.
+            radius (float): Query radius (> 0).
+        """
+        self.points = points
+        self.radius = radius
+        self._radius_squared = radius * radius
+        cells = np.floor(points[:, :_GRID_DIMENSIONS] / radius).astype(np.int64)
+        # Encode each cell as one integer key: shift coordinates to start at 1 and use
+        # mixed-radix weights, hashing fewer coordinates if the keys would overflow
+        cells -= cells.min(axis=0) - 1
+        spans = cells.max(axis=0) + 2
+        k = 1
+        while k < cells.shape[1] and int(np.prod(spans[:k + 1].astype(object))) < 2**62:
+            k += 1
+        weights = np.concatenate(([1], np.cumprod(spans[:k - 1]))).astype(np.int64)
+        self._keys = cells[:, :k] @ weights
+        self._offset_keys = np.array(list(itertools.product((-1, 0, 1), repeat=k)), dtype=np.int64) @ weights
+        self._inserted: List[int] = []
+        self._sorted = None  # (sorted keys, members) snapshot of the inserted points
+
+    def __len__(self) -> int:
+        return len(self._inserted)
+
+    def insert(self, index: int):
+        """Adds point `index` to the index."""
+        self._inserted.append(index)
+        self._sorted = None
+
+    def insert_many(self, indices: np.ndarray):
+        """Adds the points `indices` to the index."""
+        self._inserted.extend(np.asarray(indices).tolist())
+        self._sorted = None
+
+    def count_within(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Counts the inserted points within `radius` of each query point.
+
+        Args:
+            queries (np.ndarray): (q,) indices of the query points.
+
+        Returns:
+            np.ndarray: (q,) counts.
+        """
+        pair_query, _ = self._pairs_within(queries)
+        return np.bincount(pair_query, minlength=len(queries))
+
+    def best_within(self, queries: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+        """
+        Finds the best (lowest fitness) inserted point within `radius` of each query point.
+
+        Args:
+            queries (np.ndarray): (q,) indices of the query points.
+            fitness (np.ndarray): (n,) fitness of all points.
+
+        Returns:
+            np.ndarray: (q,) index of the best neighbour, or -1 if there is none.
+        """
+        best = np.full(len(queries), -1, dtype=np.intp)
+        pair_query, pair_member = self._pairs_within(queries)
+        if len(pair_query):
+            order = np.lexsort((fitness[pair_member], pair_query))
+            first = np.concatenate(([True], np.diff(pair_query[order]) != 0))
+            best[pair_query[order][first]] = pair_member[order][first]
+        return best
+
+    def _pairs_within(self, queries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the (query position, inserted point) pairs that lie within `radius`."""
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+        if not self._inserted or len(queries) == 0:
+            return empty
+        if self._sorted is None:
+            members = np.array(self._inserted, dtype=np.intp)
+            order = np.argsort(self._keys[members], kind='stable')
+            self._sorted = (self._keys[members][order], members[order])
+        sorted_keys, sorted_members = self._sorted
+
+        # Range of inserted points in every neighbouring cell of every query
+        neighbour_keys = (self._keys[queries][:, np.newaxis] + self._offset_keys).ravel()
+        starts = np.searchsorted(sorted_keys, neighbour_keys, side='left')
+        lengths = np.searchsorted(sorted_keys, neighbour_keys, side='right') - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return empty
+
+        # Expand the ranges into (query, candidate) pairs and test the exact distance
+        pair_query = np.repeat(np.repeat(np.arange(len(queries)), len(self._offset_keys)), lengths)
+        pair_position = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + np.repeat(starts, lengths)
+        pair_member = sorted_members[pair_position]
+        differences = self.points[pair_member] - self.points[queries[pair_query]]
+        within = np.einsum('ij,ij->i', differences, differences) <= self._radius_squared
+        return pair_query[within], pair_member[within]
+
+
+def clearing(genotypes: np.ndarray, fitness: np.ndarray, radius: float, capacity: int = 1,
+             max_winners: Optional[int] = None) -> np.ndarray:
+    """
+    Clearing (Pétrowski, 1996): keeps only the best `capacity` members of every niche.
+
+    Members are visited from best to worst fitness; a member is a winner if
+    fewer than `capacity` winners lie within `radius` of it, and is cleared
+    otherwise. Members are processed in blocks: one grid query per block
+    clears every member already dominated by earlier winners, and only the
+    remaining members are checked one by one against the block's new winners.
+
+    Args:
+        genotypes (np.ndarray): (n, d) genotypes.
+        fitness (np.ndarray): (n,) fitness values (lower is better).
+        radius (float): Niche radius.
+        capacity (int): Winners allowed per niche. Defaults to 1.
+        max_winners (Optional[int]): Stop once this many winners are found (the
+            remaining members cannot displace them). Defaults to None.
+
+    Returns:
+        np.ndarray: Indices of the winners, best first.
+    """
+    order = np.argsort(fitness, kind='stable')
+    index = GridIndex(genotypes, radius)
+    winners: List[int] = []
+    radius_squared = radius * radius
+    for start in range(0, len(order), _CLEARING_BLOCK):
+        block = order[start:start + _CLEARING_BLOCK]
+        counts = index.count_within(block)
+        open_members = counts < capacity
+        block_winners: List[int] = []
+        for member, count in zip(block[open_members].tolist(), counts[open_members].tolist()):
+            if block_winners:
+                differences = genotypes[block_winners] - genotypes[member]
+                count += int(np.count_nonzero(np.einsum('ij,ij->i', differences, differences) <= radius_squared))
+            if count < capacity:
+                block_winners.append(member)
+                winners.append(member)
+                if max_winners is not None and len(winners) == max_winners:
+                    return np.array(winners, dtype=np.intp)
+        for member in block_winners:
+            index.insert(member)
+    return np.array(winners, dtype=np.intp)
+
+
+def select_niche_indices(genotypes: np.ndarray, fitness: np.ndarray, mu: int, radius: float,
+                         capacity: int = 1) -> np.ndarray:
+    """
+    Selects mu survivors with clearing, best first.
+
+    The mu best clearing winners are selected; if there are fewer than mu
+    niches, the best cleared members fill the remaining places.
+
+    Args:
+        genotypes (np.ndarray): (n, d) pool genotypes.
+        fitness (np.ndarray): (n,) pool fitness values.
+        mu (int): Number of survivors (<= n).
+        radius (float): Niche radius.
+        capacity (int): Winners per niche. Defaults to 1.
+
+    Returns:
+        np.ndarray: (mu,) pool indices, sorted by ascending fitness.
+    """
+    selected = clearing(genotypes, fitness, radius, capacity, max_winners=mu)
+    if len(selected) < mu:
+        cleared = np.ones(len(fitness), dtype=bool)
+        cleared[selected] = False
+        fillers = np.flatnonzero(cleared)
+        fillers = fillers[np.argsort(fitness[fillers], kind='stable')[:mu - len(selected)]]
+        selected = np.concatenate((selected, fillers))
+    return selected[np.argsort(fitness[selected], kind='stable')]
@@ -1,6 +1,9 @@
 # es_optimiser/objective_functions.py
 import numpy as np
-from typing import List # Use List for type hinting arrays/sequences if preferred over np.ndarray in some contexts
+from typing import Callable, Dict, List # Use List for type hinting arrays/sequences if preferred over np.ndarray in some contexts
+
+# Batch objective contract: an (n, d) array of genotypes in, an (n,) array of fitnesses out.
+BatchObjective = Callable[[np.ndarray], np.ndarray]
 
 def rastrigin(x: np.ndarray) -> float:
     """
@@ -65,3 +68,87 @@ def ackley(x: np.ndarray) -> float:
     term2 = -np.exp(sum_cos / dimension)
     return term1 + term2 + 20 + np.e
 
+# --- Batched objective functions (one row per candidate solution) ---
+
+def rastrigin_batch(X: np.ndarray) -> np.ndarray:
+    """
+    Calculates the Rastrigin function for every row of a 2-D array in one pass.
+
+    Row-wise equivalent of `rastrigin`, used by `EvolutionStrategy` to evaluate
+    a whole generation of offspring without per-individual Python calls.
+
+    Args:
+        X (np.ndarray): An (n, d) array; each row is one candidate solution.
+
+    Returns:
+        np.ndarray: An (n,) array of Rastrigin values, one per row.
+
+    Example:
+        >>> rastrigin_batch(np.array([[0.0, 0.0], [1.0, 0.0]]))
+        array([0., 1.])
+    """
+    X = np.atleast_2d(X)
+    dimension = X.shape[1]
+    return 10 * dimension + np.sum(X**2 - 10 * np.cos(2 * np.pi * X), axis=1)
+
+def ackley_batch(X: np.ndarray) -> np.ndarray:
+    """
+    Calculates the Ackley function for every row of a 2-D array in one pass.
+
+    Row-wise equivalent of `ackley`.
+
+    Args:
+        X (np.ndarray): An (n, d) array; each row is one candidate solution.
+
+    Returns:
+        np.ndarray: An (n,) array of Ackley values, one per row.
+    """
+    X = np.atleast_2d(X)
+    dimension = X.shape[1]
+    sum_sq = np.sum(X**2, axis=1)
+    sum_cos = np.sum(np.cos(2 * np.pi * X), axis=1)
+    term1 = -20 * np.exp(-0.2 * np.sqrt(sum_sq / dimension))
+    term2 = -np.exp(sum_cos / dimension)
+    return term1 + term2 + 20 + np.e
+
+# Native batched versions of the scalar objective functions above.
+BATCH_OBJECTIVES: Dict[Callable[[np.ndarray], float], BatchObjective] = {
+    rastrigin: rastrigin_batch,
+    ackley: ackley_batch,
+}
+
+class RowwiseBatchObjective:
+    """
+    Adapts a scalar objective function to the batch objective contract.
+
+    Fallback for user-supplied objectives that have no native batched version:
+    each row is evaluated with one call to the scalar function. Implemented as a
+    class (rather than a closure) so it stays picklable for worker processes.
+
+    Attributes:
+        objective_function (Callable[[np.ndarray], float]): The wrapped scalar function.
+    """
+    def __init__(self, objective_function: Callable[[np.ndarray], float]):
+        self.objective_function = objective_function
+        self.__name__ = getattr(objective_function, "__name__", type(objective_function).__name__)
+
+    def __call__(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(X)
+        return np.fromiter((self.objective_function(x) for x in X), dtype=float, count=X.shape[0])
+
+def get_batch_objective(objective_function: Callable[[np.ndarray], float]) -> BatchObjective:
+    """
+    Returns the batched version of a scalar objective function.
+
+    Args:
+        objective_function (Callable[[np.ndarray], float]): A scalar objective,
+            e.g. `rastrigin`.
+
+    Returns:
+        BatchObjective: The native batched version if one is registered in
+        `BATCH_OBJECTIVES`, otherwise a `RowwiseBatchObjective` wrapper.
+    """
+    batch_function = BATCH_OBJECTIVES.get(objective_function)
+    if batch_function is not None:
+        return batch_function
+    return RowwiseBatchObjective(objective_function)
@@ -1,41 +1,64 @@
-import matplotlib.pyplot as plt
 import numpy as np
+import hashlib
 import os
-from typing import List, Tuple, Callable, Optional
+import sys
+from typing import Dict, List, Tuple, Callable, Optional, Union
 
-from .objective_functions import rastrigin
+from .objective_functions import BATCH_OBJECTIVES, rastrigin, get_batch_objective
+from .telemetry import load_history
 
 PLOTS_DIR = "plots"
+LANDSCAPE_CACHE_DIR = os.path.join(PLOTS_DIR, ".landscape_cache")
+
+# In-memory landscape grids, keyed by (function, bounds, resolution)
+_LANDSCAPE_CACHE: Dict[Tuple[str, Tuple[float, float], int], np.ndarray] = {}
 
 def ensure_plots_dir():
     """Ensure the plots directory exists."""
     if not os.path.exists(PLOTS_DIR):
         os.makedirs(PLOTS_DIR)
 
-def plot_convergence(history: List[Tuple[int, float]], title: Optional[str] = None, filename: Optional[str] = None):
+def plot_convergence(history: Union[List[Tuple[int, float]], np.ndarray, str],
+                     title: Optional[str] = None, filename: Optional[str] = None,
+                     markers: Optional[List[int]] = None):
     """
     Generates and saves a plot showing the convergence of the best fitness over generations.
 
     Args:
-        history (List[Tuple[int, float]]): (generation_number, best_fitness_at_that_generation).
+        history (Union[List[Tuple[int, float]], np.ndarray, str]): (generation_number,
+            best_fitness_at_that_generation) tuples, a telemetry record array from
+            `telemetry.load_history`, or the path of a telemetry file. Record arrays
+            and files are plotted straight from their (memory-mapped) columns.
         title (Optional[str]): Title for the plot.
         filename (Optional[str]): If provided, saves the plot to this file in the plots directory.
+        markers (Optional[List[int]]): Generations to mark with vertical lines, e.g.
+            `RestartingEvolutionStrategy.get_restart_generations()`.
     """
-    if not history:
+    if isinstance(history, (str, os.PathLike)):
+        history = load_history(history)
+    if len(history) == 0:
         print("Warning: History is empty, cannot plot convergence.")
         return
 
     ensure_plots_dir()
-    generations = [item[0] for item in history]
-    fitnesses = [item[1] for item in history]
+    if isinstance(history, np.ndarray) and history.dtype.names:
+        generations = history['generation']
+        fitnesses = history['best_fitness']
+    else:
+        generations = [item[0] for item in history]
+        fitnesses = np.array([item[1] for item in history])
+
+    import matplotlib.pyplot as plt  # Imported on first plot, not with the module
 
     plt.figure(figsize=(10, 6))
     plt.plot(generations, fitnesses, marker='.', linestyle='-', markersize=4)
+    for generation in markers or []:
+        plt.axvline(generation, color='gray', linestyle=':', linewidth=1)
     plt.xlabel("Generation")
     plt.ylabel("Best Fitness Found")
     plot_title = title if title else "ES Convergence History"
     plt.title(plot_title)
-    if all(f > 0 for f in fitnesses) and (max(fitnesses) / min(fitnesses) > 100):
+    if np.all(fitnesses > 0) and (fitnesses.max() / fitnesses.min() > 100):
         plt.yscale('log')
         plt.ylabel("Best Fitness Found (Log Scale)")
     plt.grid(True, which='both', linestyle='--', linewidth=0.5)
@@ -44,34 +67,130 @@ def plot_convergence(history: List[Tuple[int, float]], title: Optional[str] = No
         plt.savefig(filename)
     plt.close()
 
-def plot_rastrigin_2d_landscape(bounds: Tuple[float, float] = (-5.12, 5.12),
-                                best_solution: Optional[np.ndarray] = None,
-                                filename: Optional[str] = None):
+def _code_digest(code, digest) -> None:
+    """Feeds a code object's bytecode and constants (recursing into nested code) to a hash."""
+    digest.update(code.co_code)
+    for constant in code.co_consts:
+        if hasattr(constant, 'co_code'):
+            _code_digest(constant, digest)
+        else:
+            digest.update(repr(constant).encode())
+
+def _landscape_cache_name(objective_function: Callable[[np.ndarray], float]) -> Optional[str]:
     """
-    Plots and saves the 2D landscape of the Rastrigin function and optionally marks the best solution.
+    Returns the cache name of an objective, or None if its grid must not be cached.
+
+    Only module-level functions are cached, since only their qualified name is
+    unique: lambdas, closures, partials and nested functions from one factory
+    share a name but not their behaviour. The name includes a digest of the
+    function's code (and of its batched version), so editing the objective
+    invalidates its cached grids.
+    """
+    module = sys.modules.get(getattr(objective_function, '__module__', None))
+    qualname = getattr(objective_function, '__qualname__', '')
+    if (module is None or not hasattr(objective_function, '__code__') or objective_function.__closure__
+            or getattr(module, qualname, None) is not objective_function):
+        return None
+    digest = hashlib.sha1()
+    _code_digest(objective_function.__code__, digest)
+    batch_function = BATCH_OBJECTIVES.get(objective_function)
+    if batch_function is not None and hasattr(batch_function, '__code__'):
+        _code_digest(batch_function.__code__, digest)
+    return f"{module.__name__}.{qualname}@{digest.hexdigest()[:12]}"
+
+def _landscape_cache_path(cache_dir: str, name: str, bounds: Tuple[float, float], resolution: int) -> str:
+    """Returns the on-disk cache file for a landscape grid."""
+    digest = hashlib.sha1(repr((name, tuple(map(float, bounds)), resolution)).encode()).hexdigest()[:12]
+    function_name = name.split('@', 1)[0].rsplit('.', 1)[-1]
+    return os.path.join(cache_dir, f"landscape_{function_name}_{digest}.npy")
+
+def compute_landscape_grid(objective_function: Callable[[np.ndarray], float],
+                           bounds: Tuple[float, float] = (-5.12, 5.12),
+                           resolution: int = 200,
+                           cache_dir: Optional[str] = LANDSCAPE_CACHE_DIR) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluates an objective on a 2D grid in one vectorized pass, with caching.
+
+    The grid is evaluated with the objective's batched version (see
+    `objective_functions.get_batch_objective`). Computed grids are cached in
+    memory and, if cache_dir is given, as a compact float32 .npy file keyed by
+    function (name and code digest), bounds and resolution, so repeat calls
+    (also from other processes or later executions) skip the evaluation
+    entirely. Only module-level functions are cached; grids of lambdas,
+    closures and partials are always evaluated.
+
+    Args:
+        objective_function (Callable[[np.ndarray], float]): Scalar objective, e.g. `rastrigin`.
+        bounds (Tuple[float, float]): The plot range for x1 and x2.
+        resolution (int): Number of grid points per axis.
+        cache_dir (Optional[str]): Directory for the on-disk cache; None disables it.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Meshgrid arrays X, Y and the
+        objective values Z, each of shape (resolution, resolution).
+    """
+    name = _landscape_cache_name(objective_function)
+    key = (name, tuple(map(float, bounds)), resolution)
+    x = np.linspace(bounds[0], bounds[1], resolution)
+    y = np.linspace(bounds[0], bounds[1], resolution)
+    X, Y = np.meshgrid(x, y)
+
+    Z = _LANDSCAPE_CACHE.get(key) if name is not None else None
+    cache_path = _landscape_cache_path(cache_dir, name, bounds, resolution) if cache_dir and name else None
+    if Z is None and cache_path is not None and os.path.exists(cache_path):
+        Z = np.load(cache_path)
+    if Z is None:
+        points = np.column_stack((X.ravel(), Y.ravel()))
+        Z = get_batch_objective(objective_function)(points).reshape(X.shape).astype(np.float32)
+        if cache_path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename, so concurrent runs never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, Z)
+            os.replace(tmp_path, cache_path)
+    if name is not None:
+        _LANDSCAPE_CACHE[key] = Z
+    return X, Y, Z
+
+def plot_landscape_2d(objective_function: Callable[[np.ndarray], float],
+                      bounds: Tuple[float, float] = (-5.12, 5.12),
+                      best_solution: Optional[np.ndarray] = None,
+                      filename: Optional[str] = None,
+                      known_optimum: Optional[Tuple[float, float]] = None,
+                      resolution: int = 200,
+                      cache_dir: Optional[str] = LANDSCAPE_CACHE_DIR):
+    """
+    Plots and saves the 2D landscape of any objective function and optionally marks the best solution.
+
+    The landscape grid comes from `compute_landscape_grid`, so it is evaluated
+    once per (function, bounds, resolution) and reused by later plots.
 
     Args:
+        objective_function (Callable[[np.ndarray], float]): Objective from `objective_functions`.
         bounds (Tuple[float, float]): The plot range for x1 and x2.
         best_solution (Optional[np.ndarray]): The (x1, x2) coordinates of the best solution found.
         filename (Optional[str]): If provided, saves the plot to this file in the plots directory.
+        known_optimum (Optional[Tuple[float, float]]): If provided, marks the global optimum.
+        resolution (int): Number of grid points per axis. Defaults to 200.
+        cache_dir (Optional[str]): Directory for the on-disk grid cache; None disables it.
     """
     ensure_plots_dir()
-    x = np.linspace(bounds[0], bounds[1], 200)
-    y = np.linspace(bounds[0], bounds[1], 200)
-    X, Y = np.meshgrid(x, y)
-    Z = np.zeros_like(X)
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            Z[i, j] = rastrigin(np.array([X[i, j], Y[i, j]]))
+    X, Y, Z = compute_landscape_grid(objective_function, bounds, resolution, cache_dir)
+    function_name = objective_function.__name__.capitalize()
+
+    import matplotlib.pyplot as plt
 
     plt.figure(figsize=(10, 8))
     contour = plt.contourf(X, Y, Z, levels=50, cmap='viridis')
-    plt.colorbar(contour, label='Fitness Value (Rastrigin)')
+    plt.colorbar(contour, label=f'Fitness Value ({function_name})')
     plt.xlabel('x1')
     plt.ylabel('x2')
-    plt.title('Rastrigin Function Landscape (2D)')
+    plt.title(f'{function_name} Function Landscape (2D)')
     plt.axis('equal')
-    plt.plot(0, 0, 'ro', markersize=10, markerfacecolor='none', markeredgewidth=2, label='Global Optimum at (0,0)')
+    if known_optimum is not None:
+        plt.plot(known_optimum[0], known_optimum[1], 'ro', markersize=10, markerfacecolor='none', markeredgewidth=2,
+                 label=f'Global Optimum at ({known_optimum[0]:g},{known_optimum[1]:g})')
     if best_solution is not None and len(best_solution) == 2:
         plt.plot(best_solution[0], best_solution[1], 'y*', markersize=12, markeredgewidth=1.5, label=f'ES Best Solution ({best_solution[0]:.2f}, {best_solution[1]:.2f})')
     plt.legend()
@@ -79,6 +198,22 @@ def plot_rastrigin_2d_landscape(bounds: Tuple[float, float] = (-5.12, 5.12),
         plt.savefig(filename)
     plt.close()
 
+def plot_rastrigin_2d_landscape(bounds: Tuple[float, float] = (-5.12, 5.12),
+                                best_solution: Optional[np.ndarray] = None,
+                                filename: Optional[str] = None):
+    """
+    Plots and saves the 2D landscape of the Rastrigin function and optionally marks the best solution.
+
+    Thin wrapper around `plot_landscape_2d` kept for compatibility.
+
+    Args:
+        bounds (Tuple[float, float]): The plot range for x1 and x2.
+        best_solution (Optional[np.ndarray]): The (x1, x2) coordinates of the best solution found.
+        filename (Optional[str]): If provided, saves the plot to this file in the plots directory.
+    """
+    plot_landscape_2d(rastrigin, bounds=bounds, best_solution=best_solution, filename=filename,
+                      known_optimum=(0.0, 0.0))
+
 # Placeholder for future plot types (e.g., overall performance, boxplots, etc.)
 def plot_overall_performance(*args, **kwargs):
     """
@@ -0,0 +1,91 @@
+# es_optimiser/profiling.py
+import time
+from typing import Dict, List
+
+# Phases of one generation, in execution order
+PHASES = ('parent_sampling', 'mutation', 'clipping', 'evaluation', 'selection', 'bookkeeping')
+
+
+class PhaseProfiler:
+    """
+    Low-overhead timer for the phases of each ES generation.
+
+    `EvolutionStrategy` calls `start_generation()` at the beginning of a
+    generation, `mark(phase)` right after each phase finishes (the time since
+    the previous mark is charged to that phase) and `end_generation()` at the
+    end. Each mark costs one `time.perf_counter()` call; when no profiler is
+    configured the engine skips these calls entirely.
+
+    Attributes:
+        cumulative (Dict[str, float]): Total seconds spent in each phase.
+        generations (List[Dict[str, float]]): Per-generation records (generation,
+            evaluations, one entry per phase and 'total'), if keep_per_generation.
+        evaluations (int): Objective evaluations performed in profiled generations.
+        keep_per_generation (bool): Whether per-generation records are kept.
+    """
+    def __init__(self, keep_per_generation: bool = True):
+        """
+        Initializes an empty profiler.
+
+        Args:
+            keep_per_generation: Keep a record for every generation (memory grows
+                with the run length). Defaults to True.
+        """
+        self.keep_per_generation = keep_per_generation
+        self.cumulative: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.generations: List[Dict[str, float]] = []
+        self.evaluations = 0
+        self._current: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self._last = 0.0
+        self._evaluations_at_start = 0
+
+    def start_generation(self, evaluations: int):
+        """
+        Starts timing a generation.
+
+        Args:
+            evaluations (int): The strategy's evaluation count before the generation.
+        """
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._evaluations_at_start = evaluations
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str):
+        """Charges the time since the previous mark to `phase`."""
+        now = time.perf_counter()
+        self._current[phase] += now - self._last
+        self._last = now
+
+    def end_generation(self, generation: int, evaluations: int) -> Dict[str, float]:
+        """
+        Finishes timing a generation and accumulates its phase timings.
+
+        Args:
+            generation (int): The generation just completed.
+            evaluations (int): The strategy's evaluation count after the generation.
+
+        Returns:
+            Dict[str, float]: The generation's record: 'generation', 'evaluations'
+            (performed in this generation), one entry per phase and 'total' (seconds).
+        """
+        record = dict(self._current)
+        record['total'] = sum(self._current.values())
+        record['generation'] = generation
+        record['evaluations'] = evaluations - self._evaluations_at_start
+        for phase in PHASES:
+            self.cumulative[phase] += self._current[phase]
+        self.evaluations += record['evaluations']
+        if self.keep_per_generation:
+            self.generations.append(record)
+        return record
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns cumulative seconds and the share of total time for each phase.
+
+        Returns:
+            Dict[str, Dict[str, float]]: {phase: {'seconds': ..., 'fraction': ...}}.
+        """
+        total = sum(self.cumulative.values())
+        return {phase: {'seconds': seconds, 'fraction': seconds / total if total else 0.0}
+                for phase, seconds in self.cumulative.items()}
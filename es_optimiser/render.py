@@ -0,0 +1,96 @@
+# es_optimiser/render.py
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, List, Optional
+
+
+def _init_render_worker():
+    """Process pool initializer: selects the headless Agg backend before any plotting."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render(plot_function: Callable[..., Any], args: tuple, kwargs: dict) -> Optional[str]:
+    """Runs one plot job in a worker and returns the path it was saved to."""
+    plot_function(*args, **kwargs)
+    return kwargs.get('filename')
+
+
+class PlotRenderQueue:
+    """
+    Renders plots in background worker processes, off the optimization's critical path.
+
+    Plot jobs (any plotting function from `plot`, e.g. `plot_convergence` or
+    `plot_landscape_2d`, with its arguments) are handed to a process pool
+    whose workers use the headless Agg backend, so figure creation and
+    `savefig` overlap with the next optimization instead of delaying it.
+    `submit` returns a future for the saved plot path; `flush` waits for all
+    outstanding jobs. A failed render is logged and reported as None; it never
+    aborts the batch.
+
+    Attributes:
+        max_workers (int): Number of rendering processes.
+    """
+    def __init__(self, max_workers: int = 1, mp_context=None):
+        """
+        Initializes the queue. The worker pool starts on the first submitted job.
+
+        Args:
+            max_workers: Number of rendering processes. Defaults to 1.
+            mp_context: Optional multiprocessing context for the pool.
+        """
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def submit(self, plot_function: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Queues a plot job.
+
+        Args:
+            plot_function: A picklable plotting function, e.g. `plot.plot_convergence`.
+            *args: Positional arguments for the plotting function.
+            **kwargs: Keyword arguments for the plotting function; `filename`
+                      is the path the future resolves to.
+
+        Returns:
+            Future: Resolves to the saved plot path (raises if the render failed).
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context,
+                                                 initializer=_init_render_worker)
+        future = self._executor.submit(_render, plot_function, args, kwargs)
+        self._pending.append(future)
+        return future
+
+    def flush(self) -> List[Optional[str]]:
+        """
+        Waits for every queued plot job to finish.
+
+        Returns:
+            List[Optional[str]]: The saved plot paths in submission order, with
+            None for renders that failed (failures are logged, not raised).
+        """
+        paths = []
+        for future in self._pending:
+            try:
+                paths.append(future.result())
+            except Exception:
+                logging.exception("Plot rendering failed")
+                paths.append(None)
+        self._pending = []
+        return paths
+
+    def close(self):
+        """Flushes outstanding jobs and shuts down the worker pool."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> 'PlotRenderQueue':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
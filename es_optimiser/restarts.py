@@ -0,0 +1,287 @@
+# es_optimiser/restarts.py
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from .evolution_strategy import EvolutionStrategy, Individual
+from .stopping import MAX_EVALUATIONS, TARGET_FITNESS, StoppingCriteria
+
+RESTART_STRATEGIES = ('ipop', 'bipop')
+
+# Stop reason when max_restarts runs have been completed
+MAX_RESTARTS = 'max_restarts'
+
+# Strategy arguments set by the restart schedule for every run (not allowed in es_kwargs)
+_RUN_ARGUMENTS = ('objective_function', 'dimensions', 'bounds', 'mu', 'lambda_', 'max_generations', 'sigma',
+                  'seed', 'stopping_criteria')
+
+
+class RestartingEvolutionStrategy:
+    """
+    Restarts an Evolution Strategy with growing populations under one evaluation budget.
+
+    Each run is an independent strategy (`EvolutionStrategy` by default, or
+    e.g. `CMAEvolutionStrategy`) that stops when it stagnates; the next run is
+    then started with a fresh child seed until the total evaluation budget is
+    spent or the target fitness is reached:
+
+    - 'ipop': every restart multiplies lambda_ (and mu, keeping their ratio)
+      by `population_growth` (Auger & Hansen, 2005);
+    - 'bipop': alternates between the increasing "large" regime of IPOP and a
+      "small" regime with randomly drawn, smaller populations and step sizes,
+      always starting the next run in the regime that has used fewer
+      evaluations so far (Hansen, 2009).
+
+    The best solution is carried across restarts and the history is one
+    continuous best-so-far curve over all runs; `restart_events` records where
+    each run started and how it ended.
+
+    Attributes:
+        restart_strategy (str): 'ipop' or 'bipop'.
+        max_evaluations (int): Total objective evaluation budget over all runs.
+        best_individual_overall (Optional[Individual]): Best solution over all runs.
+        history (List[Tuple[int, float]]): (generation, best-so-far fitness), with
+            generations counted continuously across runs.
+        evaluation_counts (List[int]): Total evaluations up to each history entry.
+        evaluations (int): Evaluations performed by all runs.
+        generation (int): Generations completed by all runs.
+        restart_events (List[Dict[str, Any]]): One record per run: run index, regime,
+            first history generation, evaluations before the run, mu, lambda_,
+            sigma, and after the run its generations, stop reason and best fitness.
+        stop_reason (Optional[str]): 'max_evaluations', 'target_fitness' or 'max_restarts'.
+        verbose (bool): Whether restart banners and the summary are printed.
+    """
+    def __init__(
+        self,
+        objective_function: Callable[[np.ndarray], float],
+        dimensions: int,
+        bounds: Tuple[float, float],
+        mu: int,
+        lambda_: int,
+        max_evaluations: int,
+        restart_strategy: str = 'ipop',
+        sigma: float = 0.1,
+        max_generations: int = 1000,
+        stagnation_generations: int = 50,
+        target_fitness: Optional[float] = None,
+        max_restarts: Optional[int] = None,
+        population_growth: float = 2.0,
+        seed: Optional[int] = None,
+        strategy_class: Type[EvolutionStrategy] = EvolutionStrategy,
+        es_kwargs: Optional[Dict[str, Any]] = None,
+        verbose: bool = True
+    ):
+        """
+        Initializes the restart configuration.
+
+        Args:
+            objective_function: The target function to minimize.
+            dimensions: Dimensionality of the search space.
+            bounds: Tuple (min_val, max_val) applied to all dimensions.
+            mu: Number of parents of the first run.
+            lambda_: Number of offspring of the first run.
+            max_evaluations: Total evaluation budget over all runs.
+            restart_strategy: 'ipop' or 'bipop'. Defaults to 'ipop'.
+            sigma: Initial mutation strength of every large-regime run. Defaults to 0.1.
+            max_generations: Generation limit of a single run. Defaults to 1000.
+            stagnation_generations: A run is restarted after this many generations
+                without improvement. Defaults to 50.
+            target_fitness: Stop everything once this fitness is reached. Defaults to None.
+            max_restarts: Optional limit on the number of restarts. Defaults to None.
+            population_growth: Factor applied to the large-regime population on
+                every restart. Defaults to 2.0.
+            seed: Root seed; every run gets its own spawned child seed, and calling
+                  run() again repeats the same runs. Defaults to None.
+            strategy_class: Strategy run on every restart. Defaults to `EvolutionStrategy`.
+            es_kwargs: Further keyword arguments for every run (e.g. selection_type,
+                step_size_control, fitness_cache). Defaults to None.
+            verbose: Print restart banners and the summary; also the default
+                     `verbose` of every run. Defaults to True.
+
+        Raises:
+            ValueError: If restart_strategy is not recognized, or max_evaluations or
+                        population_growth is out of range.
+            ValueError: If es_kwargs sets an argument the restart schedule provides
+                        (stopping_criteria, mu, lambda_, sigma, seed, ...).
+            ValueError: If es_kwargs contains a history_sink (every run would write to
+                        the same file; the merged history is kept in memory).
+        """
+        if restart_strategy not in RESTART_STRATEGIES:
+            raise ValueError(f"Unknown restart_strategy: {restart_strategy}. Use one of {RESTART_STRATEGIES}.")
+        if max_evaluations < 1:
+            raise ValueError("max_evaluations must be >= 1.")
+        if population_growth <= 1.0:
+            raise ValueError("population_growth must be > 1.")
+        if es_kwargs and es_kwargs.get('history_sink') is not None:
+            raise ValueError("history_sink is not supported in es_kwargs: every restart would share one file.")
+        reserved = sorted(set(es_kwargs or {}) & set(_RUN_ARGUMENTS))
+        if reserved:
+            raise ValueError(f"es_kwargs must not set {', '.join(reserved)}: the restart schedule sets these "
+                             f"for every run (control stopping with max_evaluations, stagnation_generations "
+                             f"and target_fitness).")
+        self.objective_function = objective_function
+        self.dimensions = dimensions
+        self.bounds = bounds
+        self.mu = mu
+        self.lambda_ = lambda_
+        self.max_evaluations = max_evaluations
+        self.restart_strategy = restart_strategy
+        self.sigma = sigma
+        self.max_generations = max_generations
+        self.stagnation_generations = stagnation_generations
+        self.target_fitness = target_fitness
+        self.max_restarts = max_restarts
+        self.population_growth = population_growth
+        self.strategy_class = strategy_class
+        self.es_kwargs = dict(es_kwargs or {})
+        self.verbose = verbose
+        # Root entropy is fixed here, so every run() spawns the same child seeds
+        self._seed_entropy = np.random.SeedSequence(seed).entropy
+        self._seed_sequence = np.random.SeedSequence(self._seed_entropy)
+
+        self.best_individual_overall: Optional[Individual] = None
+        self.history: List[Tuple[int, float]] = []
+        self.evaluation_counts: List[int] = []
+        self.evaluations = 0
+        self.generation = 0
+        self.restart_events: List[Dict[str, Any]] = []
+        self.stop_reason: Optional[str] = None
+
+    def _population_sizes(self, lambda_: int) -> Tuple[int, int]:
+        """Returns (mu, lambda_) for a run, keeping the first run's mu/lambda_ ratio."""
+        return max(1, int(round(self.mu * lambda_ / self.lambda_))), lambda_
+
+    def _run_once(self, regime: str, lambda_: int, sigma: float) -> EvolutionStrategy:
+        """Runs one strategy within the remaining budget and merges its results."""
+        mu, lambda_ = self._population_sizes(lambda_)
+        offset = self.history[-1][0] + 1 if self.history else 0
+        event = {
+            'run': len(self.restart_events),
+            'regime': regime,
+            'generation': offset,
+            'evaluations': self.evaluations,
+            'mu': mu,
+            'lambda_': lambda_,
+            'sigma': sigma,
+        }
+        self.restart_events.append(event)
+        if self.verbose:
+            print(f"--- Restart {event['run']} ({self.restart_strategy}, {regime} regime): "
+                  f"mu={mu}, lambda={lambda_}, sigma={sigma:.4g} ---")
+
+        stopping_criteria = StoppingCriteria(
+            target_fitness=self.target_fitness,
+            stagnation_generations=self.stagnation_generations,
+            max_evaluations=self.max_evaluations - self.evaluations,
+        )
+        es_kwargs = dict(self.es_kwargs)
+        es_kwargs.setdefault('verbose', self.verbose)
+        es = self.strategy_class(
+            objective_function=self.objective_function, dimensions=self.dimensions, bounds=self.bounds,
+            mu=mu, lambda_=lambda_, max_generations=self.max_generations, sigma=sigma,
+            seed=self._seed_sequence.spawn(1)[0], stopping_criteria=stopping_criteria, **es_kwargs
+        )
+        es.run()
+
+        # Merge into one continuous best-so-far history
+        best_so_far = self.best_individual_overall.fitness if self.best_individual_overall else np.inf
+        for (generation, fitness), evaluations in zip(es.history, es.evaluation_counts):
+            best_so_far = min(best_so_far, fitness)
+            self.history.append((offset + generation, best_so_far))
+            self.evaluation_counts.append(self.evaluations + evaluations)
+        self.evaluations += es.evaluations
+        self.generation += es.generation
+        if self.best_individual_overall is None or es.best_individual_overall < self.best_individual_overall:
+            self.best_individual_overall = es.best_individual_overall
+
+        event.update({
+            'generations': es.generation,
+            'stop_reason': es.stop_reason,
+            'best_fitness': es.best_individual_overall.fitness,
+        })
+        return es
+
+    def _next_stop_reason(self, es: EvolutionStrategy) -> Optional[str]:
+        """Returns why no further restart is made, or None to restart."""
+        if es.stop_reason == TARGET_FITNESS:
+            return TARGET_FITNESS
+        if self.evaluations >= self.max_evaluations:
+            return MAX_EVALUATIONS
+        if self.max_restarts is not None and len(self.restart_events) > self.max_restarts:
+            return MAX_RESTARTS
+        return None
+
+    def run(self) -> 'RestartingEvolutionStrategy':
+        """
+        Runs and restarts strategies until the budget, target or restart limit is reached.
+
+        Results of a previous call are discarded; with a fixed seed every call
+        repeats exactly the same runs.
+
+        Returns:
+            RestartingEvolutionStrategy: Returns self for convenient access to the results.
+        """
+        self._seed_sequence = np.random.SeedSequence(self._seed_entropy)
+        self.best_individual_overall = None
+        self.history = []
+        self.evaluation_counts = []
+        self.evaluations = 0
+        self.generation = 0
+        self.restart_events = []
+        self.stop_reason = None
+
+        regime_rng = np.random.default_rng(self._seed_sequence.spawn(1)[0])
+        regime_evaluations = {'large': 0, 'small': 0}
+        large_runs = 0
+
+        while True:
+            large_lambda = int(round(self.lambda_ * self.population_growth**large_runs))
+            if (self.restart_strategy == 'bipop' and large_runs > 0
+                    and regime_evaluations['small'] < regime_evaluations['large']):
+                # Small regime: population between the default and half the last large
+                # one, step size reduced by up to a factor of 100
+                u = regime_rng.random()
+                previous_large = int(round(self.lambda_ * self.population_growth**(large_runs - 1)))
+                lambda_ = max(self.lambda_, int(self.lambda_ * (0.5 * previous_large / self.lambda_)**(u**2)))
+                regime, sigma = 'small', self.sigma * 10**(-2 * regime_rng.random())
+            else:
+                regime, lambda_, sigma = 'large', large_lambda, self.sigma
+                large_runs += 1
+
+            evaluations_before = self.evaluations
+            es = self._run_once(regime, lambda_, sigma)
+            regime_evaluations[regime] += self.evaluations - evaluations_before
+            self.stop_reason = self._next_stop_reason(es)
+            if self.stop_reason is not None:
+                break
+
+        if self.verbose:
+            print(f"Restarts finished after {len(self.restart_events)} run(s) and {self.evaluations} evaluations "
+                  f"(stop reason: {self.stop_reason}).")
+            print(f"Final Best Fitness: {self.best_individual_overall.fitness:.6e}")
+            print(f"Best Solution Found: {np.round(self.best_individual_overall.genotype, 5)}")
+        return self
+
+    def get_best_solution(self) -> Optional[Individual]:
+        """Returns the best individual found over all runs, or None before run()."""
+        return self.best_individual_overall
+
+    def get_history(self) -> List[Tuple[int, float]]:
+        """Returns the continuous (generation, best-so-far fitness) history over all runs."""
+        return self.history
+
+    def get_restart_generations(self) -> List[int]:
+        """Returns the history generation at which each restart began (for plot markers)."""
+        return [event['generation'] for event in self.restart_events[1:]]
+
+    def evaluations_to_reach(self, target_fitness: float) -> Optional[int]:
+        """
+        Returns the total evaluations needed to reach a target, or None if never reached.
+
+        Args:
+            target_fitness (float): The fitness value to reach (<=).
+        """
+        for (_, best_fitness), evaluations in zip(self.history, self.evaluation_counts):
+            if best_fitness <= target_fitness:
+                return evaluations
+        return None
@@ -0,0 +1,141 @@
+# es_optimiser/step_size.py
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from .evolution_strategy import EvolutionStrategy, Population
+
+
+class ConstantStepSize:
+    """
+    Keeps the mutation strength fixed at `EvolutionStrategy.sigma` for the whole run.
+
+    Base class for step-size control. A controller is consulted by
+    `EvolutionStrategy._generate_offspring` at two points each generation:
+    `offspring_sigmas` before mutation (which sigma each offspring uses) and
+    `update` after the offspring are evaluated (adapting sigma for the next
+    generation).
+    """
+    name = 'constant'
+
+    def initialize(self, es: 'EvolutionStrategy'):
+        """Prepares controller state once the initial population exists."""
+
+    def offspring_sigmas(self, es: 'EvolutionStrategy', parent_indices: np.ndarray) -> Union[float, np.ndarray]:
+        """
+        Returns the mutation strength for the offspring about to be created.
+
+        Args:
+            es (EvolutionStrategy): The running strategy.
+            parent_indices (np.ndarray): (lambda_,) index of each offspring's parent.
+
+        Returns:
+            Union[float, np.ndarray]: A scalar sigma shared by all offspring, or a
+            (lambda_, 1) column with one sigma per offspring.
+        """
+        return es.sigma
+
+    def update(self, es: 'EvolutionStrategy', offspring: 'Population', parent_fitness: np.ndarray,
+               predicted_fitness: Optional[np.ndarray] = None):
+        """
+        Adapts the step size after the offspring have been evaluated.
+
+        Args:
+            es (EvolutionStrategy): The running strategy.
+            offspring (Population): The evaluated offspring.
+            parent_fitness (np.ndarray): (lambda_,) fitness of each offspring's parent.
+            predicted_fitness (Optional[np.ndarray]): (lambda_,) surrogate predictions for
+                offspring screened out by a surrogate (NaN for truly evaluated ones), or
+                None if every offspring was evaluated.
+        """
+
+
+class OneFifthSuccessRule(ConstantStepSize):
+    """
+    Rechenberg's 1/5th success rule for a single, global step size.
+
+    After each generation the success rate (fraction of offspring strictly
+    better than their parent) is compared to the target rate of 1/5: sigma is
+    enlarged when more offspring succeed and reduced when fewer do. Offspring
+    screened out by a surrogate are judged by their predicted fitness: the
+    truly evaluated ones were chosen for being predicted best, so their own
+    success rate alone would be biased high and keep enlarging sigma.
+
+    Attributes:
+        factor (float): Multiplicative adjustment per generation (0 < factor < 1).
+        target_rate (float): Target success rate. Defaults to 0.2.
+    """
+    name = 'one_fifth'
+
+    def __init__(self, factor: float = 0.85, target_rate: float = 0.2):
+        if not 0.0 < factor < 1.0:
+            raise ValueError("factor must be in (0, 1).")
+        self.factor = factor
+        self.target_rate = target_rate
+
+    def update(self, es: 'EvolutionStrategy', offspring: 'Population', parent_fitness: np.ndarray,
+               predicted_fitness: Optional[np.ndarray] = None):
+        fitness = offspring.fitness
+        if predicted_fitness is not None:
+            fitness = np.where(np.isnan(predicted_fitness), fitness, predicted_fitness)
+        # Offspring without a true fitness (failed evaluations) carry no success information
+        evaluated = np.isfinite(fitness)
+        if not evaluated.any():
+            return
+        success_rate = np.mean(fitness[evaluated] < parent_fitness[evaluated])
+        if success_rate > self.target_rate:
+            es.sigma /= self.factor
+        elif success_rate < self.target_rate:
+            es.sigma *= self.factor
+
+
+class SelfAdaptiveStepSize(ConstantStepSize):
+    """
+    Log-normal self-adaptation of one step size per individual.
+
+    Every individual carries its own sigma (`Population.sigmas`). An offspring
+    inherits its parent's sigma multiplied by exp(tau * N(0, 1)) and is then
+    mutated with it, so step sizes that produce good offspring survive
+    selection together with them.
+
+    Attributes:
+        learning_rate (Optional[float]): tau. Defaults to 1 / sqrt(dimensions).
+    """
+    name = 'self_adaptive'
+
+    def __init__(self, learning_rate: Optional[float] = None):
+        self.learning_rate = learning_rate
+
+    def initialize(self, es: 'EvolutionStrategy'):
+        es.population.sigmas = np.full(len(es.population), es.sigma)
+
+    def offspring_sigmas(self, es: 'EvolutionStrategy', parent_indices: np.ndarray) -> np.ndarray:
+        tau = self.learning_rate if self.learning_rate is not None else 1.0 / np.sqrt(es.dimensions)
+        sigmas = es.population.sigmas[parent_indices] * np.exp(tau * es.rng.standard_normal(len(parent_indices)))
+        return sigmas[:, np.newaxis]
+
+
+STEP_SIZE_CONTROLS: Dict[str, Type[ConstantStepSize]] = {
+    cls.name: cls for cls in (ConstantStepSize, OneFifthSuccessRule, SelfAdaptiveStepSize)
+}
+
+
+def make_step_size_control(spec: Union[str, ConstantStepSize]) -> ConstantStepSize:
+    """
+    Resolves a step-size control given by name or instance.
+
+    Args:
+        spec (Union[str, ConstantStepSize]): 'constant', 'one_fifth',
+            'self_adaptive', or a configured controller instance.
+
+    Returns:
+        ConstantStepSize: The controller instance.
+
+    Raises:
+        ValueError: If the name is not recognized.
+    """
+    if isinstance(spec, ConstantStepSize):
+        return spec
+    if spec not in STEP_SIZE_CONTROLS:
+        raise ValueError(f"Unknown step_size_control: {spec}. Use one of {sorted(STEP_SIZE_CONTROLS)}.")
+    return STEP_SIZE_CONTROLS[spec]()
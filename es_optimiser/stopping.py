@@ -0,0 +1,97 @@
+# es_optimiser/stopping.py
+import time
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .evolution_strategy import EvolutionStrategy
+
+# Stop reasons recorded in `EvolutionStrategy.stop_reason`
+TARGET_FITNESS = 'target_fitness'
+FITNESS_TOLERANCE = 'fitness_tolerance'
+GENOTYPE_TOLERANCE = 'genotype_tolerance'
+STAGNATION = 'stagnation'
+MAX_EVALUATIONS = 'max_evaluations'
+MAX_TIME = 'max_time'
+MAX_GENERATIONS = 'max_generations'
+
+
+class StoppingCriteria:
+    """
+    Early termination conditions for `EvolutionStrategy.run()`.
+
+    Every condition is optional (None disables it) and is checked after
+    initialization and after every generation, in the order listed below; the
+    first one that holds becomes the run's `stop_reason`. The run always ends
+    after `max_generations` ('max_generations') if nothing stops it earlier.
+
+    Attributes:
+        target_fitness (Optional[float]): Stop once the best fitness is <= this value.
+        fitness_tolerance (Optional[float]): Stop once the spread (worst - best) of
+            the parents' fitness values is below this value.
+        genotype_tolerance (Optional[float]): Stop once the largest per-dimension
+            standard deviation of the parents' genotypes is below this value.
+        stagnation_generations (Optional[int]): Stop after this many consecutive
+            generations without improvement of the best fitness.
+        max_evaluations (Optional[int]): Stop once this many objective evaluations
+            have been performed (checked between generations, so a run may
+            overshoot by less than one generation's evaluations).
+        max_time (Optional[float]): Stop once this many wall-clock seconds have
+            elapsed since the run started.
+    """
+    def __init__(
+        self,
+        target_fitness: Optional[float] = None,
+        fitness_tolerance: Optional[float] = None,
+        genotype_tolerance: Optional[float] = None,
+        stagnation_generations: Optional[int] = None,
+        max_evaluations: Optional[int] = None,
+        max_time: Optional[float] = None
+    ):
+        """
+        Initializes the stopping criteria. All default to None (disabled).
+
+        Raises:
+            ValueError: If stagnation_generations or max_evaluations is not positive.
+        """
+        if stagnation_generations is not None and stagnation_generations < 1:
+            raise ValueError("stagnation_generations must be >= 1.")
+        if max_evaluations is not None and max_evaluations < 1:
+            raise ValueError("max_evaluations must be >= 1.")
+        self.target_fitness = target_fitness
+        self.fitness_tolerance = fitness_tolerance
+        self.genotype_tolerance = genotype_tolerance
+        self.stagnation_generations = stagnation_generations
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+
+    def check(self, es: 'EvolutionStrategy', generation: int) -> Optional[str]:
+        """
+        Returns the reason to stop after a generation, or None to continue.
+
+        Args:
+            es (EvolutionStrategy): The running strategy.
+            generation (int): The generation just completed (0 after initialization).
+
+        Returns:
+            Optional[str]: One of the stop reason constants of this module, or None.
+        """
+        if self.target_fitness is not None and es.best_individual_overall.fitness <= self.target_fitness:
+            return TARGET_FITNESS
+        fitness = es.population.fitness
+        if self.fitness_tolerance is not None and fitness.max() - fitness.min() < self.fitness_tolerance:
+            return FITNESS_TOLERANCE
+        if (self.genotype_tolerance is not None
+                and np.max(np.std(es.population.genotypes, axis=0)) < self.genotype_tolerance):
+            return GENOTYPE_TOLERANCE
+        if (self.stagnation_generations is not None
+                and es.generations_without_improvement >= self.stagnation_generations):
+            return STAGNATION
+        if self.max_evaluations is not None and es.evaluations >= self.max_evaluations:
+            return MAX_EVALUATIONS
+        if self.max_time is not None and time.perf_counter() - es.start_time >= self.max_time:
+            return MAX_TIME
+        if generation >= es.max_generations:
+            return MAX_GENERATIONS
+        return None
@@ -0,0 +1,318 @@
+# es_optimiser/store.py
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+RESULTS_DIR = "results"
+DEFAULT_STORE_PATH = os.path.join(RESULTS_DIR, "results.sqlite")
+
+# Configuration keys copied into their own columns (for filtering and grouping)
+CONFIG_COLUMNS = ('objective', 'dimensions', 'mu', 'lambda_', 'sigma', 'selection_type', 'seed')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    config_hash TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    objective TEXT,
+    dimensions INTEGER,
+    mu INTEGER,
+    lambda_ INTEGER,
+    sigma REAL,
+    selection_type TEXT,
+    seed TEXT,
+    best_fitness REAL NOT NULL,
+    elapsed_time REAL NOT NULL,
+    best_solution BLOB,
+    history BLOB NOT NULL,
+    stats TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+
+def compute_code_version(package_dir: Optional[str] = None) -> str:
+    """
+    Returns a digest of the package's source code.
+
+    Any edit to a module of the package changes the digest, so results stored
+    by an older version of the optimizer are not mistaken for current ones.
+
+    Args:
+        package_dir (Optional[str]): Directory whose .py files are hashed.
+                                     Defaults to the es_optimiser package.
+
+    Returns:
+        str: The first 16 hex digits of the SHA-256 over all source files.
+    """
+    package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(package_dir)):
+        if filename.endswith(".py"):
+            digest.update(filename.encode())
+            with open(os.path.join(package_dir, filename), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _canonical(value: Any) -> Any:
+    """Converts tuples and NumPy scalars/arrays into plain JSON values."""
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """
+    Returns the SHA-256 of a configuration's canonical JSON (sorted keys).
+
+    Args:
+        config (Dict[str, Any]): JSON-serializable configuration (tuples and
+                                 NumPy values are converted).
+
+    Returns:
+        str: Hex digest identifying the configuration.
+    """
+    text = json.dumps(_canonical(config), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultStore:
+    """
+    SQLite store of finished runs, keyed by a hash of their full configuration.
+
+    The key covers every configuration value (objective, dimensions, bounds,
+    mu, lambda_, sigma, selection type, seed, ...) plus the code version, so
+    a sweep can ask which of its configurations are `missing` and run only
+    those; results of earlier sweeps are reused instead of recomputed. Each
+    row holds the best fitness, elapsed time, best solution, convergence
+    history and further run statistics, and `aggregate` summarizes the stored
+    runs without rerunning anything.
+
+    Only one process should write to a store at a time (e.g. the process
+    that collects the results of a process pool).
+
+    Attributes:
+        path (str): SQLite database file.
+        code_version (str): Version included in every configuration key.
+    """
+    def __init__(self, path: str = DEFAULT_STORE_PATH, code_version: Optional[str] = None):
+        """
+        Opens (and if needed creates) the store.
+
+        Args:
+            path: Database file. Defaults to results/results.sqlite.
+            code_version: Version string for the keys. Defaults to the digest of
+                          the package sources (see `compute_code_version()`).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.code_version = code_version if code_version is not None else compute_code_version()
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> 'ResultStore':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def key(self, config: Dict[str, Any]) -> str:
+        """Returns the key of a configuration under this store's code version."""
+        return config_hash(dict(config, code_version=self.code_version))
+
+    def __contains__(self, config: Dict[str, Any]) -> bool:
+        query = "SELECT 1 FROM runs WHERE config_hash = ?"
+        return self._connection.execute(query, (self.key(config),)).fetchone() is not None
+
+    def missing(self, configs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Returns the configurations that have no stored result yet, in order.
+
+        Args:
+            configs (Iterable[Dict[str, Any]]): Configurations of a sweep.
+
+        Returns:
+            List[Dict[str, Any]]: The configurations still to run.
+        """
+        return [config for config in configs if config not in self]
+
+    def put(self, config: Dict[str, Any], best_fitness: float, elapsed_time: float,
+            history: Sequence[Tuple[int, float]], best_solution: Optional[np.ndarray] = None,
+            stats: Optional[Dict[str, Any]] = None):
+        """
+        Stores (or replaces) the result of one run.
+
+        Args:
+            config: The run's configuration.
+            best_fitness: Best fitness found.
+            elapsed_time: Wall-clock duration of the run in seconds.
+            history: (generation, best fitness) pairs.
+            best_solution: Best genotype. Defaults to None.
+            stats: Further JSON-serializable statistics (generations, evaluations,
+                   stop reason, ...). Defaults to None.
+        """
+        config = _canonical(config)
+        row = {
+            'config_hash': self.key(config),
+            'config': json.dumps(config, sort_keys=True),
+            'code_version': self.code_version,
+            **{column: config.get(column) for column in CONFIG_COLUMNS},
+            'best_fitness': float(best_fitness),
+            'elapsed_time': float(elapsed_time),
+            'best_solution': (np.asarray(best_solution, dtype=np.float64).tobytes()
+                              if best_solution is not None else None),
+            'history': np.asarray(history, dtype=np.float64).reshape(-1, 2).tobytes(),
+            'stats': json.dumps(_canonical(stats or {}), sort_keys=True),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        if row['seed'] is not None:
+            row['seed'] = str(row['seed'])
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{column}" for column in row)
+        self._connection.execute(f"INSERT OR REPLACE INTO runs ({columns}) VALUES ({placeholders})", row)
+        self._connection.commit()
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        """Converts a database row into a result dictionary."""
+        record = dict(row)
+        record['config'] = json.loads(record['config'])
+        record['stats'] = json.loads(record['stats'])
+        if record['best_solution'] is not None:
+            record['best_solution'] = np.frombuffer(record['best_solution'], dtype=np.float64)
+        history = np.frombuffer(record['history'], dtype=np.float64).reshape(-1, 2)
+        record['history'] = [(int(generation), float(fitness)) for generation, fitness in history]
+        return record
+
+    def _query(self, where: str = "", parameters: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Runs a SELECT over the runs table and decodes the rows."""
+        self._connection.row_factory = sqlite3.Row
+        try:
+            rows = self._connection.execute(f"SELECT * FROM runs {where} ORDER BY created_at, rowid",
+                                            parameters).fetchall()
+        finally:
+            self._connection.row_factory = None
+        return [self._decode(row) for row in rows]
+
+    def get(self, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored result of a configuration, or None.
+
+        Returns:
+            Optional[Dict[str, Any]]: The row's columns, with config and stats decoded
+            from JSON, best_solution as an array and history as (generation, fitness) pairs.
+        """
+        records = self._query("WHERE config_hash = ?", (self.key(config),))
+        return records[0] if records else None
+
+    def records(self, all_versions: bool = False, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Returns stored results, optionally filtered by configuration columns.
+
+        Args:
+            all_versions (bool): Include results of other code versions. Defaults to False.
+            **filters: Column values to match, e.g. objective='rastrigin', dimensions=2.
+
+        Returns:
+            List[Dict[str, Any]]: Decoded rows (see `get`), oldest first.
+
+        Raises:
+            ValueError: If a filter is not a configuration column.
+        """
+        unknown = set(filters) - set(CONFIG_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown filter(s): {sorted(unknown)}. Use one of {CONFIG_COLUMNS}.")
+        conditions, parameters = [], []
+        if not all_versions:
+            conditions.append("code_version = ?")
+            parameters.append(self.code_version)
+        for column, value in filters.items():
+            conditions.append(f"{column} = ?")
+            parameters.append(str(value) if column == 'seed' else value)
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return self._query(where, parameters)
+
+    def aggregate(self, group_by: Sequence[str] = ('objective', 'dimensions', 'selection_type'),
+                  configs: Optional[Iterable[Dict[str, Any]]] = None, all_versions: bool = False,
+                  **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Summarizes stored runs per group.
+
+        Args:
+            group_by: Configuration keys to group by. Defaults to objective,
+                      dimensions and selection type.
+            configs: Restrict the summary to these configurations (e.g. one sweep).
+                     Defaults to all matching runs.
+            all_versions: Include results of other code versions. Defaults to False.
+            **filters: Column filters, as in `records`.
+
+        Returns:
+            List[Dict[str, Any]]: Per group (sorted by its key values): the key values,
+            runs, best, mean, median and std of the best fitness, and mean elapsed time.
+        """
+        records = self.records(all_versions=all_versions, **filters)
+        if configs is not None:
+            keys = {self.key(config) for config in configs}
+            records = [record for record in records if record['config_hash'] in keys]
+
+        groups: Dict[Tuple, List[Dict[str, Any]]] = {}
+        for record in records:
+            values = (record['config'].get(key) for key in group_by)
+            group = tuple(tuple(value) if isinstance(value, list) else value for value in values)
+            groups.setdefault(group, []).append(record)
+
+        summary = []
+        for group in sorted(groups, key=lambda values: tuple(map(str, values))):
+            best_fitness = np.array([record['best_fitness'] for record in groups[group]])
+            elapsed_time = np.array([record['elapsed_time'] for record in groups[group]])
+            summary.append({
+                **dict(zip(group_by, group)),
+                'runs': len(best_fitness),
+                'best': float(best_fitness.min()),
+                'mean': float(best_fitness.mean()),
+                'median': float(np.median(best_fitness)),
+                'std': float(best_fitness.std()),
+                'mean_elapsed_time': float(elapsed_time.mean()),
+            })
+        return summary
+
+
+def format_report(summary: List[Dict[str, Any]]) -> str:
+    """
+    Formats the output of `ResultStore.aggregate` as a plain-text table.
+
+    Args:
+        summary (List[Dict[str, Any]]): Aggregated groups.
+
+    Returns:
+        str: One header line and one line per group.
+    """
+    if not summary:
+        return "No stored results."
+    columns = list(summary[0])
+    cells = [[f"{row[column]:.4e}" if isinstance(row[column], float) else str(row[column]) for column in columns]
+             for row in summary]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.ljust(width) for column, width in zip(columns, widths)).rstrip()]
+    lines += ["  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in cells]
+    return "\n".join(lines)
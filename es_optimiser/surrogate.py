@@ -0,0 +1,240 @@
+# es_optimiser/surrogate.py
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+SURROGATE_MODELS = ('knn', 'rbf')
+
+
+def _rank_correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """Spearman rank correlation of two vectors (ties broken by position)."""
+    ranks_a = np.argsort(np.argsort(a, kind='stable'), kind='stable')
+    ranks_b = np.argsort(np.argsort(b, kind='stable'), kind='stable')
+    return float(np.corrcoef(ranks_a, ranks_b)[0, 1])
+
+
+def _distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean distances between the rows of a (n, d) and b (m, d), as an (n, m) matrix."""
+    squared = (a**2).sum(axis=1)[:, np.newaxis] + (b**2).sum(axis=1) - 2.0 * a @ b.T
+    return np.sqrt(np.maximum(squared, 0.0, out=squared), out=squared)
+
+
+class SurrogateScreen:
+    """
+    Pre-screens offspring with a cheap surrogate model of the objective.
+
+    Every truly evaluated (genotype, fitness) pair goes into a fixed-size
+    archive (the oldest entries are overwritten). For a new batch of
+    offspring the surrogate predicts all fitness values, and only the most
+    promising `fraction` of the batch (but at least `min_evaluations`, e.g. mu,
+    so selection always has enough truly evaluated candidates) is sent to the
+    real objective. The screened-out offspring get fitness np.inf, so they can
+    never be selected. Until the archive holds enough points to fit the model,
+    every offspring is evaluated.
+
+    Models:
+        'knn': inverse-distance weighted mean of the k nearest archive points.
+        'rbf': cubic radial basis function interpolant with a linear tail, fitted
+               to the `rbf_points` most recent archive points (a local model
+               around the current search region). Needs more than d + 1 points.
+
+    The accuracy of the surrogate is measured on every screened batch, from the
+    candidates that were truly evaluated: the Spearman rank correlation between
+    predicted and true fitness (what matters for selection) and the mean
+    absolute error.
+
+    Attributes:
+        model (str): 'knn' or 'rbf'.
+        fraction (float): Fraction of each batch sent to the real objective.
+        k (int): Neighbours used by the 'knn' model.
+        archive_size (int): Maximum number of archived evaluations.
+        rbf_points (int): Archive points used to fit the 'rbf' model.
+        true_evaluations (int): Offspring sent to the real objective.
+        saved_evaluations (int): Offspring screened out by the surrogate.
+        screened_batches (int): Batches in which the surrogate was used.
+        last_predictions (Optional[np.ndarray]): Predicted fitness of the last batch's
+            screened-out candidates (NaN for the truly evaluated ones), or None if
+            the last batch was evaluated in full.
+    """
+    def __init__(self, model: str = 'knn', fraction: float = 0.25, k: int = 8, archive_size: int = 5000,
+                 rbf_points: int = 200):
+        """
+        Initializes the screen with an empty archive.
+
+        Args:
+            model: 'knn' or 'rbf'. Defaults to 'knn'.
+            fraction: Fraction of each batch to evaluate, in (0, 1]. Defaults to 0.25.
+            k: Neighbours for 'knn'. Defaults to 8.
+            archive_size: Archive capacity. Defaults to 5000.
+            rbf_points: Points fitted by 'rbf'. Defaults to 200.
+
+        Raises:
+            ValueError: If the model is not recognized or a parameter is out of range.
+        """
+        if model not in SURROGATE_MODELS:
+            raise ValueError(f"Unknown surrogate model: {model}. Use one of {SURROGATE_MODELS}.")
+        if not 0.0 < fraction <= 1.0:
+            raise ValueError("fraction must be in (0, 1].")
+        if k < 1 or archive_size < 1 or rbf_points < 2:
+            raise ValueError("k and archive_size must be >= 1, rbf_points >= 2.")
+        self.model = model
+        self.fraction = fraction
+        self.k = k
+        self.archive_size = archive_size
+        self.rbf_points = rbf_points
+        self.true_evaluations = 0
+        self.saved_evaluations = 0
+        self.screened_batches = 0
+        self._archive_genotypes: Optional[np.ndarray] = None
+        self._archive_fitness: Optional[np.ndarray] = None
+        self._archive_count = 0
+        self._archive_next = 0
+        self._rank_correlation_sum = 0.0
+        self._rank_correlation_batches = 0
+        self._absolute_error_sum = 0.0
+        self._predicted_evaluated = 0
+        self.last_predictions: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._archive_count
+
+    def observe(self, genotypes: np.ndarray, fitness: np.ndarray):
+        """
+        Adds truly evaluated genotypes to the archive (non-finite fitness is skipped).
+
+        Args:
+            genotypes (np.ndarray): (n, d) evaluated genotypes.
+            fitness (np.ndarray): (n,) their true fitness values.
+        """
+        finite = np.isfinite(fitness)
+        genotypes, fitness = genotypes[finite], fitness[finite]
+        if self._archive_genotypes is None:
+            self._archive_genotypes = np.empty((self.archive_size, genotypes.shape[1]))
+            self._archive_fitness = np.empty(self.archive_size)
+        # Ring buffer: only the newest archive_size rows of a large batch are kept
+        for row in range(max(0, len(fitness) - self.archive_size), len(fitness)):
+            self._archive_genotypes[self._archive_next] = genotypes[row]
+            self._archive_fitness[self._archive_next] = fitness[row]
+            self._archive_next = (self._archive_next + 1) % self.archive_size
+            self._archive_count = min(self._archive_count + 1, self.archive_size)
+
+    def _ready(self, dimensions: int) -> bool:
+        """Returns True if the archive holds enough points to fit the model."""
+        if self.model == 'knn':
+            return self._archive_count >= self.k
+        return min(self._archive_count, self.rbf_points) > dimensions + 1
+
+    def predict(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Predicts fitness values from the archive.
+
+        Args:
+            genotypes (np.ndarray): (n, d) candidates.
+
+        Returns:
+            np.ndarray: (n,) predicted fitness values.
+        """
+        if self.model == 'knn':
+            return self._predict_knn(genotypes)
+        return self._predict_rbf(genotypes)
+
+    def _predict_knn(self, genotypes: np.ndarray) -> np.ndarray:
+        """Inverse-distance weighted mean of the k nearest archive points."""
+        archive = self._archive_genotypes[:self._archive_count]
+        fitness = self._archive_fitness[:self._archive_count]
+        distances = _distances(genotypes, archive)
+        k = min(self.k, self._archive_count)
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        weights = 1.0 / (np.take_along_axis(distances, nearest, axis=1) + 1e-12)
+        return (weights * fitness[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+    def _predict_rbf(self, genotypes: np.ndarray) -> np.ndarray:
+        """Cubic RBF interpolant with a linear tail over the most recent archive points."""
+        n_points = min(self._archive_count, self.rbf_points)
+        recent = (self._archive_next - 1 - np.arange(n_points)) % self.archive_size
+        centers = self._archive_genotypes[recent]
+        values = self._archive_fitness[recent]
+        dimensions = centers.shape[1]
+
+        # Solve [[Phi, P], [P^T, 0]] [w; c] = [f; 0] (least squares, robust to duplicates)
+        phi = _distances(centers, centers)**3
+        tail = np.hstack((np.ones((n_points, 1)), centers))
+        system = np.zeros((n_points + dimensions + 1, n_points + dimensions + 1))
+        system[:n_points, :n_points] = phi
+        system[:n_points, n_points:] = tail
+        system[n_points:, :n_points] = tail.T
+        rhs = np.concatenate((values, np.zeros(dimensions + 1)))
+        coefficients = np.linalg.lstsq(system, rhs, rcond=None)[0]
+
+        return _distances(genotypes, centers)**3 @ coefficients[:n_points] + np.hstack(
+            (np.ones((genotypes.shape[0], 1)), genotypes)) @ coefficients[n_points:]
+
+    def evaluate(self, genotypes: np.ndarray, objective: Callable[[np.ndarray], np.ndarray],
+                 min_evaluations: int = 1) -> np.ndarray:
+        """
+        Evaluates the most promising part of a batch and screens out the rest.
+
+        Args:
+            genotypes (np.ndarray): (n, d) candidates.
+            objective (Callable[[np.ndarray], np.ndarray]): The true batch objective.
+            min_evaluations (int): Minimum number of candidates to evaluate truly.
+
+        Returns:
+            np.ndarray: (n,) fitness values; np.inf for screened-out candidates.
+        """
+        n = genotypes.shape[0]
+        n_evaluate = min(n, max(min_evaluations, int(np.ceil(self.fraction * n))))
+        if n_evaluate == n or not self._ready(genotypes.shape[1]):
+            fitness = objective(genotypes)
+            self.true_evaluations += n
+            self.observe(genotypes, fitness)
+            self.last_predictions = None
+            return fitness
+
+        predicted = self.predict(genotypes)
+        chosen = np.argpartition(predicted, n_evaluate - 1)[:n_evaluate]
+        true_fitness = objective(genotypes[chosen])
+        fitness = np.full(n, np.inf)
+        fitness[chosen] = true_fitness
+        self.last_predictions = predicted.copy()
+        self.last_predictions[chosen] = np.nan
+
+        # Accuracy on the evaluated candidates
+        if n_evaluate >= 3:
+            correlation = _rank_correlation(predicted[chosen], true_fitness)
+            if np.isfinite(correlation):
+                self._rank_correlation_sum += correlation
+                self._rank_correlation_batches += 1
+        finite = np.isfinite(true_fitness)
+        self._absolute_error_sum += float(np.abs(predicted[chosen][finite] - true_fitness[finite]).sum())
+        self._predicted_evaluated += int(finite.sum())
+
+        self.true_evaluations += n_evaluate
+        self.saved_evaluations += n - n_evaluate
+        self.screened_batches += 1
+        self.observe(genotypes[chosen], true_fitness)
+        return fitness
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns screening counters and surrogate accuracy.
+
+        Returns:
+            Dict[str, float]: true_evaluations, saved_evaluations, screened_batches,
+            savings (saved / all candidates), rank_correlation (mean Spearman
+            correlation between predicted and true fitness of evaluated candidates;
+            NaN if never measured), mean_absolute_error (NaN if never measured)
+            and archive size.
+        """
+        candidates = self.true_evaluations + self.saved_evaluations
+        return {
+            "true_evaluations": self.true_evaluations,
+            "saved_evaluations": self.saved_evaluations,
+            "screened_batches": self.screened_batches,
+            "savings": self.saved_evaluations / candidates if candidates else 0.0,
+            "rank_correlation": (self._rank_correlation_sum / self._rank_correlation_batches
+                                 if self._rank_correlation_batches else float('nan')),
+            "mean_absolute_error": (self._absolute_error_sum / self._predicted_evaluated
+                                    if self._predicted_evaluated else float('nan')),
+            "archive": self._archive_count,
+        }
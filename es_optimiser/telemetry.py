@@ -0,0 +1,151 @@
+# es_optimiser/telemetry.py
+import os
+
+import numpy as np
+
+# One fixed-width record per generation
+HISTORY_DTYPE = np.dtype([
+    ('generation', '<i8'),
+    ('evaluations', '<i8'),         # cumulative objective evaluations
+    ('best_fitness', '<f8'),        # best fitness found so far (as in get_history())
+    ('current_best_fitness', '<f8'),
+    ('mean_fitness', '<f8'),
+    ('median_fitness', '<f8'),
+    ('worst_fitness', '<f8'),
+    ('sigma', '<f8'),               # global step size; median parent sigma under self-adaptation
+    ('spread', '<f8'),              # mean per-dimension standard deviation of the parents
+])
+
+_MAGIC = b'ESHIST01'
+# File header: magic bytes followed by the record size (little-endian uint64)
+HEADER_SIZE = len(_MAGIC) + 8
+
+
+class HistorySink:
+    """
+    Streams per-generation telemetry to an append-only binary file.
+
+    Records (`HISTORY_DTYPE`) are buffered in a preallocated chunk and written
+    to disk as raw fixed-width bytes whenever the chunk fills up (and on
+    `flush()`), so memory use stays constant no matter how many generations a
+    run lasts. The file is a 16-byte header followed by the records, and can
+    be read back at any time as a memory-mapped structured array with
+    `load_history`.
+
+    The sigma column holds the global step size, except with per-individual
+    step sizes ('self_adaptive'), where it holds the median of the parents'
+    sigmas (the global sigma does not change there).
+
+    Attributes:
+        path (str): The telemetry file.
+        chunk_size (int): Records buffered in memory between writes.
+    """
+    def __init__(self, path: str, chunk_size: int = 4096, append: bool = False):
+        """
+        Opens (or creates) a telemetry file.
+
+        Args:
+            path: File to write.
+            chunk_size: Records per write. Defaults to 4096.
+            append: Continue an existing file instead of starting a new one.
+                    Defaults to False (any existing file is replaced).
+
+        Raises:
+            ValueError: If chunk_size is not positive, or an existing file to
+                        append to has an incompatible header.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1.")
+        self.path = path
+        self.chunk_size = chunk_size
+        self._buffer = np.empty(chunk_size, dtype=HISTORY_DTYPE)
+        self._buffered = 0
+
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            _check_header(path)
+            self._written = (os.path.getsize(path) - HEADER_SIZE) // HISTORY_DTYPE.itemsize
+            self._file = open(path, 'ab')
+        else:
+            self._written = 0
+            self._file = open(path, 'wb')
+            self._file.write(_MAGIC + np.uint64(HISTORY_DTYPE.itemsize).astype('<u8').tobytes())
+            self._file.flush()
+
+    def __len__(self) -> int:
+        return self._written + self._buffered
+
+    def append(self, generation: int, evaluations: int, best_fitness: float, current_best_fitness: float,
+               mean_fitness: float, median_fitness: float, worst_fitness: float, sigma: float, spread: float):
+        """Buffers one generation's record, writing the chunk to disk when it is full."""
+        self._buffer[self._buffered] = (generation, evaluations, best_fitness, current_best_fitness,
+                                        mean_fitness, median_fitness, worst_fitness, sigma, spread)
+        self._buffered += 1
+        if self._buffered == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered records to the file."""
+        if self._buffered:
+            self._file.write(self._buffer[:self._buffered].tobytes())
+            self._written += self._buffered
+            self._buffered = 0
+        self._file.flush()
+
+    def truncate(self, n_records: int):
+        """
+        Discards everything after the first n_records records (e.g. when resuming
+        from a checkpoint taken before the last records were written).
+        """
+        self.flush()
+        n_records = min(n_records, self._written)
+        self._file.truncate(HEADER_SIZE + n_records * HISTORY_DTYPE.itemsize)
+        self._written = n_records
+
+    def read(self) -> np.ndarray:
+        """Flushes, then returns the whole file as a read-only memory-mapped array."""
+        self.flush()
+        return load_history(self.path)
+
+    def close(self):
+        """Flushes and closes the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> 'HistorySink':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _check_header(path: str):
+    """Validates the header of a telemetry file."""
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) != HEADER_SIZE or header[:len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"{path} is not an ES telemetry file.")
+    record_size = int(np.frombuffer(header[len(_MAGIC):], dtype='<u8')[0])
+    if record_size != HISTORY_DTYPE.itemsize:
+        raise ValueError(f"{path} has records of {record_size} bytes; expected {HISTORY_DTYPE.itemsize}.")
+
+
+def load_history(path: str) -> np.ndarray:
+    """
+    Opens a telemetry file as a memory-mapped NumPy structured array.
+
+    Args:
+        path (str): File written by `HistorySink`.
+
+    Returns:
+        np.ndarray: Read-only array of `HISTORY_DTYPE` records; fields are
+        accessed by name, e.g. history['best_fitness'], without loading the file.
+
+    Raises:
+        ValueError: If the file is not a compatible telemetry file.
+    """
+    _check_header(path)
+    n_records = (os.path.getsize(path) - HEADER_SIZE) // HISTORY_DTYPE.itemsize
+    if n_records == 0:
+        return np.empty(0, dtype=HISTORY_DTYPE)
+    return np.memmap(path, dtype=HISTORY_DTYPE, mode='r', offset=HEADER_SIZE, shape=(n_records,))
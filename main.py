@@ -4,55 +4,133 @@ import time
 import os
 import uuid  # For generating batch UUID
 import numpy as np
+from es_optimiser.cache import FitnessCache
 from es_optimiser.evolution_strategy import EvolutionStrategy
+from es_optimiser.experiments import describe_seed, run_grid, spawn_seeds
 from es_optimiser.objective_functions import rastrigin
-from es_optimiser.plot import PLOTS_DIR, plot_convergence, plot_rastrigin_2d_landscape
+from es_optimiser.stopping import StoppingCriteria
+from es_optimiser.plot import PLOTS_DIR, plot_convergence, plot_landscape_2d
+from es_optimiser.render import PlotRenderQueue
+from es_optimiser.store import ResultStore, format_report
 
 # === BATCH SETUP ===
-# Generate a unique batch ID for this execution (UUID4)
-BATCH_ID = str(uuid.uuid4())
-PLOTS_BATCH_DIR = os.path.join(PLOTS_DIR, BATCH_ID)
-os.makedirs(PLOTS_BATCH_DIR, exist_ok=True)
-
-# Configure logging: log file is named with the batch ID
+# Set by setup_batch() when the script runs; importing this module has no side effects
+BATCH_ID = None
+PLOTS_BATCH_DIR = None
 LOGS_DIR = "logs"
-os.makedirs(LOGS_DIR, exist_ok=True)
-# Set up logging configuration
-LOG_FILENAME = os.path.join(LOGS_DIR, f"log_{BATCH_ID}.log")
-logging.basicConfig(
-    filename=LOG_FILENAME,
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    filemode='w'
-)
-
-# Print batch ID to console for reference
-print(f"Batch ID for this run: {BATCH_ID}")
-print(f"All plots will be saved in: {PLOTS_BATCH_DIR}")
-print(f"Log file: {LOG_FILENAME}")
-
-# Log the batch ID at the top of the log file
-logging.info(f"========== BATCH ID: {BATCH_ID} ==========")
-logging.info(f"Batch started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-logging.info(f"Plots directory: {PLOTS_BATCH_DIR}")
-
-def run_es_optimization(selection_strategy, random_seed, run_label=None):
-    PROBLEM_DIMENSIONS = 2
-    SEARCH_BOUNDS = (-5.12, 5.12)
-    POPULATION_MU = 30
-    OFFSPRING_LAMBDA = 200
-    GENERATIONS = 250
-    MUTATION_SIGMA = 0.2
+LOG_FILENAME = None
+
+def setup_batch():
+    """
+    Creates this execution's batch: a UUID4 batch ID, its plots folder and its log file.
+    """
+    global BATCH_ID, PLOTS_BATCH_DIR, LOG_FILENAME
+    # Generate a unique batch ID for this execution (UUID4)
+    BATCH_ID = str(uuid.uuid4())
+    PLOTS_BATCH_DIR = os.path.join(PLOTS_DIR, BATCH_ID)
+    os.makedirs(PLOTS_BATCH_DIR, exist_ok=True)
+
+    # Configure logging: log file is named with the batch ID
+    os.makedirs(LOGS_DIR, exist_ok=True)
+    LOG_FILENAME = os.path.join(LOGS_DIR, f"log_{BATCH_ID}.log")
+    logging.basicConfig(
+        filename=LOG_FILENAME,
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        filemode='w'
+    )
+
+    # Print batch ID to console for reference
+    print(f"Batch ID for this run: {BATCH_ID}")
+    print(f"All plots will be saved in: {PLOTS_BATCH_DIR}")
+    print(f"Log file: {LOG_FILENAME}")
+
+    # Log the batch ID at the top of the log file
+    logging.info(f"========== BATCH ID: {BATCH_ID} ==========")
+    logging.info(f"Batch started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logging.info(f"Plots directory: {PLOTS_BATCH_DIR}")
+
+# === PROBLEM CONFIGURATION ===
+PROBLEM_DIMENSIONS = 2
+SEARCH_BOUNDS = (-5.12, 5.12)
+POPULATION_MU = 30
+OFFSPRING_LAMBDA = 200
+GENERATIONS = 250
+MUTATION_SIGMA = 0.2
+FITNESS_CACHE_ENTRIES = None  # LRU cap for memoized objective values; None disables the cache
+                              # (continuous objectives almost never repeat a genotype)
+STAGNATION_GENERATIONS = 50  # Stop early after this many generations without improvement
+
+def run_config(selection_strategy, random_seed):
+    """
+    Returns the full configuration of one run, as keyed in the result store.
+    """
+    return {
+        "objective": rastrigin.__name__,
+        "dimensions": PROBLEM_DIMENSIONS,
+        "bounds": SEARCH_BOUNDS,
+        "mu": POPULATION_MU,
+        "lambda_": OFFSPRING_LAMBDA,
+        "sigma": MUTATION_SIGMA,
+        "selection_type": selection_strategy,
+        "seed": describe_seed(random_seed),
+        "max_generations": GENERATIONS,
+        "stagnation_generations": STAGNATION_GENERATIONS,
+    }
+
+def save_run_plots(run_label, selection_strategy, random_seed, convergence_history, best_genotype, render_queue=None):
+    """
+    Saves the convergence and (for 2D problems) landscape plots of one run.
+
+    With a render_queue the plots are handed to its background workers and this
+    returns immediately; otherwise they are rendered synchronously.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Convergence and landscape plot paths.
+    """
+    convergence_plot_path = None
+    landscape_plot_path = None
+    plot_jobs = []
+
+    if convergence_history:
+        convergence_plot_filename = f"convergence_{run_label}.png"
+        convergence_plot_path = os.path.join(PLOTS_BATCH_DIR, convergence_plot_filename)
+        plot_jobs.append((plot_convergence, (convergence_history,), {
+            "title": f"Convergence ({selection_strategy}, seed={describe_seed(random_seed)})",
+            "filename": convergence_plot_path
+        }))
+
+    if best_genotype is not None and PROBLEM_DIMENSIONS == 2:
+        landscape_plot_filename = f"landscape_{run_label}.png"
+        landscape_plot_path = os.path.join(PLOTS_BATCH_DIR, landscape_plot_filename)
+        # The landscape grid is computed once and then served from the grid cache
+        plot_jobs.append((plot_landscape_2d, (rastrigin,), {
+            "bounds": SEARCH_BOUNDS,
+            "best_solution": best_genotype,
+            "filename": landscape_plot_path,
+            "known_optimum": (0.0, 0.0)
+        }))
 
+    for plot_function, args, kwargs in plot_jobs:
+        if render_queue is not None:
+            render_queue.submit(plot_function, *args, **kwargs)
+            logging.info(f"Plot queued for rendering: {kwargs['filename']}")
+        else:
+            plot_function(*args, **kwargs)
+            logging.info(f"Plot saved: {kwargs['filename']}")
+
+    return convergence_plot_path, landscape_plot_path
+
+def run_es_optimization(selection_strategy, random_seed, run_label=None, render_queue=None, make_plots=True):
     if run_label is None:
-        run_label = f"{selection_strategy.replace(' ', '').replace(',', '').replace('+', 'plus')}_seed{random_seed}"
+        run_label = f"{selection_strategy.replace(' ', '').replace(',', '').replace('+', 'plus')}_seed{describe_seed(random_seed)}"
 
     logging.info("========================================")
     logging.info(f"Run ID: {run_label} (Batch: {BATCH_ID})")
     logging.info(f"Run started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logging.info(f"Starting ES Optimization with the following configuration:")
     logging.info(f"SELECTION_STRATEGY: {selection_strategy}")
-    logging.info(f"RANDOM_SEED: {random_seed}")
+    logging.info(f"RANDOM_SEED: {describe_seed(random_seed)}")
 
     start_time = time.time()
 
@@ -65,7 +143,9 @@ def run_es_optimization(selection_strategy, random_seed, run_label=None):
         max_generations=GENERATIONS,
         sigma=MUTATION_SIGMA,
         selection_type=selection_strategy,
-        seed=random_seed
+        seed=random_seed,
+        fitness_cache=FitnessCache(max_entries=FITNESS_CACHE_ENTRIES) if FITNESS_CACHE_ENTRIES else None,
+        stopping_criteria=StoppingCriteria(stagnation_generations=STAGNATION_GENERATIONS)
     )
 
     es_optimizer.run()
@@ -75,6 +155,18 @@ def run_es_optimization(selection_strategy, random_seed, run_label=None):
 
     best_found = es_optimizer.get_best_solution()
     convergence_history = es_optimizer.get_history()
+    run_stats = {
+        "Generations": es_optimizer.generation,
+        "Stop Reason": es_optimizer.stop_reason,
+        "Evaluations": es_optimizer.evaluations,
+    }
+    cache_stats = es_optimizer.fitness_cache.stats() if es_optimizer.fitness_cache is not None else None
+    if cache_stats is not None:
+        run_stats.update({
+            "Cache Hits": cache_stats["hits"],
+            "Cache Misses": cache_stats["misses"],
+            "Cache Evictions": cache_stats["evictions"],
+        })
 
     if best_found:
         distance_to_origin = np.linalg.norm(best_found.genotype)
@@ -82,62 +174,105 @@ def run_es_optimization(selection_strategy, random_seed, run_label=None):
         logging.info(f"Best Individual Found: {best_found}")
         logging.info(f"Distance from Origin (Global Optimum): {distance_to_origin:.4e}")
         logging.info(f"Elapsed Time: {elapsed_time:.2f} seconds")
+        logging.info(f"Stopped after {es_optimizer.generation} generations (reason: {es_optimizer.stop_reason})")
+        if cache_stats is not None:
+            logging.info(f"Objective Evaluations: {es_optimizer.evaluations} "
+                         f"(cache hits: {cache_stats['hits']}, misses: {cache_stats['misses']}, "
+                         f"evictions: {cache_stats['evictions']})")
+        else:
+            logging.info(f"Objective Evaluations: {es_optimizer.evaluations}")
     else:
         logging.warning("Optimization did not complete successfully or find a best individual.")
 
     # --- Save plots in batch folder ---
     convergence_plot_path = None
     landscape_plot_path = None
-
-    if convergence_history:
-        convergence_plot_filename = f"convergence_{run_label}.png"
-        convergence_plot_path = os.path.join(PLOTS_BATCH_DIR, convergence_plot_filename)
-        plot_convergence(
-            convergence_history,
-            title=f"Convergence ({selection_strategy}, seed={random_seed})",
-            filename=convergence_plot_path
-        )
-        logging.info(f"Convergence plot saved: {convergence_plot_path}")
-
-    if best_found is not None and PROBLEM_DIMENSIONS == 2:
-        landscape_plot_filename = f"landscape_{run_label}.png"
-        landscape_plot_path = os.path.join(PLOTS_BATCH_DIR, landscape_plot_filename)
-        plot_rastrigin_2d_landscape(
-            bounds=SEARCH_BOUNDS,
-            best_solution=best_found.genotype,
-            filename=landscape_plot_path
+    if make_plots:
+        convergence_plot_path, landscape_plot_path = save_run_plots(
+            run_label, selection_strategy, random_seed, convergence_history,
+            best_found.genotype if best_found is not None else None, render_queue=render_queue
         )
-        logging.info(f"2D landscape plot saved: {landscape_plot_path}")
 
     logging.info(f"Run ended at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logging.info(f"Total Elapsed Time: {elapsed_time:.2f} seconds")
     logging.info("========================================")
 
-    return elapsed_time, best_found, convergence_history, convergence_plot_path, landscape_plot_path
+    return elapsed_time, best_found, convergence_history, convergence_plot_path, landscape_plot_path, run_stats
+
+def run_grid_job(selection_strategy, random_seed, run_label):
+    """
+    Runs one grid configuration (in a worker process) and returns its results dictionary.
+
+    Plots are not rendered here; the parent process queues them for background
+    rendering so that the worker can start its next optimization immediately.
+    """
+    elapsed_time, best_found, convergence_history, _, _, run_stats = run_es_optimization(
+        selection_strategy, random_seed, run_label=run_label, make_plots=False
+    )
+    return {
+        "Run Label": run_label,
+        "Selection Strategy": selection_strategy,
+        "Random Seed": describe_seed(random_seed),
+        "Elapsed Time (s)": elapsed_time,
+        "Best Fitness": best_found.fitness if best_found else float("inf"),
+        "Best Solution": best_found.genotype if best_found else None,
+        "Distance to Origin": np.linalg.norm(best_found.genotype) if best_found else None,
+        "Convergence History": convergence_history,
+        **run_stats
+    }
 
 if __name__ == "__main__":
+    setup_batch()
     selection_strategies = ['(mu, lambda)', '(mu + lambda)']
-    random_seeds = [123, 332, 456, 789, 101, 202, 303, 404]  # 8 seeds for 16 runs
+    RUNS_PER_STRATEGY = 8  # 8 seeds for 16 runs
+    ROOT_SEED = 123  # Per-run seeds are spawned from this root (SeedSequence.spawn)
 
-    results = []
+    jobs = []
     for i, selection_strategy in enumerate(selection_strategies):
-        for j, random_seed in enumerate(random_seeds):
+        for j in range(RUNS_PER_STRATEGY):
             run_label = f"{'A' if i == 0 else 'B'}{j+1}"
-            print(f"Running ES with {selection_strategy} and seed {random_seed} (Run {run_label})...")
-            elapsed_time, best_found, _, convergence_plot_path, landscape_plot_path = run_es_optimization(
-                selection_strategy, random_seed, run_label=run_label
+            jobs.append({"selection_strategy": selection_strategy, "run_label": run_label})
+
+    # Completed configurations are read from the store instead of being rerun
+    store = ResultStore()
+    sweep_configs = [run_config(job["selection_strategy"], seed)
+                     for job, seed in zip(jobs, spawn_seeds(ROOT_SEED, len(jobs)))]
+    pending = len(store.missing(sweep_configs))
+    print(f"Running {pending} of {len(jobs)} ES configurations in parallel "
+          f"({len(jobs) - pending} already in {store.path})...")
+    results = []
+    # Plots render in the background while the remaining runs are optimizing
+    with PlotRenderQueue() as render_queue:
+        completed_runs = run_grid(
+            run_grid_job, jobs, root_seed=ROOT_SEED,
+            skip=lambda job: run_config(job["selection_strategy"], job["random_seed"]) in store
+        )
+        for job, result in completed_runs:
+            print(f"Finished ES with {job['selection_strategy']} and seed {result['Random Seed']} (Run {job['run_label']})")
+            store.put(
+                run_config(job["selection_strategy"], job["random_seed"]),
+                best_fitness=result["Best Fitness"],
+                elapsed_time=result["Elapsed Time (s)"],
+                history=result["Convergence History"],
+                best_solution=result["Best Solution"],
+                stats={key: result[key] for key in ("Run Label", "Generations", "Stop Reason", "Evaluations")},
             )
-            results.append({
-                "Run Label": run_label,
-                "Selection Strategy": selection_strategy,
-                "Random Seed": random_seed,
-                "Elapsed Time (s)": elapsed_time,
-                "Best Solution": best_found.genotype if best_found else None,
-                "Distance to Origin": np.linalg.norm(best_found.genotype) if best_found else None,
-                "Convergence Plot": convergence_plot_path,
-                "Landscape Plot": landscape_plot_path
-            })
+            convergence_plot_path, landscape_plot_path = save_run_plots(
+                result["Run Label"], result["Selection Strategy"], job["random_seed"],
+                result.pop("Convergence History"), result["Best Solution"], render_queue=render_queue
+            )
+            result["Convergence Plot"] = convergence_plot_path
+            result["Landscape Plot"] = landscape_plot_path
+            results.append(result)
+        failed_renders = render_queue.flush().count(None)
+    if failed_renders:
+        print(f"Warning: {failed_renders} plot(s) failed to render; see the log file.")
 
     print("\n--- Grid Search Results ---")
-    for result in results:
-        print(result)
\ No newline at end of file
+    for result in sorted(results, key=lambda result: result["Run Label"]):
+        print(result)
+
+    # Aggregate over the whole sweep, including runs stored by earlier executions
+    print("\n--- Sweep Summary (from the result store) ---")
+    print(format_report(store.aggregate(group_by=("selection_type",), configs=sweep_configs)))
+    store.close()
@@ -0,0 +1,21 @@
+import numpy as np
+
+from es_optimiser.evolution_strategy import EvolutionStrategy
+
+HIMMELBLAU_MINIMA = np.array([[3.0, 2.0], [-2.805118, 3.131312], [-3.779310, -3.283186], [3.584428, -1.848126]])
+
+
+def himmelblau(x):
+    return float((x[0]**2 + x[1] - 11)**2 + (x[0] + x[1]**2 - 7)**2)
+
+
+def test_get_optima_returns_exactly_the_himmelblau_minima():
+    for selection_type in ('(mu, lambda)', '(mu + lambda)'):
+        es = EvolutionStrategy(himmelblau, 2, (-5, 5), mu=20, lambda_=140, max_generations=200, sigma=0.3,
+                               selection_type=selection_type, seed=0, niche_radius=1.0, verbose=False)
+        es.run()
+        optima = np.array([optimum.genotype for optimum in es.get_optima()])
+        assert len(optima) == 4
+        distances = np.linalg.norm(optima[:, np.newaxis] - HIMMELBLAU_MINIMA[np.newaxis], axis=2)
+        assert np.all(distances.min(axis=0) < 0.05)
+        assert np.all(distances.min(axis=1) < 0.05)
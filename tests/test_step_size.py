@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from es_optimiser.evolution_strategy import EvolutionStrategy
+from es_optimiser.stopping import StoppingCriteria
+from es_optimiser.surrogate import SurrogateScreen
+
+
+def sphere(x):
+    return float(np.sum(x**2))
+
+
+@pytest.mark.parametrize("model", ["knn", "rbf"])
+def test_one_fifth_with_surrogate_converges_under_comma_selection(model):
+    es = EvolutionStrategy(sphere, 10, (-5.12, 5.12), mu=10, lambda_=70, max_generations=3000, sigma=1.0,
+                           selection_type='(mu, lambda)', seed=0, step_size_control='one_fifth',
+                           surrogate=SurrogateScreen(model),
+                           stopping_criteria=StoppingCriteria(target_fitness=1e-6, max_evaluations=30000),
+                           verbose=False)
+    es.run()
+    assert es.stop_reason == 'target_fitness'
+    assert es.best_individual_overall.fitness <= 1e-6
+    assert es.surrogate.stats()['saved_evaluations'] > 0